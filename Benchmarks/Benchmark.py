@@ -0,0 +1,263 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from Benchmarks.SiteGenerator import SiteGenerator
+from Constants.Constants import Strings
+from Exceptions.WrongFormatException import WrongFormatException
+from Tools.ConfigManager import ConfigManager
+from Tools.DirectoryLoader import DirectoryLoader
+from Tools.Document.ArticleElements.Link import Link
+from Tools.SitemapGenerator import SitemapGenerator
+from Tools.Tools import Tools
+
+
+class Benchmark:
+    """
+    Measures the headless code paths of the editor on a synthetic whitebear website. Every measured step is run
+    several times and the results are collected into a dictionary that can be dumped as json and compared between
+    releases. Run from the editor directory as: python -m Benchmarks.Benchmark --help
+    """
+
+    def __init__(self, directory: str, articles: int, menus: int, images: int, paragraphs: int, links: int,
+                 repeats: int):
+        """
+        Constructor for the benchmark.
+        :param directory: Temporary directory, the website and the editor configuration are created in it.
+        :param articles: Number of article pages.
+        :param menus: Number of menu pages.
+        :param images: Number of distinct images on the website.
+        :param paragraphs: Number of text paragraphs in every article.
+        :param links: Number of links added to one article for the link lookup benchmark.
+        :param repeats: How many times each step is measured.
+        """
+        self._work_dir = os.path.join(directory, 'web')
+        self._scratch_dir = os.path.join(directory, 'scratch')
+        self._repeats = max(repeats, 1)
+        self._links = links
+        self._parameters = {'articles': articles, 'menus': menus, 'images': images, 'paragraphs': paragraphs,
+                            'links': links, 'repeats': self._repeats}
+        self._generator = SiteGenerator(self._work_dir, articles, menus, images, paragraphs)
+        self._loader = None
+        self._link_article = None
+        self._link_ids: List[str] = []
+        self._results: Dict[str, Dict[str, object]] = {}
+
+    def run(self) -> Dict[str, object]:
+        """
+        Run all benchmarks.
+        :return: Dictionary with the environment, benchmark parameters and measured results.
+        """
+        self._measure('generate', self._generator.generate, repeats=1)
+        self._configure()
+        self._measure('load_directory', self._load_directory)
+        self._results['max_rss_kib_after_load'] = {'value': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+        self._measure('test_self', self._test_self)
+        self._measure('sort_by_date', self._sort_by_date)
+        self._measure('convert_to_html', self._convert_to_html)
+        self._measure('minified_round_trip', self._check_minified_round_trip, repeats=1)
+        self._measure('create_sitemap', self._create_sitemap)
+        self._measure('optimize_image', self._optimize_images, setup=self._prepare_images)
+        self._prepare_links()
+        self._measure('find_link', self._find_links)
+        return {'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'parameters': self._parameters,
+                'results': self._results}
+
+    def _measure(self, name: str, function: Callable[[], None], setup: Callable[[], None] = None,
+                 repeats: int = 0) -> None:
+        """
+        Measure the wall clock time of a function and store the result.
+        :param name: Name of the benchmark in the results.
+        :param function: The measured function.
+        :param setup: Optional function run before every measurement which is not included in the time.
+        :param repeats: How many times to run the function, 0 uses the benchmark setting.
+        :return: None
+        """
+        runs: List[float] = []
+        for _ in range(repeats if repeats else self._repeats):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            function()
+            runs.append(time.perf_counter() - start)
+        self._results[name] = {'runs': runs, 'min': min(runs), 'mean': sum(runs) / len(runs)}
+
+    def _configure(self) -> None:
+        """
+        Set up the editor configuration for the generated website. Online url test is disabled so that the results do
+        not depend on the network.
+        :return: None
+        """
+        config_manager: ConfigManager = ConfigManager.get_instance()
+        config_manager.add_directory(self._work_dir)
+        config_manager.set_active_dir(self._work_dir)
+        config_manager.store_global_title(Strings.page_name)
+        config_manager.store_author(Strings.author)
+        config_manager.store_contact('kontakt@example.com')
+        config_manager.store_global_keywords(', '.join(SiteGenerator.words[:12]))
+        config_manager.store_main_page_description(' '.join(SiteGenerator.words[:10]))
+        config_manager.store_script('console.log("whitebear");')
+        config_manager.store_black_text(' '.join(SiteGenerator.words[10:20]))
+        config_manager.store_red_text(' '.join(SiteGenerator.words[20:30]))
+        config_manager.store_url('https://example.com')
+        config_manager.store_online_test(False)
+
+    def _load_directory(self) -> None:
+        """
+        Load and parse the whole website.
+        :return: None
+        """
+        self._loader = DirectoryLoader()
+        self._loader.load_directory(self._work_dir)
+
+    def _test_self(self) -> None:
+        """
+        Run the SEO test of all documents.
+        :return: None
+        """
+        for article in self._loader.get_articles().values():
+            article.test_self()
+        for menu in self._loader.get_menus().values():
+            menu.test_self()
+        self._loader.get_index_page().test_self()
+
+    def _sort_by_date(self) -> None:
+        """
+        Sort all articles by their date the way the index orders its news.
+        :return: None
+        """
+        sorted(self._loader.get_articles().values(), key=lambda x: x.get_computable_date(), reverse=True)
+
+    def _convert_to_html(self) -> None:
+        """
+        Convert all documents to html.
+        :return: None
+        """
+        for article in self._loader.get_articles().values():
+            article.convert_to_html()
+        for menu in self._loader.get_menus().values():
+            menu.convert_to_html()
+        self._loader.get_index_page().convert_to_html()
+
+    def _documents(self) -> List:
+        """
+        Return all loaded articles, menus and the index.
+        :return: List of all loaded documents.
+        """
+        return list(self._loader.get_articles().values()) + list(self._loader.get_menus().values()) + \
+            [self._loader.get_index_page()]
+
+    def _check_minified_round_trip(self) -> None:
+        """
+        Save the whole website minified, load it again and convert it again without minification. The editor must read
+        the minified pages back into the same documents, so the conversions without minification before and after the
+        round trip have to produce exactly the same pages.
+        :return: None
+        :raises WrongFormatException: if a page differs after the round trip.
+        """
+        config_manager: ConfigManager = ConfigManager.get_instance()
+        self._convert_to_html()
+        expected = {document.get_filename(): document.get_html_to_save() for document in self._documents()}
+        config_manager.store_minify(True)
+        try:
+            self._convert_to_html()
+            for document in self._documents():
+                with open(document.get_path(), 'w', encoding='utf-8') as file:
+                    file.write(document.get_html_to_save())
+        finally:
+            config_manager.store_minify(False)
+        self._load_directory()
+        self._convert_to_html()
+        different = sorted(document.get_filename() for document in self._documents()
+                           if expected.get(document.get_filename()) != document.get_html_to_save())
+        if different:
+            raise WrongFormatException(f'Minified pages are not read back the same: {", ".join(different)}')
+
+    def _create_sitemap(self) -> None:
+        """
+        Write the sitemap of the whole website.
+        :return: None
+        """
+        pages = {name: 0 for name in self._loader.get_menus().keys()}
+        pages.update({name: article.get_computable_date() for name, article in self._loader.get_articles().items()})
+        pages['index.html'] = 0
+        SitemapGenerator(pages, self._work_dir).create_sitemap()
+
+    def _prepare_images(self) -> None:
+        """
+        Copy fresh original images into a scratch directory so that every run optimizes the same files.
+        :return: None
+        """
+        shutil.rmtree(self._scratch_dir, ignore_errors=True)
+        shutil.copytree(os.path.join(self._work_dir, Strings.folder_images, Strings.folder_originals),
+                        self._scratch_dir)
+
+    def _optimize_images(self) -> None:
+        """
+        Optimize all images in the scratch directory.
+        :return: None
+        """
+        for image in glob.glob(os.path.join(self._scratch_dir, '*' + Strings.extension_jpg)):
+            Tools.optimize_image(image)
+
+    def _prepare_links(self) -> None:
+        """
+        Add many links to one article the way the text area adds them when the user inserts links.
+        :return: None
+        """
+        self._link_article = next(iter(self._loader.get_articles().values()))
+        for number in range(self._links):
+            text = f'{SiteGenerator.words[number % len(SiteGenerator.words)]} {number}'
+            self._link_article.add_link(Link(text, 'index.html', text, self._loader.get_articles(), self._work_dir))
+        self._link_ids = [link.get_id() for link in self._link_article.get_links()]
+
+    def _find_links(self) -> None:
+        """
+        Look up every link of the article by its id, the text area does this for every link it displays.
+        :return: None
+        """
+        for link_id in self._link_ids:
+            self._link_article.find_link(link_id)
+
+
+def main() -> None:
+    """
+    Parse arguments, run the benchmark in a temporary directory and print or save the json results.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description='Whitebear editor performance benchmark.')
+    parser.add_argument('--articles', type=int, default=100, help='number of generated articles')
+    parser.add_argument('--menus', type=int, default=5, help='number of generated menus')
+    parser.add_argument('--images', type=int, default=20, help='number of distinct generated images')
+    parser.add_argument('--paragraphs', type=int, default=8, help='number of paragraphs in every article')
+    parser.add_argument('--links', type=int, default=1000, help='number of links in the link lookup benchmark')
+    parser.add_argument('--repeats', type=int, default=3, help='how many times each step is measured')
+    parser.add_argument('--output', help='json output file, results are printed if not set')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Do not touch the real editor configuration in the user's home.
+        Strings.editor_config_file = os.path.join(directory, 'whitebearEditor.yml')
+        results = Benchmark(directory, args.articles, args.menus, args.images, args.paragraphs, args.links,
+                            args.repeats).run()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,370 @@
+import os
+import random
+from typing import List, Tuple
+
+from PIL import Image
+from bs4 import BeautifulSoup, Tag
+
+from Constants.Constants import Numbers
+from Constants.Constants import Strings
+from Exceptions.UnrecognizedFileException import UnrecognizedFileException
+from Resources.Fetch import Fetch
+from Tools.Tools import Tools
+
+
+class SiteGenerator:
+    """
+    Generates a synthetic whitebear web root of configurable size. The pages are filled from the bundled templates the
+    same way the documents convert themselves to html and every page is validated against its xml schema, so the
+    generated directory can be loaded by the DirectoryLoader like a real website.
+    """
+    words: List[str] = ['medvěd', 'lední', 'sníh', 'zima', 'les', 'řeka', 'pták', 'hnízdo', 'krajina', 'výlet', 'hora',
+                        'údolí', 'strom', 'jezero', 'cesta', 'kámen', 'mraky', 'slunce', 'vítr', 'tráva', 'příroda',
+                        'fotografie', 'podzim', 'jaro', 'léto', 'večer', 'ráno', 'voda', 'louka', 'pole']
+    months: List[str] = Strings.cz_months.split('|')
+    colors: List[Tuple[str, str]] = [('red', '#d50000'), ('green', '#1b5e20'), ('orange', '#e65100')]
+
+    def __init__(self, directory: str, articles: int, menus: int, images: int, paragraphs: int, seed: int = 0):
+        """
+        Constructor for the site generator.
+        :param directory: Empty or not existing directory where the web root is created.
+        :param articles: Number of article pages.
+        :param menus: Number of menu pages, the articles are spread evenly among them.
+        :param images: Number of distinct images shared by all articles.
+        :param paragraphs: Number of text paragraphs in every article.
+        :param seed: Seed of the random generator, the same seed creates the same website.
+        """
+        self._directory = directory
+        self._article_count = max(articles, 1)
+        self._menu_count = max(menus, 1)
+        self._image_count = max(images, 1)
+        self._paragraph_count = max(paragraphs, 1)
+        self._random = random.Random(seed)
+        self._menu_names: List[str] = [f'Sekce {number + 1}' for number in range(self._menu_count)]
+        self._article_names: List[str] = [f'Článek {number + 1}' for number in range(self._article_count)]
+
+    def generate(self) -> None:
+        """
+        Create the whole website on disk.
+        :return: None
+        :raise UnrecognizedFileException if a generated page is not valid.
+        :raise OSError if the files can not be written.
+        """
+        for folder in (Strings.folder_originals, Strings.folder_thumbnails, Strings.folder_logos):
+            os.makedirs(os.path.join(self._directory, Strings.folder_images, folder), exist_ok=True)
+        self._write_css()
+        self._write_images()
+        for menu in range(self._menu_count):
+            self._write_page(self._menu_file(menu), self._create_menu(menu), 'schema_menu.xsd')
+        for article in range(self._article_count):
+            self._write_page(self._article_file(article), self._create_article(article), 'schema_article.xsd')
+        self._write_page('index.html', self._create_index(), 'schema_index.xsd')
+
+    @staticmethod
+    def _menu_file(number: int) -> str:
+        """
+        Return the file name of a menu page.
+        :param number: Number of the menu.
+        :return: File name of the menu page.
+        """
+        return f'sekce-{number + 1}{Strings.extension_html}'
+
+    @staticmethod
+    def _article_file(number: int) -> str:
+        """
+        Return the file name of an article page.
+        :param number: Number of the article.
+        :return: File name of the article page.
+        """
+        return f'clanek-{number + 1}{Strings.extension_html}'
+
+    def _image_paths(self, number: int) -> Tuple[str, str, str]:
+        """
+        Return the relative paths of an image from the shared image pool.
+        :param number: Any number, it is wrapped around the size of the pool.
+        :return: Tuple of the original image, thumbnail and menu logo paths relative to the web root.
+        """
+        name = f'obrazek-{number % self._image_count + 1}'
+        return (os.path.join(Strings.folder_images, Strings.folder_originals, name + Strings.extension_jpg),
+                os.path.join(Strings.folder_images, Strings.folder_thumbnails, name + Strings.extension_jpg),
+                os.path.join(Strings.folder_images, Strings.folder_logos, name + Strings.extension_png))
+
+    def _date(self, number: int) -> str:
+        """
+        Return a whitebear article date. Later articles get newer dates.
+        :param number: Number of the article.
+        :return: Date in the czech format used by articles.
+        """
+        day = number % 28 + 1
+        month = self.months[(number // 28) % 12]
+        year = Numbers.year_min + 10 + number // (28 * 12)
+        return f'{day}. {month} {year}'
+
+    def _sentence(self, length: int) -> str:
+        """
+        Return a random sentence made of known words.
+        :param length: Number of words in the sentence.
+        :return: The sentence.
+        """
+        sentence = ' '.join(self._random.choice(self.words) for _ in range(length))
+        return sentence[0].upper() + sentence[1:] + '.'
+
+    def _keywords(self) -> str:
+        """
+        Return meta keywords long enough to pass the SEO test.
+        :return: Comma separated keywords.
+        """
+        return ', '.join(self._random.sample(self.words, 12))
+
+    def _description(self) -> str:
+        """
+        Return a meta description long enough to pass the SEO test.
+        :return: The description.
+        """
+        return self._sentence(10)[:Numbers.description_max_length]
+
+    def _write_css(self) -> None:
+        """
+        Write the styles.css file with text color definitions recognized by the editor.
+        :return: None
+        """
+        rules = [f'.{name} {{color: {value}; display: inline;}}' for name, value in self.colors]
+        with open(os.path.join(self._directory, 'styles.css'), 'w', encoding='utf-8') as css:
+            css.write('body {margin: 0;}\n' + '\n'.join(rules) + '\n')
+
+    def _write_images(self) -> None:
+        """
+        Create the shared pool of original images, article thumbnails and menu logos, and the contact image.
+        :return: None
+        """
+        for number in range(self._image_count):
+            original, thumbnail, logo = self._image_paths(number)
+            # Noise does not compress well which makes the images behave like photographs.
+            image = Image.effect_noise((1024, 768), 64).convert('RGB')
+            image.save(os.path.join(self._directory, original), quality=95)
+            image.resize((Numbers.main_image_width, Numbers.main_image_height)).save(
+                os.path.join(self._directory, thumbnail), quality=95)
+            image.resize((Numbers.menu_logo_image_size, Numbers.menu_logo_image_size)).save(
+                os.path.join(self._directory, logo))
+        Image.new('RGB', (200, 20), 'white').save(
+            os.path.join(self._directory, Strings.folder_images, Strings.contact_file))
+
+    def _write_page(self, file_name: str, parsed_template: BeautifulSoup, schema: str) -> None:
+        """
+        Validate a filled template and write it into the web root.
+        :param file_name: File name of the page.
+        :param parsed_template: The filled template.
+        :param schema: Name of the xml schema the page has to be valid against.
+        :return: None
+        :raise UnrecognizedFileException if the page is not valid.
+        """
+        output = str(parsed_template)
+        is_valid, errors = Tools.validate(output, schema)
+        if not is_valid:
+            raise UnrecognizedFileException(f'{Strings.exception_bug}\n{file_name}\n{errors}')
+        with open(os.path.join(self._directory, file_name), 'w', encoding='utf-8') as page:
+            page.write(output)
+
+    def _load_template(self, template_name: str, page_name: str, active: str) -> BeautifulSoup:
+        """
+        Load a template and fill in the parts common to all pages.
+        :param template_name: File name of the template.
+        :param page_name: Name of the page shown in the main heading.
+        :param active: File name of the active menu page.
+        :return: The parsed and partially filled template.
+        """
+        with open(Fetch.get_resource_path(template_name), 'r', encoding='utf-8') as template:
+            parsed_template = BeautifulSoup(template.read(), 'html5lib')
+
+        parsed_template.find(name='meta', attrs={'name': 'description'})['content'] = self._description()
+        parsed_template.find(name='meta', attrs={'name': 'keywords'})['content'] = self._keywords()
+        parsed_template.find(name='meta', attrs={'name': 'author'})['content'] = Strings.author
+        parsed_template.find(name='script').string = ''
+        parsed_template.find(name='header').figure.figcaption.string = Strings.page_name
+        parsed_template.find(name='h1', attrs={'id': 'heading'}).string = Strings.page_name
+
+        menu_container = parsed_template.find(name='nav')
+        for number in sorted(range(self._menu_count), key=lambda x: self._menu_names[x], reverse=True):
+            new_item = parsed_template.new_tag('a', attrs={'class': 'menu', 'href': self._menu_file(number),
+                                                           'title': self._menu_names[number]})
+            new_item.string = self._menu_names[number]
+            if self._menu_file(number) == active:
+                new_item['id'] = 'active'
+            menu_container.append(new_item)
+        parsed_template.find(name='article').h2.string = page_name
+        return parsed_template
+
+    def _create_menu(self, number: int) -> BeautifulSoup:
+        """
+        Create a menu page that links to every n-th article.
+        :param number: Number of the menu.
+        :return: The filled menu template.
+        """
+        name = self._menu_names[number]
+        parsed_template = self._load_template('menu_template.html', name, self._menu_file(number))
+        parsed_template.find(name='title').string = f'{Strings.menu_title_stump} {name} | {Strings.page_name}'
+
+        menu_container = parsed_template.find(name='nav', attrs={'class': 'sixItems'})
+        for article in range(number, self._article_count, self._menu_count):
+            article_name = self._article_names[article]
+            new_div = parsed_template.new_tag('div', attrs={'class': 'link'})
+            new_a = parsed_template.new_tag('a', attrs={'href': self._article_file(article),
+                                                        'title': f'{article_name} v sekci {name}'})
+            new_img = parsed_template.new_tag('img', attrs={'width': Numbers.menu_logo_image_size,
+                                                            'height': Numbers.menu_logo_image_size,
+                                                            'src': self._image_paths(article)[2],
+                                                            'alt': f'Logo {article_name}'})
+            new_p = parsed_template.new_tag('p')
+            new_p.string = article_name
+            new_a.append(new_img)
+            new_div.append(new_a)
+            new_div.append(new_p)
+            menu_container.append(new_div)
+        return parsed_template
+
+    def _create_figure(self, parsed_template: BeautifulSoup, figure: Tag, number: int, aside: bool) -> None:
+        """
+        Fill a figure with an image from the shared image pool.
+        :param parsed_template: The template for creating new tags.
+        :param figure: The figure element to fill.
+        :param number: Number of the image.
+        :param aside: True for an aside image, False for the main article image which is already in the template.
+        :return: None
+        """
+        original, thumbnail, _ = self._image_paths(number)
+        if aside:
+            new_a = parsed_template.new_tag('a', attrs={'href': original, 'target': Strings.blank,
+                                                        'title': f'Fotografie číslo {number}'})
+            new_a.append(parsed_template.new_tag('img', attrs={'src': thumbnail, 'alt': f'Obrázek {number}',
+                                                               'width': Numbers.aside_thumbnail_width,
+                                                               'height': Numbers.aside_thumbnail_height,
+                                                               'class': 'imgAside'}))
+            new_figcaption = parsed_template.new_tag('figcaption', attrs={'class': 'photoCaption'})
+            figure.append(new_a)
+            figure.append(new_figcaption)
+        else:
+            figure.a['href'] = original
+            figure.a['title'] = f'Fotografie číslo {number}'
+            figure.img['src'] = thumbnail
+            figure.img['alt'] = f'Obrázek {number}'
+        figure.figcaption.string = f'Popisek obrázku {number}'
+
+    def _create_paragraph(self, parsed_template: BeautifulSoup, container: Tag, number: int) -> None:
+        """
+        Fill a paragraph or a list item with plain, bold, colored and linked text.
+        :param parsed_template: The template for creating new tags.
+        :param container: The p or li element to fill.
+        :param number: Number of the article the paragraph belongs to.
+        :return: None
+        """
+        container.append(self._sentence(15) + ' ')
+        new_strong = parsed_template.new_tag('strong')
+        new_strong.string = self._sentence(4)
+        container.append(new_strong)
+        container.append(' ' + self._sentence(10) + ' ')
+        new_span = parsed_template.new_tag('span', attrs={'class': self._random.choice(self.colors)[0]})
+        new_span.string = self._sentence(3)
+        container.append(new_span)
+        container.append(parsed_template.new_tag('br'))
+        target = self._random.randrange(self._article_count)
+        if target != number:
+            new_a = parsed_template.new_tag('a', attrs={'href': self._article_file(target),
+                                                        'title': self._article_names[target],
+                                                        'target': Strings.blank})
+            new_a.string = self._article_names[target]
+            container.append(new_a)
+        container.append(' ' + self._sentence(8))
+
+    def _create_article(self, number: int) -> BeautifulSoup:
+        """
+        Create an article page with text, headings, a list, an in text image and aside images.
+        :param number: Number of the article.
+        :return: The filled article template.
+        """
+        name = self._article_names[number]
+        menu = self._menu_file(number % self._menu_count)
+        parsed_template = self._load_template('article_template.html', name, menu)
+        parsed_template.find(name='title').string = \
+            f'{name} - {self._menu_names[number % self._menu_count]} | {Strings.page_name}'
+        parsed_template.find(name='p', attrs={'id': 'date'}).string = self._date(number)
+        self._create_figure(parsed_template, parsed_template.find(name='figure', attrs={'id': 'articleImg'}), number,
+                            False)
+
+        text_section = parsed_template.find(name='section', attrs='mainText')
+        for paragraph in range(self._paragraph_count):
+            if paragraph % 4 == 0:
+                new_h = parsed_template.new_tag('h3' if paragraph % 8 == 0 else 'h4')
+                new_h.string = self._sentence(3)
+                text_section.append(new_h)
+            new_p = parsed_template.new_tag('p')
+            self._create_paragraph(parsed_template, new_p, number)
+            text_section.append(new_p)
+            if paragraph == self._paragraph_count // 2:
+                original, thumbnail, _ = self._image_paths(number + 1)
+                new_div = parsed_template.new_tag('div', attrs={'class': 'center'})
+                new_a = parsed_template.new_tag('a', attrs={'href': original, 'target': Strings.blank,
+                                                            'title': f'Fotografie číslo {number + 1}'})
+                new_a.append(parsed_template.new_tag('img', attrs={'src': thumbnail,
+                                                                   'alt': f'Obrázek {number + 1}',
+                                                                   'width': Numbers.main_image_width,
+                                                                   'height': Numbers.main_image_height}))
+                new_div.append(new_a)
+                text_section.append(new_div)
+        new_ul = parsed_template.new_tag('ul')
+        for _ in range(3):
+            new_li = parsed_template.new_tag('li')
+            self._create_paragraph(parsed_template, new_li, number)
+            new_ul.append(new_li)
+        text_section.append(new_ul)
+
+        aside = parsed_template.find(name='aside')
+        for image in range(1, 4):
+            new_figure = parsed_template.new_tag('figure')
+            self._create_figure(parsed_template, new_figure, number + image, True)
+            aside.append(new_figure)
+        return parsed_template
+
+    def _create_index(self) -> BeautifulSoup:
+        """
+        Create the index page with the newest articles.
+        :return: The filled index template.
+        """
+        parsed_template = self._load_template('index_template.html', Strings.home_page, 'index.html')
+        parsed_template.find(name='title').string = f'{Strings.home_page} | {Strings.page_name}'
+        article = parsed_template.find(name='article', attrs={'class': 'indexPage'})
+
+        new_black_p = parsed_template.new_tag('p')
+        new_black_p.string = self._sentence(20)
+        new_red_p = parsed_template.new_tag('p')
+        new_strong = parsed_template.new_tag('strong', attrs={'class': 'red'})
+        new_strong.string = self._sentence(10)
+        new_red_p.append(new_strong)
+        article.h2.insert_after(new_red_p)
+        article.h2.insert_after(new_black_p)
+
+        new_ul = parsed_template.new_tag('ul')
+        for number in reversed(range(max(self._article_count - Numbers.default_news, 0), self._article_count)):
+            new_li = parsed_template.new_tag('li')
+            new_li.string = self._date(number) + ' '
+            new_a = parsed_template.new_tag('a', attrs={'href': self._article_file(number),
+                                                        'title': self._article_names[number]})
+            new_a.string = self._article_names[number]
+            new_li.append(new_a)
+            new_ul.append(new_li)
+        parsed_template.find(name='h3', attrs={'id': 'news'}).insert_after(new_ul)
+
+        new_img = parsed_template.new_tag('img', attrs={'width': 200, 'height': 20,
+                                                        'src': os.path.join(Strings.folder_images,
+                                                                            Strings.contact_file),
+                                                        'alt': Strings.contact_default_alt})
+        parsed_template.find(name='h3', attrs={'id': 'contact'}).insert_after(new_img)
+        new_p = parsed_template.new_tag('p')
+        new_p.string = f'Web design: {Strings.author}'
+        new_img.insert_after(new_p)
+
+        aside = parsed_template.find(name='aside')
+        for number in range(min(self._article_count, Numbers.max_index_images)):
+            new_figure = parsed_template.new_tag('figure')
+            self._create_figure(parsed_template, new_figure, number, True)
+            aside.append(new_figure)
+        return parsed_template
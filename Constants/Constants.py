@@ -1,38 +1,20 @@
 import os.path
+from enum import Enum
 
-import wx.lib.newevent
-from wx import Colour
 
-
-class Events:
-    TextChangedEvent, EVT_DOCUMENT_TEXT_CHANGED = wx.lib.newevent.NewCommandEvent()
-    SidepanelChangedEvent, EVT_DOCUMENT_IMAGES_CHANGED = wx.lib.newevent.NewCommandEvent()
-    SpellcheckEvent, EVT_SPELLCHECK_DONE = wx.lib.newevent.NewCommandEvent()
-    RecolorAllEvent, EVT_RECOLOR_ALL = wx.lib.newevent.NewCommandEvent()
+class Status(Enum):
+    """
+    Result of the SEO test of a document or of an element inside a document. The GUI translates these into colors.
+    """
+    # Nothing to display, used for elements which passed the test.
+    NONE = 0
+    OK = 1
+    # The document passed the test but is modified or not uploaded.
+    CHANGED = 2
+    ERROR = 3
 
 
 class Numbers:
-    ID_MENU_LOGO = wx.NewId()
-    ID_MAIN_IMAGE = wx.NewId()
-    ID_SIDE_IMAGE = wx.NewId()
-    ID_SPELLCHECK_TEST = wx.NewId()
-    ID_IMAGE_LINK = wx.NewId()
-    ID_IMAGE_ALT = wx.NewId()
-    ID_NEW_DIR = wx.NewId()
-    ID_UPLOAD = wx.NewId()
-    ID_EXPORT_ALL = wx.NewId()
-    ID_EDIT_ROBOTS = wx.NewId()
-    ID_EDIT_CSS = wx.NewId()
-    ID_EDIT_MENU = wx.NewId()
-    ID_NONE_ITEM = wx.NewId()
-
-    RED_COLOR = Colour(242, 207, 206)
-    GREEN_COLOR = Colour(201, 255, 199)
-    DARK_GREEN_COLOR = Colour(21, 112, 49)
-    YELLOW_COLOR = Colour(250, 255, 196)
-    BLUE_COLOR = Colour(145, 207, 255)
-    LIGHT_GREY_COLOR = Colour(235, 235, 235)
-
     blank_character = '\u2800'
     private_key_permissions: oct = 0o600
     connection_timeout: int = 5
@@ -43,6 +25,13 @@ class Numbers:
     three_click_timeout: int = 600
     spellcheck_timeout: int = 3000
     test_timeout: int = 200
+    seo_test_timeout: int = 150
+    watcher_timeout: int = 1000
+    hash_chunk_size: int = 1024 * 1024
+    # Seconds between batches of loaded articles passed into the file list.
+    file_list_batch_interval: float = 0.2
+    gzip_level: int = 9
+    brotli_quality: int = 11
     photo_ratio: float = 4 / 3
     photo_ratio_tolerance: float = 0.01
 
@@ -52,6 +41,9 @@ class Numbers:
     threshold_default: int = 159
     logo_input_size_limit: int = 250
     image_quality: int = 95
+    variant_image_quality: int = 80
+    # Heading 3 point size in pixels.
+    contact_font_size: int = 21
     min_keywords: int = 3
     minimal_window_size_width: int = 1200
     minimal_window_size_height: int = 700
@@ -115,6 +107,8 @@ class Numbers:
     main_image_width: int = 300
     main_image_height: int = 225
     text_image_max_size: int = 534
+    # Extra widths of thumbnails for small screens and high density displays, relative to the thumbnail width.
+    srcset_scales: tuple = (0.5, 1.5, 2)
     keywords_min_length: int = 50
     keywords_max_length: int = 255
     description_min_length: int = 50
@@ -141,6 +135,8 @@ class Numbers:
     max_news: int = 30
     default_news: int = 3
     max_index_images: int = 4
+    sitemap_max_urls: int = 50000
+    profile_report_imports: int = 30
     default_max_length: int = 256
 
 
@@ -157,10 +153,19 @@ class Strings:
     author: str = 'Whitebear'
     extension_jpg: str = '.jpg'
     extension_png: str = '.png'
+    extension_webp: str = '.webp'
+    extension_avif: str = '.avif'
+    # Pillow format, file extension and mime type of image variants, the best compressed first.
+    image_variants: tuple = (('AVIF', extension_avif, 'image/avif'), ('WEBP', extension_webp, 'image/webp'))
     extension_html: str = '.html'
+    extension_gzip: str = '.gz'
+    extension_brotli: str = '.br'
+    # Text files that are uploaded with compressed copies.
+    compressed_extensions: tuple = (extension_html, '.css', '.xml', '.txt')
     extension_dict: str = '.dic'
     extension_excl: str = '.exc'
     contact_file: str = 'contact.png'
+    contact_font: str = 'DejaVuSans.ttf'
     contact_default_alt: str = 'kontakt'
     home_page: str = 'Hlavní strana'
     image_extensions: str = f'JPG and PNG files (*{extension_jpg};*{extension_png})|*.[jJ][pP][gG];*.[pP][nN][gG]|' \
@@ -171,6 +176,10 @@ class Strings:
     home_directory: str = os.path.expanduser('~')
     editor_config_file: str = os.path.join(home_directory, '.config', 'whitebearEditor.yml')
     editor_output_debug_file: str = os.path.join(home_directory, 'whitebearEditor.log')
+    instrumentation_file: str = os.path.join(home_directory, 'whitebearEditor-stats.json')
+    profile_startup_argument: str = '--profile-startup'
+    label_profile_phases: str = 'Startup phases (time since start):'
+    label_profile_imports: str = 'Slowest imports (cumulative, self):'
     editor_name: str = 'Whitebear editor'
     page_name: str = 'white-bear'
     url_stub: str = 'https://www.'
@@ -186,12 +195,29 @@ class Strings:
     file: str = 'File'
     robots_file: str = 'robots.txt'
     css_file: str = 'styles.css'
+    css_minified_file: str = 'styles.min.css'
     file_background: str = 'background.jpg'
     file_header: str = 'logo-nadpis.png'
     test_url: str = 'http://www.example.com'
 
+    # Video poster images that load the player on click.
+    video_poster_url: str = 'https://img.youtube.com/vi/{}/hqdefault.jpg'
+    video_poster_file: str = 'video-{}.jpg'
+    video_facade_class: str = 'video'
+    loading_lazy: str = 'lazy'
+    # Replaces a clicked poster link with the player, without javascript the link opens the player in a new tab.
+    video_facade_script: str = "document.addEventListener('click', function (event) {" \
+                               "var link = event.target.closest('a.video'); if (!link) {return;} " \
+                               "event.preventDefault(); var url = new URL(link.href); " \
+                               "url.searchParams.set('autoplay', '1'); " \
+                               "var player = document.createElement('iframe'); player.title = link.title; " \
+                               f"player.width = {Numbers.video_width}; player.height = {Numbers.video_height}; " \
+                               "player.allow = 'autoplay; fullscreen'; player.allowFullscreen = true; " \
+                               "player.src = url.href; link.replaceWith(player);});"
+
     # Sitemap settings
     sitemap_file: str = 'sitemap.xml'
+    sitemap_shard_file: str = 'sitemap{}.xml'
     sitemap_keyword: str = 'Sitemap:'
     sitemap_xmlns: str = 'http://www.sitemaps.org/schemas/sitemap/0.9'
     change_frequency: str = 'monthly'
@@ -226,6 +252,7 @@ class Strings:
     exception_sftp_fail: str = 'Transfer failed'
     exception_broken_html: str = 'Corrupted html code'
     exception_reserved_blue: str = 'Blue color reserved for urls detected in CSS'
+    exception_directory_not_configured: str = 'Directory is not set up, open it in the editor first'
 
     seo_error_length: str = 'Required length'
     seo_error_keywords_length: str = f'Length must be: {Numbers.keywords_min_length} -' \
@@ -278,6 +305,7 @@ class Strings:
                                    'Please add custom files.\n' \
                                    'favicon.ico, 404.html, google tracking page...'
     warning_unsaved: str = 'At least one document is not saved or uploaded.\nQuit anyway?'
+    warning_changed_on_disk: str = 'Document was changed by another program.\nReload it and lose unsaved changes?'
     warning_new_dir_unsaved: str = 'At least one document is not saved.\nContinue?'
     warning_file_inaccessible: str = 'Can not access file'
     warning_incorrect_format: str = 'Incorrect format'
@@ -306,6 +334,9 @@ class Strings:
     warning_index: str = 'Index page (Page setup)'
     warning_file_missing: str = 'File not found:'
     warning_optimization_fail: str = 'Image optimization failed:'
+    warning_compression_fail: str = 'File compression failed:'
+    warning_image_variants_fail: str = 'Webp or avif variants of these images could not be created:'
+    warning_minify_fail: str = 'Minified stylesheet could not be created:'
     warning_image_small: str = 'Image too small'
     warning_no_image: str = 'No logo found inside the image'
 
@@ -333,10 +364,18 @@ class Strings:
     label_menu_item_new_dir_hint: str = 'Create a new WhiteBear directory'
     label_menu_item_online_test: str = 'Online url test'
     label_menu_item_online_test_hint: str = 'Test url existence online'
+    label_menu_item_video_facade: str = 'Video poster images'
+    label_menu_item_video_facade_hint: str = 'Save videos as a poster image that loads the player on click'
+    label_menu_item_minify: str = 'Minify output'
+    label_menu_item_minify_hint: str = 'Save pages and upload the stylesheet without unneeded whitespace'
 
     label_menu_help: str = 'Help'
     label_menu_item_about: str = 'About...'
     label_menu_item_about_hint: str = 'About whitebear editor'
+    label_menu_item_statistics: str = 'Collect performance statistics'
+    label_menu_item_statistics_hint: str = 'Measure loading, testing, conversion, spellcheck and upload times'
+    label_menu_item_save_statistics: str = 'Save performance statistics'
+    label_menu_item_save_statistics_hint: str = 'Save collected performance statistics into a json file'
 
     label_menu_edit: str = 'Edit'
     label_menu_item_undo: str = 'Undo\tctrl+y'
@@ -471,6 +510,7 @@ class Strings:
     label_invalid_files: str = 'Invalid files'
     label_ip_port: str = 'IP:port'
     label_optimizer: str = 'Optimizer'
+    label_precompress: str = 'Upload compressed copies of pages, styles, robots and sitemap (gzip, brotli if installed)'
     label_ip_port_tip: str = 'SFTP server IPv4:Port'
     label_sftp: str = 'SFTP - SSH file transfer protocol IPv4 configuration'
     label_user: str = 'User'
@@ -521,6 +561,10 @@ class Strings:
     status_file: str = 'File'
     status_modified: str = 'Modified'
     status_uploaded: str = 'Uploaded'
+    status_reloaded: str = 'Reloaded'
+    status_unchanged: str = 'Unchanged'
+    status_online_test: str = 'Online test'
+    status_image_variants: str = 'Image variants created:'
     status_unuploaded: str = 'Unuploaded'
     status_state: str = 'State'
     status_self_test: str = 'Self test'
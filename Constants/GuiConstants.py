@@ -0,0 +1,39 @@
+import wx.lib.newevent
+from wx import Colour
+
+
+class Events:
+    TextChangedEvent, EVT_DOCUMENT_TEXT_CHANGED = wx.lib.newevent.NewCommandEvent()
+    SidepanelChangedEvent, EVT_DOCUMENT_IMAGES_CHANGED = wx.lib.newevent.NewCommandEvent()
+    SpellcheckEvent, EVT_SPELLCHECK_DONE = wx.lib.newevent.NewCommandEvent()
+    RecolorAllEvent, EVT_RECOLOR_ALL = wx.lib.newevent.NewCommandEvent()
+
+
+class GuiNumbers:
+    """
+    Window ids and colors used by the GUI. Kept apart from Constants so that the document model does not need wx.
+    """
+    ID_MENU_LOGO = wx.NewId()
+    ID_MAIN_IMAGE = wx.NewId()
+    ID_SIDE_IMAGE = wx.NewId()
+    ID_SPELLCHECK_TEST = wx.NewId()
+    ID_VIDEO_FACADE = wx.NewId()
+    ID_MINIFY = wx.NewId()
+    ID_IMAGE_LINK = wx.NewId()
+    ID_IMAGE_ALT = wx.NewId()
+    ID_NEW_DIR = wx.NewId()
+    ID_UPLOAD = wx.NewId()
+    ID_EXPORT_ALL = wx.NewId()
+    ID_EDIT_ROBOTS = wx.NewId()
+    ID_EDIT_CSS = wx.NewId()
+    ID_EDIT_MENU = wx.NewId()
+    ID_STATISTICS = wx.NewId()
+    ID_SAVE_STATISTICS = wx.NewId()
+    ID_NONE_ITEM = wx.NewId()
+
+    RED_COLOR = Colour(242, 207, 206)
+    GREEN_COLOR = Colour(201, 255, 199)
+    DARK_GREEN_COLOR = Colour(21, 112, 49)
+    YELLOW_COLOR = Colour(250, 255, 196)
+    BLUE_COLOR = Colour(145, 207, 255)
+    LIGHT_GREY_COLOR = Colour(235, 235, 235)
@@ -4,8 +4,11 @@ import os
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
+from Gui.WxAdapter import WxAdapter
 from Resources.Fetch import Fetch
 from Tools.ConfigManager import ConfigManager
+from Tools.FileSnapshot import FileSnapshot
 from Tools.Tools import Tools
 
 
@@ -78,7 +81,7 @@ class AddImageDialog(wx.Dialog):
         self._name_sub_sizer.Add(self._label_image_name, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._name_sub_sizer.Add(self._field_image_name, proportion=1)
         self._information_sizer.Add(self._name_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_name_tip = Tools.get_warning_tip(self._field_image_name, Strings.label_image_name)
+        self._field_image_name_tip = WxAdapter.get_warning_tip(self._field_image_name, Strings.label_image_name)
         self._field_image_name_tip.SetMessage('')
 
         # Image type sub sizer
@@ -196,7 +199,7 @@ class AddImageDialog(wx.Dialog):
             if c == '-':
                 wrong_name = False
         if wrong_name:
-            self._field_image_name.SetBackgroundColour(Numbers.RED_COLOR)
+            self._field_image_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
             self._field_image_name_tip.SetMessage(Strings.warning_name_incorrect)
             self._field_image_name_tip.EnableTip(True)
             self._field_image_name_tip.Show(True)
@@ -204,7 +207,7 @@ class AddImageDialog(wx.Dialog):
         else:
             self._field_image_name_tip.SetMessage(Strings.status_ok)
             self._field_image_name_tip.DoHideNow()
-            self._field_image_name.SetBackgroundColour(Numbers.GREEN_COLOR)
+            self._field_image_name.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
 
         # Attempt to save the files
         self._originals_path: str = os.path.join(self._working_directory, Strings.folder_images,
@@ -235,6 +238,13 @@ class AddImageDialog(wx.Dialog):
             if result == wx.NO:
                 return False
         self._full_image.SaveFile(full_file, img_type)
+        # Pages offer other widths of the thumbnail and smaller webp and avif variants to browsers that support them.
+        created = [self._thumbnail_path, full_file]
+        for path in [self._thumbnail_path] + Tools.create_image_widths(self._thumbnail_path):
+            created.append(path)
+            created.extend(Tools.create_image_variants(path))
+        # Pages and tests find the new images in the file snapshot.
+        FileSnapshot.get_instance().update(created)
 
         # Exceptions from here are caught automatically
         return True
@@ -3,9 +3,12 @@ import os
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Exceptions.LogoException import LogoException
+from Gui.WxAdapter import WxAdapter
 from Resources.Fetch import Fetch
 from Tools.ConfigManager import ConfigManager
+from Tools.FileSnapshot import FileSnapshot
 from Tools.Tools import Tools
 
 
@@ -84,7 +87,7 @@ class AddLogoDialog(wx.Dialog):
         self._name_sub_sizer.Add(self._label_image_name, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._name_sub_sizer.Add(self._field_image_name, proportion=1)
         self._information_sizer.Add(self._name_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_name_tip = Tools.get_warning_tip(self._field_image_name, Strings.label_image_name)
+        self._field_image_name_tip = WxAdapter.get_warning_tip(self._field_image_name, Strings.label_image_name)
         self._field_image_name_tip.SetMessage('')
 
         # Controls sub sizers
@@ -216,7 +219,7 @@ class AddLogoDialog(wx.Dialog):
             if c == '-':
                 wrong_name = False
         if wrong_name:
-            self._field_image_name.SetBackgroundColour(Numbers.RED_COLOR)
+            self._field_image_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
             self._field_image_name_tip.SetMessage(Strings.warning_name_incorrect)
             self._field_image_name_tip.EnableTip(True)
             self._field_image_name_tip.Show(True)
@@ -224,7 +227,7 @@ class AddLogoDialog(wx.Dialog):
         else:
             self._field_image_name_tip.SetMessage(Strings.status_ok)
             self._field_image_name_tip.DoHideNow()
-            self._field_image_name.SetBackgroundColour(Numbers.GREEN_COLOR)
+            self._field_image_name.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
 
         # Attempt to save the files
         self._logos_path: str = os.path.join(self._working_directory, Strings.folder_images, Strings.folder_logos)
@@ -236,6 +239,10 @@ class AddLogoDialog(wx.Dialog):
                 return False
         self._menu_image.SaveFile(logo_file + Strings.extension_jpg, wx.BITMAP_TYPE_JPEG)
         self._file_path = logo_file + Strings.extension_jpg
+        # Menus show the smaller webp and avif variants of the logo to browsers that support them.
+        variants = Tools.create_image_variants(self._file_path)
+        # Menus and tests find the new logo in the file snapshot.
+        FileSnapshot.get_instance().update([self._file_path] + variants)
         # Exceptions from here are caught automatically
         return True
 
@@ -285,7 +292,7 @@ class AddLogoDialog(wx.Dialog):
         # Show the image.
         self._logo_bitmap.SetBitmap(wx.Bitmap(self._menu_image))
         if preview_image.GetWidth() > Numbers.main_image_width or preview_image.GetHeight() > Numbers.main_image_height:
-            Tools.inplace_rescale(preview_image, Numbers.main_image_width, Numbers.main_image_height, 0)
+            WxAdapter.inplace_rescale(preview_image, Numbers.main_image_width, Numbers.main_image_height, 0)
         # Place the scaled image into the middle of the final correctly sized image with white background.
         self._inplace_bordered_resize(preview_image, Numbers.main_image_width, Numbers.main_image_height)
         self._preview_bitmap.SetBitmap(wx.Bitmap(preview_image))
@@ -308,7 +315,7 @@ class AddLogoDialog(wx.Dialog):
             if self._original_image_file.GetWidth() > Numbers.logo_input_size_limit or \
                     self._original_image_file.GetHeight() > Numbers.logo_input_size_limit:
                 # Rescale it down to if too large to be handled without lag.
-                Tools.inplace_rescale(self._original_image_file, Numbers.logo_input_size_limit,
+                WxAdapter.inplace_rescale(self._original_image_file, Numbers.logo_input_size_limit,
                                       Numbers.logo_input_size_limit, 0)
             if self._original_image_file.GetWidth() == Numbers.menu_logo_image_size and \
                     self._original_image_file.GetHeight() == Numbers.menu_logo_image_size:
@@ -361,7 +368,7 @@ class AddLogoDialog(wx.Dialog):
         if crop.GetWidth() < Numbers.menu_logo_image_size or crop.GetHeight() < Numbers.menu_logo_image_size:
             raise LogoException(Strings.warning_image_small)
         # Rescale it to fit into the logo size - border and respect aspect ratio.
-        Tools.inplace_rescale(crop, Numbers.menu_logo_image_size, Numbers.menu_logo_image_size, border)
+        WxAdapter.inplace_rescale(crop, Numbers.menu_logo_image_size, Numbers.menu_logo_image_size, border)
         self._inplace_bordered_resize(crop, Numbers.menu_logo_image_size, Numbers.menu_logo_image_size)
         return preview, crop, (crop_size[0], crop_size[1])
 
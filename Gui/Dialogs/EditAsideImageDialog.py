@@ -4,10 +4,12 @@ import os
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.AddImageDialog import AddImageDialog
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Tools.Document.AsideImage import AsideImage
-from Tools.Tools import Tools
+from Tools.FileSnapshot import FileSnapshot
 
 
 class EditAsideImageDialog(SpellCheckedDialog):
@@ -86,27 +88,27 @@ class EditAsideImageDialog(SpellCheckedDialog):
         self._caption_sub_sizer.Add(self._label_image_caption, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._caption_sub_sizer.Add(self._field_image_caption, proportion=1)
         self._information_sizer.Add(self._caption_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_caption_tip = Tools.get_warning_tip(self._field_image_caption,
+        self._field_image_caption_tip = WxAdapter.get_warning_tip(self._field_image_caption,
                                                               Strings.label_article_image_caption)
 
         # Image link title sub sizer
         self._title_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._label_image_title = wx.StaticText(self, -1, f'{Strings.label_link_title}: ')
-        self._field_image_link_title = wx.TextCtrl(self, Numbers.ID_IMAGE_LINK)
+        self._field_image_link_title = wx.TextCtrl(self, GuiNumbers.ID_IMAGE_LINK)
         self._title_sub_sizer.Add(self._label_image_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_image_link_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_link_title_tip = Tools.get_warning_tip(self._field_image_link_title,
+        self._field_image_link_title_tip = WxAdapter.get_warning_tip(self._field_image_link_title,
                                                                  Strings.label_article_image_link_title)
 
         # Image alt sub sizer
         self._alt_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._label_image_alt = wx.StaticText(self, -1, f'{Strings.label_alt_description}: ')
-        self._field_image_alt = wx.TextCtrl(self, Numbers.ID_IMAGE_ALT)
+        self._field_image_alt = wx.TextCtrl(self, GuiNumbers.ID_IMAGE_ALT)
         self._alt_sub_sizer.Add(self._label_image_alt, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._alt_sub_sizer.Add(self._field_image_alt, proportion=1)
         self._information_sizer.Add(self._alt_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_alt_tip = Tools.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
+        self._field_image_alt_tip = WxAdapter.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
 
         self._label_image_caption.SetMinSize(self._label_image_alt.GetSize())
         self._label_image_title.SetMinSize(self._label_image_alt.GetSize())
@@ -193,10 +195,10 @@ class EditAsideImageDialog(SpellCheckedDialog):
         :param event:
         :return: None
         """
-        if event.GetId() == Numbers.ID_IMAGE_LINK:
+        if event.GetId() == GuiNumbers.ID_IMAGE_LINK:
             if self._field_image_caption.GetValue() != self._field_image_link_title.GetValue():
                 self._title_lock = True
-        elif event.GetId() == Numbers.ID_IMAGE_ALT:
+        elif event.GetId() == GuiNumbers.ID_IMAGE_ALT:
             if self._field_image_caption.GetValue() != self._field_image_alt.GetValue():
                 self._alt_lock = True
 
@@ -259,6 +261,7 @@ class EditAsideImageDialog(SpellCheckedDialog):
                 for path in (self._image_copy.get_thumbnail_image_path(), self._image_copy.get_original_image_path()):
                     if os.path.exists(path) and os.access(path, os.R_OK) and os.access(path, os.W_OK):
                         os.remove(path)
+                        FileSnapshot.get_instance().update([path])
                     else:
                         wx.MessageBox(f'{Strings.warning_can_not_delete}:\n{path}', Strings.status_error,
                                       wx.OK | wx.ICON_ERROR)
@@ -333,15 +336,15 @@ class EditAsideImageDialog(SpellCheckedDialog):
             if value[0][1]:
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
-                field.SetBackgroundColour(Numbers.RED_COLOR)
+                field.SetBackgroundColour(GuiNumbers.RED_COLOR)
             else:
                 tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 tip.DoHideNow()
-                field.SetBackgroundColour(Numbers.GREEN_COLOR)
+                field.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
             field.SetValue(value[0][0])
 
         # Set images
-        self._bitmap.SetBitmap(wx.Bitmap(self._image_copy.get_image(normal=True)))
+        self._bitmap.SetBitmap(wx.Bitmap(WxAdapter.get_image(self._image_copy, normal=True)))
 
         # Set thumbnail size
         thumbnail_size = self._image_copy.get_thumbnail_size()
@@ -1,11 +1,12 @@
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.WhitebearDocument import WhitebearDocument
 from Tools.SpellCheckerWithIgnoredList import SpellCheckerWithIgnoreList
-from Tools.Tools import Tools
 
 
 class EditDefaultValuesDialog(SpellCheckedDialog):
@@ -39,7 +40,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._title_sub_sizer.Add(self._label_main_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_global_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_global_title_tip = Tools.get_warning_tip(self._field_global_title, Strings.label_global_title)
+        self._field_global_title_tip = WxAdapter.get_warning_tip(self._field_global_title, Strings.label_global_title)
         self._field_global_title_tip.SetMessage(Strings.label_main_title_tip)
 
         # Url sub sizer
@@ -49,7 +50,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._url_sub_sizer.Add(self._label_url, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._url_sub_sizer.Add(self._field_url, proportion=1)
         self._information_sizer.Add(self._url_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_url_tip = Tools.get_warning_tip(self._field_url, Strings.label_website_url)
+        self._field_url_tip = WxAdapter.get_warning_tip(self._field_url, Strings.label_website_url)
         self._field_url_tip.SetMessage(Strings.label_website_url_tip)
 
         # Author sub sizer
@@ -66,7 +67,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._author_sub_sizer.Add(Numbers.widget_border_size, Numbers.widget_border_size)
         self._author_sub_sizer.Add(self._news_spinner, proportion=1)
         self._information_sizer.Add(self._author_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_author_tip = Tools.get_warning_tip(self._field_author, Strings.label_author)
+        self._field_author_tip = WxAdapter.get_warning_tip(self._field_author, Strings.label_author)
         self._field_author_tip.SetMessage(Strings.label_author_tip)
 
         # e-mail sub sizer
@@ -76,7 +77,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._contact_sub_sizer.Add(self._label_contact, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._contact_sub_sizer.Add(self._field_contact, proportion=1)
         self._information_sizer.Add(self._contact_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_contact_tip = Tools.get_warning_tip(self._field_contact, Strings.label_contact)
+        self._field_contact_tip = WxAdapter.get_warning_tip(self._field_contact, Strings.label_contact)
         self._field_contact_tip.SetMessage(Strings.label_contact_tip)
 
         # Keywords sub sizer
@@ -87,7 +88,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._meta_keywords_sub_sizer.Add(self._field_meta_keywords, proportion=1)
         self._information_sizer.Add(self._meta_keywords_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_keywords_tip = Tools.get_warning_tip(self._field_meta_keywords, Strings.label_article_keywords)
+        self._field_keywords_tip = WxAdapter.get_warning_tip(self._field_meta_keywords, Strings.label_article_keywords)
         self._field_keywords_tip.SetMessage(Strings.label_default_keywords_tip)
 
         size = self._label_main_title.GetSize()
@@ -107,7 +108,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._meta_description_sub_sizer.Add(self._field_meta_description, proportion=1, flag=wx.EXPAND)
         self._information_sizer.Add(self._meta_description_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_description_tip = Tools.get_warning_tip(self._field_meta_description,
+        self._field_description_tip = WxAdapter.get_warning_tip(self._field_meta_description,
                                                             Strings.label_main_meta_description)
         self._field_description_tip.SetMessage(Strings.label_main_description_tip)
 
@@ -120,7 +121,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._script_sub_sizer.Add(self._field_script, proportion=1, flag=wx.EXPAND)
         self._information_sizer.Add(self._script_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_script_tip = Tools.get_warning_tip(self._field_script, Strings.label_script)
+        self._field_script_tip = WxAdapter.get_warning_tip(self._field_script, Strings.label_script)
         self._field_script_tip.SetMessage(Strings.label_script_tip)
 
         # Black text sub sizer
@@ -132,7 +133,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._black_text_sub_sizer.Add(self._field_black_text, proportion=1, flag=wx.EXPAND)
         self._information_sizer.Add(self._black_text_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_black_text_tip = Tools.get_warning_tip(self._field_black_text, Strings.label_main_page_text)
+        self._field_black_text_tip = WxAdapter.get_warning_tip(self._field_black_text, Strings.label_main_page_text)
         self._field_black_text_tip.SetMessage(Strings.label_main_page_text_tip)
 
         # Red text sub sizer
@@ -146,7 +147,7 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         self._red_text_sub_sizer.Add(self._field_red_text, proportion=1, flag=wx.EXPAND)
         self._information_sizer.Add(self._red_text_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_red_text_tip = Tools.get_warning_tip(self._field_red_text, Strings.label_main_page_warning)
+        self._field_red_text_tip = WxAdapter.get_warning_tip(self._field_red_text, Strings.label_main_page_warning)
         self._field_red_text_tip.SetMessage(Strings.label_main_page_warning_tip)
 
         # Buttons
@@ -240,15 +241,17 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
         result = True
         # Keywords test.
         # Spellcheck here is a part of the seo tests.
-        correct, message, color = self._test_doc.seo_test_keywords(self._field_meta_keywords.GetValue())
+        correct, message, status = self._test_doc.seo_test_keywords(self._field_meta_keywords.GetValue())
+        color = WxAdapter.field_color(status)
         result = result and correct
         self._field_meta_keywords.SetBackgroundColour(color)
         self._field_keywords_tip.SetMessage(f'{Strings.label_default_keywords_tip}\n\n{Strings.seo_check}\n{message}')
 
         # Description test.
-        correct, message, color = self._test_doc.seo_test_description(self._field_meta_description.GetValue())
+        correct, message, status = self._test_doc.seo_test_description(self._field_meta_description.GetValue())
+        color = WxAdapter.field_color(status)
         result = result and correct
-        Tools.set_field_background(self._field_meta_description, color)
+        WxAdapter.set_field_background(self._field_meta_description, color)
         self._field_description_tip.SetMessage(f'{Strings.label_main_description_tip}\n\n{Strings.seo_check}\n'
                                                f'{message}')
 
@@ -271,12 +274,12 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
             if field in (self._field_global_title, self._field_author, self._field_contact, self._field_url) and \
                     (len(field.GetValue()) > Numbers.default_max_length or len(field.GetValue()) < 1):
                 result = False
-                Tools.set_field_background(field, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(field, GuiNumbers.RED_COLOR)
                 tip.SetMessage(f'{msg}\n\n{Strings.seo_check}\n{Strings.seo_error_length}: 1 - '
                                f'{Numbers.default_max_length}')
             elif field in (self._field_script, self._field_black_text, self._field_red_text) and not field.GetValue():
                 result = False
-                Tools.set_field_background(field, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(field, GuiNumbers.RED_COLOR)
                 tip.SetMessage(f'{msg}\n\n{Strings.seo_check}\n{Strings.seo_error_not_empty}')
             elif not self._spell_check(field.GetValue()) and sp:
                 # Run spellcheck on this field.
@@ -284,10 +287,10 @@ class EditDefaultValuesDialog(SpellCheckedDialog):
                 # Here we do not have the copy and have to do it as part of this method again.
                 # Keywords and description already have a spellcheck in their builtin seo test.
                 result = False
-                Tools.set_field_background(field, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(field, GuiNumbers.RED_COLOR)
                 tip.SetMessage(f'{msg}\n\n{Strings.seo_check}\n{Strings.spelling_error}')
             else:
-                Tools.set_field_background(field, Numbers.GREEN_COLOR)
+                WxAdapter.set_field_background(field, GuiNumbers.GREEN_COLOR)
                 tip.SetMessage(f'{msg}\n\n{Strings.seo_check}\n{Strings.status_ok}')
 
         return result
@@ -3,12 +3,14 @@ from pathlib import Path
 import wx
 from bodhi.client.cli import download
 
+from Constants.Constants import Status
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Threads.WorkerThread import WorkerThread
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.ArticleElements.Link import Link
-from Tools.Tools import Tools
 
 
 class EditLinkDialog(SpellCheckedDialog):
@@ -50,7 +52,7 @@ class EditLinkDialog(SpellCheckedDialog):
         self._url_sub_sizer.Add(self._label_url, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._url_sub_sizer.Add(self._field_url, proportion=1)
         self._information_sizer.Add(self._url_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_url_tip = Tools.get_warning_tip(self._field_url, Strings.label_url)
+        self._field_url_tip = WxAdapter.get_warning_tip(self._field_url, Strings.label_url)
 
         # Link title sub sizer
         self._title_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -59,7 +61,7 @@ class EditLinkDialog(SpellCheckedDialog):
         self._title_sub_sizer.Add(self._label_link_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_link_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_link_title_tip = Tools.get_warning_tip(self._field_link_title, Strings.label_link_title)
+        self._field_link_title_tip = WxAdapter.get_warning_tip(self._field_link_title, Strings.label_link_title)
 
         # Link text sub sizer
         self._text_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -68,7 +70,7 @@ class EditLinkDialog(SpellCheckedDialog):
         self._text_sub_sizer.Add(self._label_link_text, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._text_sub_sizer.Add(self._field_link_text, proportion=1)
         self._information_sizer.Add(self._text_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_link_text_tip = Tools.get_warning_tip(self._field_link_text, Strings.label_text)
+        self._field_link_text_tip = WxAdapter.get_warning_tip(self._field_link_text, Strings.label_text)
 
         self._label_url.SetMinSize(self._label_link_title.GetSize())
         self._label_link_text.SetMinSize(self._label_link_title.GetSize())
@@ -172,7 +174,7 @@ class EditLinkDialog(SpellCheckedDialog):
             return
         self.Enable()
         self.SetTitle(Strings.label_dialog_edit_link)
-        if result and self._link.get_status_color() != Numbers.RED_COLOR:
+        if result and self._link.get_status() != Status.ERROR:
             self.EndModal(return_value)
         else:
             self._display_dialog_contents()
@@ -206,11 +208,11 @@ class EditLinkDialog(SpellCheckedDialog):
             if value[0][1]:
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
-                field.SetBackgroundColour(Numbers.RED_COLOR)
+                field.SetBackgroundColour(GuiNumbers.RED_COLOR)
             else:
                 tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 tip.DoHideNow()
-                field.SetBackgroundColour(Numbers.GREEN_COLOR)
+                field.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
             field.SetValue(value[0][0])
 
         # Set checkbox local state
@@ -5,9 +5,9 @@ import wx
 
 from Constants.Constants import Strings, Numbers
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
-from Tools.Tools import Tools
 
 
 class EditMenuDialog(SpellCheckedDialog):
@@ -52,7 +52,7 @@ class EditMenuDialog(SpellCheckedDialog):
         self._page_name_sub_sizer.Add(self._field_page_name, proportion=1)
         self._information_sizer.Add(self._page_name_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_page_name_tip = Tools.get_warning_tip(self._field_page_name, Strings.label_menu_name)
+        self._field_page_name_tip = WxAdapter.get_warning_tip(self._field_page_name, Strings.label_menu_name)
         self._field_page_name_tip.SetMessage(Strings.label_menu_name)
 
         # Keywords sub sizer
@@ -63,7 +63,7 @@ class EditMenuDialog(SpellCheckedDialog):
         self._meta_keywords_sub_sizer.Add(self._field_meta_keywords, proportion=1)
         self._information_sizer.Add(self._meta_keywords_sub_sizer, flag=wx.EXPAND | wx.TOP,
                                     border=Numbers.widget_border_size)
-        self._field_keywords_tip = Tools.get_warning_tip(self._field_meta_keywords, Strings.label_menu_meta_keywords)
+        self._field_keywords_tip = WxAdapter.get_warning_tip(self._field_meta_keywords, Strings.label_menu_meta_keywords)
         self._field_keywords_tip.SetMessage(Strings.label_menu_meta_keywords)
 
         self._label_meta_keywords.SetMinSize(self._label_page_name.GetSize())
@@ -78,7 +78,7 @@ class EditMenuDialog(SpellCheckedDialog):
         self._meta_description_sub_sizer.Add(self._field_meta_description, proportion=1, flag=wx.EXPAND)
         self._information_sizer.Add(self._meta_description_sub_sizer, 1, flag=wx.EXPAND | wx.TOP | wx.BOTTOM,
                                     border=Numbers.widget_border_size)
-        self._field_description_tip = Tools.get_warning_tip(self._field_meta_description,
+        self._field_description_tip = WxAdapter.get_warning_tip(self._field_meta_description,
                                                             Strings.label_meta_description)
         self._field_description_tip.SetMessage(Strings.label_menu_meta_description)
 
@@ -207,7 +207,8 @@ class EditMenuDialog(SpellCheckedDialog):
         spelling_result = True
 
         # Test name
-        correct, message, color = self._menu.seo_test_name(self._field_page_name.GetValue())
+        correct, message, status = self._menu.seo_test_name(self._field_page_name.GetValue())
+        color = WxAdapter.field_color(status)
         seo_result = seo_result and correct
         if message == Strings.spelling_error:
             spelling_result = False
@@ -215,7 +216,8 @@ class EditMenuDialog(SpellCheckedDialog):
         self._field_page_name_tip.SetMessage(f'{Strings.seo_check}\n{message}')
 
         # Keywords test.
-        correct, message, color = self._menu.seo_test_keywords(self._field_meta_keywords.GetValue())
+        correct, message, status = self._menu.seo_test_keywords(self._field_meta_keywords.GetValue())
+        color = WxAdapter.field_color(status)
         seo_result = seo_result and correct
         if message == Strings.spelling_error:
             spelling_result = False
@@ -223,7 +225,8 @@ class EditMenuDialog(SpellCheckedDialog):
         self._field_keywords_tip.SetMessage(f'{Strings.seo_check}\n{message}')
 
         # Description test.
-        correct, message, color = self._menu.seo_test_description(self._field_meta_description.GetValue())
+        correct, message, status = self._menu.seo_test_description(self._field_meta_description.GetValue())
+        color = WxAdapter.field_color(status)
         seo_result = seo_result and correct
         if message == Strings.spelling_error:
             spelling_result = False
@@ -3,10 +3,12 @@ import os
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.AddLogoDialog import AddLogoDialog
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Tools.Document.MenuItem import MenuItem
-from Tools.Tools import Tools
+from Tools.FileSnapshot import FileSnapshot
 
 
 class EditMenuItemDialog(SpellCheckedDialog):
@@ -74,27 +76,27 @@ class EditMenuItemDialog(SpellCheckedDialog):
         self._name_sub_sizer.Add(self._label_item_name, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._name_sub_sizer.Add(self._field_item_name, proportion=1)
         self._information_sizer.Add(self._name_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_item_name_tip = Tools.get_warning_tip(self._field_item_name,
+        self._field_item_name_tip = WxAdapter.get_warning_tip(self._field_item_name,
                                                           Strings.label_menu_item_name)
 
         # Image link title sub sizer
         self._title_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._label_image_title = wx.StaticText(self, -1, f'{Strings.label_link_title}: ')
-        self._field_image_link_title = wx.TextCtrl(self, Numbers.ID_IMAGE_LINK)
+        self._field_image_link_title = wx.TextCtrl(self, GuiNumbers.ID_IMAGE_LINK)
         self._title_sub_sizer.Add(self._label_image_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_image_link_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_link_title_tip = Tools.get_warning_tip(self._field_image_link_title,
+        self._field_image_link_title_tip = WxAdapter.get_warning_tip(self._field_image_link_title,
                                                                  Strings.label_article_image_link_title)
 
         # Image alt sub sizer
         self._alt_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._label_image_alt = wx.StaticText(self, -1, f'{Strings.label_alt_description}: ')
-        self._field_image_alt = wx.TextCtrl(self, Numbers.ID_IMAGE_ALT)
+        self._field_image_alt = wx.TextCtrl(self, GuiNumbers.ID_IMAGE_ALT)
         self._alt_sub_sizer.Add(self._label_image_alt, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._alt_sub_sizer.Add(self._field_image_alt, proportion=1)
         self._information_sizer.Add(self._alt_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_alt_tip = Tools.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
+        self._field_image_alt_tip = WxAdapter.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
 
         self._label_item_name.SetMinSize(self._label_image_alt.GetSize())
         self._label_image_title.SetMinSize(self._label_image_alt.GetSize())
@@ -179,10 +181,10 @@ class EditMenuItemDialog(SpellCheckedDialog):
         :param event:
         :return: None
         """
-        if event.GetId() == Numbers.ID_IMAGE_ALT:
+        if event.GetId() == GuiNumbers.ID_IMAGE_ALT:
             if self._field_image_alt.GetValue() != self._field_item_name.GetValue():
                 self._alt_lock = True
-        elif event.GetId() == Numbers.ID_IMAGE_LINK:
+        elif event.GetId() == GuiNumbers.ID_IMAGE_LINK:
             if self._field_image_link_title.GetValue() != self._field_item_name.GetValue():
                 self._title_lock = True
 
@@ -200,8 +202,8 @@ class EditMenuItemDialog(SpellCheckedDialog):
                 self._field_item_name.GetValue()) < Numbers.menu_name_min_length:
             # The menu name would have 3 or 0 lines which we do not want
             self._ok_button.Disable()
-            self._content_item_name.SetBackgroundColour(Numbers.RED_COLOR)
-            self._field_item_name.SetBackgroundColour(Numbers.RED_COLOR)
+            self._content_item_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
+            self._field_item_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
             if len(self._field_item_name.GetValue()) < Numbers.menu_name_min_length:
                 self._field_item_name_tip.SetMessage(f'{Strings.seo_check}\n{Strings.seo_error_menu_name_length}')
             if self._content_item_name.GetSize()[1] > Numbers.logo_text_width:
@@ -213,11 +215,11 @@ class EditMenuItemDialog(SpellCheckedDialog):
             self._item_copy.test_self()
             if self._item_copy.get_article_name()[1]:
                 # There is an error message for article name.
-                self._field_item_name.SetBackgroundColour(Numbers.RED_COLOR)
+                self._field_item_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
                 self._field_item_name_tip.SetMessage(f'{Strings.seo_check}\n{self._item_copy.get_article_name()[1]}')
                 self._field_item_name_tip.EnableTip(True)
             else:
-                self._field_item_name.SetBackgroundColour(Numbers.GREEN_COLOR)
+                self._field_item_name.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
                 self._field_item_name_tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 self._field_item_name_tip.DoHideNow()
                 self._ok_button.Enable()
@@ -276,6 +278,7 @@ class EditMenuItemDialog(SpellCheckedDialog):
                 path = self._item_copy.get_image_path()
                 if os.path.exists(path) and os.access(path, os.R_OK) and os.access(path, os.W_OK):
                     os.remove(path)
+                    FileSnapshot.get_instance().update([path])
                 else:
                     wx.MessageBox(f'{Strings.warning_can_not_delete}:\n{path}', Strings.status_error,
                                   wx.OK | wx.ICON_ERROR)
@@ -345,15 +348,15 @@ class EditMenuItemDialog(SpellCheckedDialog):
             if value[0][1]:
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
-                field.SetBackgroundColour(Numbers.RED_COLOR)
+                field.SetBackgroundColour(GuiNumbers.RED_COLOR)
             else:
                 tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 tip.DoHideNow()
-                field.SetBackgroundColour(Numbers.GREEN_COLOR)
+                field.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
             field.SetValue(value[0][0])
 
         # Set image
-        self._bitmap.SetBitmap(wx.Bitmap(self._item_copy.get_image(normal=True)))
+        self._bitmap.SetBitmap(wx.Bitmap(WxAdapter.get_image(self._item_copy, normal=True)))
 
         # Set target
         self._content_href.SetLabelText(self._item_copy.get_link_href())
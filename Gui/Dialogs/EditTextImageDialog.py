@@ -4,10 +4,12 @@ import wx
 from docutils.nodes import label
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.AddImageDialog import AddImageDialog
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Tools.Document.ArticleElements.ImageInText import ImageInText
-from Tools.Tools import Tools
+from Tools.FileSnapshot import FileSnapshot
 
 
 class EditTextImageDialog(SpellCheckedDialog):
@@ -85,17 +87,17 @@ class EditTextImageDialog(SpellCheckedDialog):
         self._title_sub_sizer.Add(self._label_image_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_image_link_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_link_title_tip = Tools.get_warning_tip(self._field_image_link_title,
+        self._field_image_link_title_tip = WxAdapter.get_warning_tip(self._field_image_link_title,
                                                                  Strings.label_article_image_link_title)
 
         # Image alt sub sizer
         self._alt_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._label_image_alt = wx.StaticText(self, -1, f'{Strings.label_alt_description}: ')
-        self._field_image_alt = wx.TextCtrl(self, Numbers.ID_IMAGE_ALT)
+        self._field_image_alt = wx.TextCtrl(self, GuiNumbers.ID_IMAGE_ALT)
         self._alt_sub_sizer.Add(self._label_image_alt, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._alt_sub_sizer.Add(self._field_image_alt, proportion=1)
         self._information_sizer.Add(self._alt_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_image_alt_tip = Tools.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
+        self._field_image_alt_tip = WxAdapter.get_warning_tip(self._field_image_alt, Strings.label_article_image_alt)
 
         self._label_image_title.SetMinSize(self._label_image_alt.GetSize())
 
@@ -175,7 +177,7 @@ class EditTextImageDialog(SpellCheckedDialog):
         :param event:
         :return: None
         """
-        if event.GetId() == Numbers.ID_IMAGE_ALT:
+        if event.GetId() == GuiNumbers.ID_IMAGE_ALT:
             if self._field_image_link_title.GetValue() != self._field_image_alt.GetValue():
                 self._alt_lock = True
 
@@ -234,6 +236,7 @@ class EditTextImageDialog(SpellCheckedDialog):
                 for path in (self._image_copy.get_thumbnail_image_path(), self._image_copy.get_original_image_path()):
                     if os.path.exists(path) and os.access(path, os.R_OK) and os.access(path, os.W_OK):
                         os.remove(path)
+                        FileSnapshot.get_instance().update([path])
                     else:
                         wx.MessageBox(f'{Strings.warning_can_not_delete}:\n{path}', Strings.status_error,
                                       wx.OK | wx.ICON_ERROR)
@@ -300,15 +303,15 @@ class EditTextImageDialog(SpellCheckedDialog):
             if value[0][1]:
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
-                field.SetBackgroundColour(Numbers.RED_COLOR)
+                field.SetBackgroundColour(GuiNumbers.RED_COLOR)
             else:
                 tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 tip.DoHideNow()
-                field.SetBackgroundColour(Numbers.GREEN_COLOR)
+                field.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
             field.SetValue(value[0][0])
 
         # Set images
-        self._bitmap.SetBitmap(wx.Bitmap(self._image_copy.get_image(normal=True)))
+        self._bitmap.SetBitmap(wx.Bitmap(WxAdapter.get_image(self._image_copy, normal=True)))
         # Set disk paths
         full_path = self._image_copy.get_original_image_path()
         self.SetTitle(f'{Strings.label_dialog_edit_image}: {self._image_copy.get_full_filename()}')
@@ -1,11 +1,13 @@
 import wx
 
+from Constants.Constants import Status
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.SpellCheckedDialog import SpellCheckedDialog
+from Gui.WxAdapter import WxAdapter
 from Threads.WorkerThread import WorkerThread
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.ArticleElements.Video import Video
-from Tools.Tools import Tools
 
 
 class EditVideoDialog(SpellCheckedDialog):
@@ -34,7 +36,7 @@ class EditVideoDialog(SpellCheckedDialog):
         self._title_sub_sizer.Add(self._label_video_title, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._title_sub_sizer.Add(self._field_video_link_title, proportion=1)
         self._information_sizer.Add(self._title_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_video_link_title_tip = Tools.get_warning_tip(self._field_video_link_title,
+        self._field_video_link_title_tip = WxAdapter.get_warning_tip(self._field_video_link_title,
                                                                  Strings.label_video_link_title)
 
         # Url sub sizer
@@ -44,7 +46,7 @@ class EditVideoDialog(SpellCheckedDialog):
         self._url_sub_sizer.Add(self._label_video_url, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._url_sub_sizer.Add(self._field_video_url, proportion=1)
         self._information_sizer.Add(self._url_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_video_url_tip = Tools.get_warning_tip(self._field_video_url, Strings.label_url)
+        self._field_video_url_tip = WxAdapter.get_warning_tip(self._field_video_url, Strings.label_url)
 
         self._label_video_url.SetMinSize(self._label_video_title.GetSize())
 
@@ -132,7 +134,7 @@ class EditVideoDialog(SpellCheckedDialog):
         """
         self.Enable()
         self.SetTitle(Strings.label_dialog_edit_video)
-        if result and self._video.get_status_color() != Numbers.RED_COLOR:
+        if result and self._video.get_status() != Status.ERROR:
             self.EndModal(return_value)
         elif return_value == wx.ID_CANCEL:
             self.EndModal(return_value)
@@ -153,11 +155,11 @@ class EditVideoDialog(SpellCheckedDialog):
             if value[0][1]:
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
-                field.SetBackgroundColour(Numbers.RED_COLOR)
+                field.SetBackgroundColour(GuiNumbers.RED_COLOR)
             else:
                 tip.SetMessage(f'{Strings.seo_check}\n{Strings.status_ok}')
                 tip.DoHideNow()
-                field.SetBackgroundColour(Numbers.GREEN_COLOR)
+                field.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
             field.SetValue(value[0][0])
         # Set size
         size = self._video.get_size()
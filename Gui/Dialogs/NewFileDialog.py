@@ -5,8 +5,10 @@ from typing import List, Dict
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
 from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
 from Gui.Dialogs.EditMenuItemDialog import EditMenuItemDialog
+from Gui.WxAdapter import WxAdapter
 from Resources.Fetch import Fetch
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.AsideImage import AsideImage
@@ -15,7 +17,6 @@ from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
 from Tools.Document.WhitebearDocumentCSS import WhitebearDocumentCSS
 from Tools.Document.WhitebearDocumentIndex import WhitebearDocumentIndex
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
-from Tools.Tools import Tools
 
 
 class NewFileDialog(wx.Dialog):
@@ -57,8 +58,8 @@ class NewFileDialog(wx.Dialog):
         self._name_sub_sizer.Add(self._label_file_name, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._name_sub_sizer.Add(self._field_name, proportion=1)
         self._information_sizer.Add(self._name_sub_sizer, flag=wx.EXPAND | wx.TOP, border=Numbers.widget_border_size)
-        self._field_name_tip = Tools.get_warning_tip(self._field_name, Strings.label_file_name)
-        self._field_name.SetBackgroundColour(Numbers.RED_COLOR)
+        self._field_name_tip = WxAdapter.get_warning_tip(self._field_name, Strings.label_file_name)
+        self._field_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
         self._field_name_tip.SetMessage(Strings.warning_empty)
 
         choices: List[str] = [menu.get_page_name()[0] for menu in self._menus.values()]
@@ -68,7 +69,7 @@ class NewFileDialog(wx.Dialog):
         self._label_category = wx.StaticText(self, -1, f'{Strings.label_target_section}: ')
         self._box_menu = wx.ComboBox(self, -1, choices=choices, style=wx.CB_DROPDOWN | wx.CB_SORT | wx.CB_READONLY)
         self._box_menu.SetSelection(0)
-        self._box_menu.SetBackgroundColour(Numbers.RED_COLOR)
+        self._box_menu.SetBackgroundColour(GuiNumbers.RED_COLOR)
         self._category_sub_sizer.Add(self._label_category, flag=wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL)
         self._category_sub_sizer.Add(self._box_menu, proportion=1)
         self._information_sizer.Add(self._category_sub_sizer, flag=wx.EXPAND | wx.TOP,
@@ -78,12 +79,12 @@ class NewFileDialog(wx.Dialog):
 
         # Image buttons
         self._image_buttons_sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self._menu_logo_button = wx.Button(self, Numbers.ID_MENU_LOGO, style=wx.BU_EXACTFIT | wx.BORDER_NONE,
+        self._menu_logo_button = wx.Button(self, GuiNumbers.ID_MENU_LOGO, style=wx.BU_EXACTFIT | wx.BORDER_NONE,
                                            size=wx.Size(Numbers.menu_logo_image_size, Numbers.menu_logo_image_size))
         self._menu_logo_button.Disable()
         self._menu_logo_button.SetBitmap(wx.Bitmap(wx.Image(Fetch.get_resource_path('menu_image.png'),
                                                             wx.BITMAP_TYPE_PNG)))
-        self._main_image_button = wx.Button(self, Numbers.ID_MAIN_IMAGE, style=wx.BU_EXACTFIT | wx.BORDER_NONE)
+        self._main_image_button = wx.Button(self, GuiNumbers.ID_MAIN_IMAGE, style=wx.BU_EXACTFIT | wx.BORDER_NONE)
         self._main_image_button.Disable()
         self._main_image_button.SetBitmap(wx.Bitmap(wx.Image(Fetch.get_resource_path('article_image.png'),
                                                              wx.BITMAP_TYPE_PNG)))
@@ -184,7 +185,7 @@ class NewFileDialog(wx.Dialog):
         :return: None
         """
         event.Skip()
-        if event.GetId() == Numbers.ID_MENU_LOGO:
+        if event.GetId() == GuiNumbers.ID_MENU_LOGO:
             # Create menu item.
             if not self._menu_item:
                 menu_item: MenuItem = MenuItem(name='',
@@ -204,12 +205,12 @@ class NewFileDialog(wx.Dialog):
             edit_dialog.Destroy()
             if result == wx.ID_OK:
                 # Display the image. Disable section and name fields and enable main image button.
-                self._menu_logo_button.SetBitmap(wx.Bitmap(menu_item.get_image()))
+                self._menu_logo_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(menu_item)))
                 self._field_name.Disable()
                 self._box_menu.Disable()
                 self._main_image_button.Enable()
                 self._menu_item = menu_item
-        elif event.GetId() == Numbers.ID_MAIN_IMAGE:
+        elif event.GetId() == GuiNumbers.ID_MAIN_IMAGE:
             # Create article image.
             if not self._article_image:
                 image = AsideImage(caption='',
@@ -225,7 +226,7 @@ class NewFileDialog(wx.Dialog):
             result = edit_dialog.ShowModal()
             edit_dialog.Destroy()
             if result == wx.ID_OK:
-                self._main_image_button.SetBitmap(wx.Bitmap(image.get_image()))
+                self._main_image_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(image)))
                 self._ok_button.Enable()
                 self._article_image = image
 
@@ -239,9 +240,9 @@ class NewFileDialog(wx.Dialog):
         disable = False
         if self._box_menu.GetValue() == '-':
             disable = True
-            self._box_menu.SetBackgroundColour(Numbers.RED_COLOR)
+            self._box_menu.SetBackgroundColour(GuiNumbers.RED_COLOR)
         else:
-            self._box_menu.SetBackgroundColour(Numbers.GREEN_COLOR)
+            self._box_menu.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
 
         new_name = self._field_name.GetValue()
         wrong_name: bool = False
@@ -251,7 +252,7 @@ class NewFileDialog(wx.Dialog):
             if c == '-':
                 wrong_name = False
         if wrong_name or not self._get_document_path() or not self._field_name.GetValue():
-            self._field_name.SetBackgroundColour(Numbers.RED_COLOR)
+            self._field_name.SetBackgroundColour(GuiNumbers.RED_COLOR)
             disable = True
             if wrong_name:
                 self._field_name_tip.SetMessage(Strings.warning_name_incorrect)
@@ -264,7 +265,7 @@ class NewFileDialog(wx.Dialog):
         else:
             self._field_name_tip.SetMessage(Strings.status_ok)
             self._field_name_tip.DoHideNow()
-            self._field_name.SetBackgroundColour(Numbers.GREEN_COLOR)
+            self._field_name.SetBackgroundColour(GuiNumbers.GREEN_COLOR)
 
         if disable:
             self._ok_button.Disable()
@@ -1,6 +1,7 @@
 import wx
 
-from Constants.Constants import Strings, Events
+from Constants.Constants import Strings
+from Constants.GuiConstants import Events
 from Gui.Dialogs.SpellCheckerDialog import SpellCheckerDialog
 from Gui.Panels.CustomRichText import CustomRichText
 
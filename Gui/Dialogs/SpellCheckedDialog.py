@@ -2,7 +2,8 @@ from typing import Tuple
 
 import wx
 
-from Constants.Constants import Strings, Events
+from Constants.Constants import Strings
+from Constants.GuiConstants import Events
 from Gui.Dialogs.SpellCheckerDialog import SpellCheckerDialog
 
 
@@ -6,11 +6,15 @@ import pendulum
 import wx
 
 from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import GuiNumbers
+from Gui.WxAdapter import WxAdapter
 from Resources.Fetch import Fetch
 from pathlib import Path
+from Threads.CompressorThread import CompressorThread
 from Threads.OptimizerThread import OptimizerThread
 from Threads.SftpThread import SftpThread
 from Tools.ConfigManager import ConfigManager
+from Tools.DependencyGraph import DependencyGraph
 from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
 from Tools.Document.WhitebearDocumentCSS import WhitebearDocumentCSS
 from Tools.Document.WhitebearDocumentIndex import WhitebearDocumentIndex
@@ -20,10 +24,11 @@ from Tools.Tools import Tools
 class UploadDialog(wx.Dialog):
 
     def __init__(self, parent, articles: Dict[str, WhitebearDocumentArticle],
-                 index: WhitebearDocumentIndex, css: WhitebearDocumentCSS):
+                 index: WhitebearDocumentIndex, css: WhitebearDocumentCSS, graph: DependencyGraph):
         """
         Display a modal dialog with a message with the text being selectable.
         :param parent: Parent frame.
+        :param graph: Dependency graph of the articles, used to find the images and files of changed articles.
         """
         wx.Dialog.__init__(self, parent, style=wx.DEFAULT_DIALOG_STYLE, title=Strings.label_upload,
                            size=(Numbers.upload_dialog_width, Numbers.upload_dialog_height))
@@ -35,6 +40,7 @@ class UploadDialog(wx.Dialog):
         self._articles = articles
         self._index = index
         self._css = css
+        self._graph = graph
         # Contains unique id and disk path for each file in the file list even those unchecked.
         self._upload_dict: Dict[int, Tuple[str, bool]] = {}
         self._finished_uploads: List[str] = []
@@ -42,6 +48,7 @@ class UploadDialog(wx.Dialog):
         self._invalid_files = 0
         self._sftp_thread = None
         self._optimizer_thread = None
+        self._compressor_thread = None
         # If a menu or index is invalid, upload must be prevented until the user fixes it in a different dialog.
         self._prevent_upload = False
 
@@ -71,7 +78,7 @@ class UploadDialog(wx.Dialog):
         self._ip_sub_sizer.Add(self._field_ip_port, proportion=1)
         self._config_sizer.Add(self._ip_sub_sizer, flag=wx.EXPAND | wx.TOP | wx.LEFT | wx.RIGHT,
                                border=Numbers.widget_border_size)
-        self._field_ip_port_tip = Tools.get_warning_tip(self._field_ip_port, Strings.label_ip_port)
+        self._field_ip_port_tip = WxAdapter.get_warning_tip(self._field_ip_port, Strings.label_ip_port)
         self._field_ip_port_tip.SetMessage(Strings.label_ip_port_tip)
 
         # User
@@ -82,7 +89,7 @@ class UploadDialog(wx.Dialog):
         self._user_sub_sizer.Add(self._field_user, proportion=1)
         self._config_sizer.Add(self._user_sub_sizer, flag=wx.EXPAND | wx.TOP | wx.LEFT | wx.RIGHT,
                                border=Numbers.widget_border_size)
-        self._field_user_tip = Tools.get_warning_tip(self._field_user, Strings.label_user)
+        self._field_user_tip = WxAdapter.get_warning_tip(self._field_user, Strings.label_user)
         self._field_user_tip.SetMessage(Strings.label_user_tip)
 
         # Key file
@@ -95,7 +102,12 @@ class UploadDialog(wx.Dialog):
         self._keyfile_sub_sizer.Add(self._keyfile_button, flag=wx.LEFT, border=Numbers.widget_border_size)
         self._config_sizer.Add(self._keyfile_sub_sizer, flag=wx.EXPAND | wx.ALL,
                                border=Numbers.widget_border_size)
-        self._field_keyfile_tip = Tools.get_warning_tip(self._field_keyfile, Strings.label_key_file)
+
+        # Compressed copies
+        self._precompress_checkbox = wx.CheckBox(self, -1, Strings.label_precompress)
+        self._config_sizer.Add(self._precompress_checkbox, flag=wx.EXPAND | wx.BOTTOM | wx.LEFT | wx.RIGHT,
+                               border=Numbers.widget_border_size)
+        self._field_keyfile_tip = WxAdapter.get_warning_tip(self._field_keyfile, Strings.label_key_file)
         self._field_keyfile_tip.SetMessage(Strings.label_key_file_tip)
 
         self._label_ip_port.SetMinSize(self._label_keyfile.GetSize())
@@ -141,7 +153,7 @@ class UploadDialog(wx.Dialog):
 
         self._label_successful = wx.StaticText(self, -1, f'{Strings.label_successful_uploads}:')
         self._content_successful = wx.StaticText(self, -1, '0')
-        self._content_successful.SetForegroundColour(Numbers.DARK_GREEN_COLOR)
+        self._content_successful.SetForegroundColour(GuiNumbers.DARK_GREEN_COLOR)
         self._info_left_sizer.Add(self._label_successful, flag=wx.BOTTOM | wx.LEFT, border=Numbers.widget_border_size)
         self._info_right_sizer.Add(self._content_successful, flag=wx.BOTTOM, border=Numbers.widget_border_size)
 
@@ -169,7 +181,7 @@ class UploadDialog(wx.Dialog):
 
         # Upload button
         self._upload_button_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self._upload_button = wx.Button(self, Numbers.ID_UPLOAD, Strings.button_upload, style=wx.BU_EXACTFIT)
+        self._upload_button = wx.Button(self, GuiNumbers.ID_UPLOAD, Strings.button_upload, style=wx.BU_EXACTFIT)
         self._button_to_upload()
         self._upload_button_sizer.AddStretchSpacer()
         self._upload_button_sizer.Add(self._upload_button, flag=wx.ALIGN_CENTER)
@@ -198,6 +210,7 @@ class UploadDialog(wx.Dialog):
         self.Bind(wx.EVT_TEXT, self._handle_fields, self._field_ip_port)
         self.Bind(wx.EVT_TEXT, self._handle_fields, self._field_user)
         self.Bind(wx.EVT_TEXT, self._handle_fields, self._field_keyfile)
+        self.Bind(wx.EVT_CHECKBOX, self._handle_precompress, self._precompress_checkbox)
         self.Bind(wx.EVT_CLOSE, self._close_button_handler, self)
 
         self._display_dialog_contents()
@@ -303,11 +316,13 @@ class UploadDialog(wx.Dialog):
         :return: None
         """
         self._content_optimizer.SetLabelText(Strings.status_finished)
-        if not error:
-            self._upload_files()
-        else:
+        if error:
             self._button_to_upload()
             self._upload_button.Enable()
+        elif self._precompress_checkbox.GetValue():
+            self._compress_and_upload()
+        else:
+            self._upload_files()
 
     @staticmethod
     def on_optimization_fail(file: str) -> None:
@@ -318,6 +333,47 @@ class UploadDialog(wx.Dialog):
         """
         wx.MessageBox(f'{Strings.warning_optimization_fail} {file}', Strings.status_warning, wx.OK | wx.ICON_WARNING)
 
+    def on_compression_done(self, file: str, files_done: int) -> None:
+        """
+        Called when compressor thread finishes a file. Updates the progress bar and the optimization file label.
+        :param file: The file.
+        :param files_done: Number of files that finished compression.
+        :return: None
+        """
+        self._content_optimizer.SetLabelText(os.path.relpath(file, start=self._config_manager.get_working_dir()))
+        self._upload_gauge.SetValue(files_done)
+
+    def on_compression_finished(self, sidecars: List[str], error: bool) -> None:
+        """
+        Called when compressor thread finishes compressing all files. Adds the compressed copies into the file list and
+        starts the upload.
+        :param sidecars: Full disk paths of the compressed copies of the files.
+        :param error: True if there was an error during compression or the compression was stopped.
+        :return: None
+        """
+        self._content_optimizer.SetLabelText(Strings.status_finished)
+        if error:
+            self._button_to_upload()
+            self._upload_button.Enable()
+            return
+        known_paths = [path for path, _ in self._upload_dict.values()]
+        for sidecar in sidecars:
+            if sidecar not in known_paths:
+                file_id = self._get_id()
+                self._upload_dict[file_id] = (sidecar, True)
+                self._append_into_list(file_id, sidecar, enabled=True)
+        self._content_num_files.SetLabelText(str(self._count_checked_files()))
+        self._upload_files()
+
+    @staticmethod
+    def on_compression_fail(file: str) -> None:
+        """
+        Called when compressor thread fails to compress a file.
+        :param file: The file that failed.
+        :return: None
+        """
+        wx.MessageBox(f'{Strings.warning_compression_fail} {file}', Strings.status_warning, wx.OK | wx.ICON_WARNING)
+
     def on_file_upload_finished(self, file: str, fail: bool) -> None:
         """
         Called when SFTP put finishes uploading a file or finishes with fail. Updates the file list to indicate finished
@@ -327,9 +383,9 @@ class UploadDialog(wx.Dialog):
         :return: None
         """
         if fail:
-            color = Numbers.RED_COLOR
+            color = GuiNumbers.RED_COLOR
         else:
-            color = Numbers.GREEN_COLOR
+            color = GuiNumbers.GREEN_COLOR
             filename = os.path.basename(file)
             # Documents after upload should appear white, they are saved on disk and now the same copy is online.
             # Keys are checked for belonging by default
@@ -353,9 +409,9 @@ class UploadDialog(wx.Dialog):
             item = self._file_list.GetNextItem(item, wx.LIST_NEXT_ALL, wx.LIST_STATE_DONTCARE)
             if item == -1:
                 break
-            elif self._file_list.GetItemBackgroundColour(item) == Numbers.GREEN_COLOR:
+            elif self._file_list.GetItemBackgroundColour(item) == GuiNumbers.GREEN_COLOR:
                 counter_green += 1
-            elif self._file_list.GetItemBackgroundColour(item) == Numbers.RED_COLOR:
+            elif self._file_list.GetItemBackgroundColour(item) == GuiNumbers.RED_COLOR:
                 counter_red += 1
         self._content_successful.SetLabelText(str(counter_green))
         self._content_failed.SetLabelText(str(counter_red))
@@ -389,6 +445,22 @@ class UploadDialog(wx.Dialog):
         self._optimizer_thread = OptimizerThread(self, images_to_optimize)
         self._optimizer_thread.start()
 
+    def _compress_and_upload(self) -> None:
+        """
+        Create compressed copies of all html, css, xml and txt files involved in this upload.
+        :return: None
+        """
+        files_to_compress = []
+        for file, state in self._upload_dict.values():
+            if state and file.endswith(Strings.compressed_extensions):
+                files_to_compress.append(file)
+
+        self._upload_gauge.SetRange(len(files_to_compress))
+        self._upload_gauge.SetValue(0)
+        # Run even with no files, upload starts when compression finishes.
+        self._compressor_thread = CompressorThread(self, files_to_compress)
+        self._compressor_thread.start()
+
     def _upload_files(self, password=None) -> None:
         """
         Run a SFTP thread to upload the files.
@@ -431,6 +503,7 @@ class UploadDialog(wx.Dialog):
         self._field_ip_port.Enable(enable)
         self._field_user.Enable(enable)
         self._field_keyfile.Enable(enable)
+        self._precompress_checkbox.Enable(enable)
 
     def _get_id(self) -> int:
         """
@@ -472,7 +545,7 @@ class UploadDialog(wx.Dialog):
             path = self._ask_for_file(Strings.home_directory)
             if path:
                 self._field_keyfile.SetValue(path)
-        elif event.GetId() == Numbers.ID_UPLOAD:
+        elif event.GetId() == GuiNumbers.ID_UPLOAD:
             self._enable_controls(False)
             if self._upload_button.GetLabel() == Strings.button_upload:
                 # Image optimizer continues to launch upload when finished.
@@ -481,10 +554,20 @@ class UploadDialog(wx.Dialog):
             else:
                 if self._optimizer_thread:
                     self._optimizer_thread.stop()
+                if self._compressor_thread:
+                    self._compressor_thread.stop()
                 if self._sftp_thread:
                     self._sftp_thread.stop()
                 self._enable_controls(True)
 
+    def _handle_precompress(self, event: wx.CommandEvent) -> None:
+        """
+        Save the preference of uploading compressed copies of text files.
+        :param event: Not used.
+        :return: None
+        """
+        self._config_manager.store_precompress(self._precompress_checkbox.GetValue())
+
     def _close_button_handler(self, event: wx.CloseEvent) -> None:
         """
         Handle closing of the dialog. If the upload thread is running warn the user and offer unsafe force stop.
@@ -565,24 +648,21 @@ class UploadDialog(wx.Dialog):
                 # Add all that belongs to this document into the list.
                 if document.is_seo_ok():
                     self._add_if_not_in(document.get_path(), enabled=True)
-                    self._add_if_not_in(document.get_article_image().get_original_image_path())
-                    self._add_if_not_in(document.get_article_image().get_thumbnail_image_path())
-                    for image in document.get_aside_images():
-                        # Add all aside images and thumbnails
-                        self._add_if_not_in(image.get_original_image_path())
-                        self._add_if_not_in(image.get_thumbnail_image_path())
-                    for image in document.get_text_images():
-                        self._add_if_not_in(image.get_original_image_path())
-                        self._add_if_not_in(image.get_thumbnail_image_path())
-                    for link in document.get_links():
-                        # Add all files and images that are linked from the article
-                        if link.get_url()[0].startswith(Strings.folder_files):
-                            self._add_if_not_in(os.path.join(self._config_manager.get_working_dir(), link.get_url()[0]))
+                    # Add all images, thumbnails, the menu logo and linked files of the article.
+                    for path in sorted(self._graph.get_assets(filename)):
+                        self._add_if_not_in(path)
+                        # The page refers to the other widths of its thumbnails and their webp and avif variants.
+                        widths = Tools.get_width_images(path) if Strings.folder_thumbnails in path else []
+                        for image in widths:
+                            self._add_if_not_in(image)
+                        for image in [path] + widths:
+                            for variant in Strings.image_variants:
+                                if os.path.exists(image + variant[1]):
+                                    self._add_if_not_in(image + variant[1])
 
                     # Add the menu of this document to the list too.
                     if document.get_menu_section().is_seo_ok():
                         self._add_if_not_in(document.get_menu_section().get_path())
-                        self._add_if_not_in(document.get_menu_item().get_image_path())
                     else:
                         self._add_if_not_in(document.get_menu_section().get_path(), enabled=False)
                         self._prevent_upload = True
@@ -603,8 +683,24 @@ class UploadDialog(wx.Dialog):
                 self._prevent_upload = True
 
             self._add_if_not_in(self._css.get_path(), True)
+            if self._config_manager.get_minify():
+                # Minified pages link the minified copy of the stylesheet, it must follow the stylesheet's changes.
+                try:
+                    self._add_if_not_in(Tools.create_minified_css(self._config_manager.get_working_dir()), True)
+                except OSError as e:
+                    wx.MessageBox(f'{Strings.warning_minify_fail} {e}', Strings.status_warning,
+                                  wx.OK | wx.ICON_WARNING)
             self._add_if_not_in(os.path.join(self._config_manager.get_working_dir(), Strings.robots_file), True)
             self._add_if_not_in(os.path.join(self._config_manager.get_working_dir(), Strings.sitemap_file), True)
+            # Large sites have the sitemap split into numbered shards.
+            shard_number = 1
+            shard_path = os.path.join(self._config_manager.get_working_dir(),
+                                      Strings.sitemap_shard_file.format(shard_number))
+            while os.path.exists(shard_path):
+                self._add_if_not_in(shard_path, True)
+                shard_number += 1
+                shard_path = os.path.join(self._config_manager.get_working_dir(),
+                                          Strings.sitemap_shard_file.format(shard_number))
 
         last_upload = self._config_manager.get_last_upload_date()
         if last_upload:
@@ -619,6 +715,7 @@ class UploadDialog(wx.Dialog):
         self._field_ip_port.SetValue(self._config_manager.get_ip_port())
         self._field_user.SetValue(self._config_manager.get_user())
         self._field_keyfile.SetValue(self._config_manager.get_keyfile())
+        self._precompress_checkbox.SetValue(self._config_manager.get_precompress())
         self.Enable()
         self._add_button.SetFocus()
 
@@ -649,58 +746,58 @@ class UploadDialog(wx.Dialog):
         try:
             if not self._field_ip_port.GetValue():
                 self._field_ip_port_tip.SetMessage(Strings.label_ip_port_tip)
-                Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
             elif len(ip_port) > 2 or len(ip_port) < 2 or not ip_port[0] or not ip_port[1]:
                 self._field_ip_port_tip.SetMessage(Strings.warning_incorrect_format)
-                Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
                 result = False
             elif int(ip_port[1]) < 1 or int(ip_port[1]) > 65535:
                 self._field_ip_port_tip.SetMessage(Strings.warning_incorrect_port)
-                Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
                 result = False
             ip = ip_port[0].split('.', 4)
             if len(ip) < 4 or len(ip) > 4 or not ip:
                 self._field_ip_port_tip.SetMessage(Strings.warning_incorrect_ip_format)
-                Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+                WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
                 result = False
             for num in ip:
                 if int(num) < 0 or int(num) > 255:
                     self._field_ip_port_tip.SetMessage(Strings.warning_incorrect_ip_format)
-                    Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+                    WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
                     result = False
         except ValueError as _:
             self._field_ip_port_tip.SetMessage(Strings.warning_incorrect_format)
-            Tools.set_field_background(self._field_ip_port, Numbers.RED_COLOR)
+            WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.RED_COLOR)
             result = False
         if result:
             self._field_ip_port_tip.SetMessage(Strings.label_ip_port_tip)
-            Tools.set_field_background(self._field_ip_port, Numbers.GREEN_COLOR)
+            WxAdapter.set_field_background(self._field_ip_port, GuiNumbers.GREEN_COLOR)
             self._config_manager.store_ip_port(self._field_ip_port.GetValue())
 
         # Check username
         username = self._field_user.GetValue()
         if len(username) > Numbers.default_max_length or len(username) < 1:
             self._field_user_tip.SetMessage(f'{Strings.seo_error_length}: 1-{Numbers.default_max_length}')
-            Tools.set_field_background(self._field_user, Numbers.RED_COLOR)
+            WxAdapter.set_field_background(self._field_user, GuiNumbers.RED_COLOR)
             result = False
         else:
             self._field_user_tip.SetMessage(Strings.label_user_tip)
-            Tools.set_field_background(self._field_user, Numbers.GREEN_COLOR)
+            WxAdapter.set_field_background(self._field_user, GuiNumbers.GREEN_COLOR)
             self._config_manager.store_user(self._field_user.GetValue())
 
         # Check keyfile existence
         key_path = self._field_keyfile.GetValue()
         if not os.path.exists(key_path) or not os.access(key_path, os.R_OK):
             self._field_keyfile_tip.SetMessage(Strings.warning_keyfile_inaccessible)
-            Tools.set_field_background(self._field_keyfile, Numbers.RED_COLOR)
+            WxAdapter.set_field_background(self._field_keyfile, GuiNumbers.RED_COLOR)
             result = False
         elif oct(stat.S_IMODE(os.stat(key_path).st_mode)) != oct(Numbers.private_key_permissions):
             self._field_keyfile_tip.SetMessage(Strings.warning_keyfile_permissions)
-            Tools.set_field_background(self._field_keyfile, Numbers.RED_COLOR)
+            WxAdapter.set_field_background(self._field_keyfile, GuiNumbers.RED_COLOR)
             result = False
         else:
             self._field_keyfile_tip.SetMessage(Strings.label_key_file_tip)
-            Tools.set_field_background(self._field_keyfile, Numbers.GREEN_COLOR)
+            WxAdapter.set_field_background(self._field_keyfile, GuiNumbers.GREEN_COLOR)
             self._config_manager.store_keyfile(self._field_keyfile.GetValue())
 
         if not result or self._count_checked_files() == 0 or self._prevent_upload:
@@ -731,7 +828,7 @@ class UploadDialog(wx.Dialog):
             self._file_list.CheckItem(index, True)
         else:
             self._file_list.SetItemData(index, -1)
-            self._file_list.SetItemBackgroundColour(index, Numbers.RED_COLOR)
+            self._file_list.SetItemBackgroundColour(index, GuiNumbers.RED_COLOR)
 
     def get_uploaded(self) -> List[str]:
         """
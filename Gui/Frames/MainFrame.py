@@ -4,38 +4,36 @@ import webbrowser
 import pendulum
 from pathlib import Path
 from shutil import copyfile
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Tuple, Set
 
-import httplib2
 import wx
 import wx.richtext as rt
 from wx.svg import SVGimage
 from wx.lib.agw.supertooltip import SuperToolTip
 
-from Constants.Constants import Numbers, Events
+from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
+from Constants.GuiConstants import Events
+from Constants.GuiConstants import GuiNumbers
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
-from Gui.Dialogs.AboutDialog import AboutDialog
-from Gui.Dialogs.AddImageDialog import AddImageDialog
-from Gui.Dialogs.AddLogoDialog import AddLogoDialog
-from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
-from Gui.Dialogs.EditDefaultValuesDialog import EditDefaultValuesDialog
-from Gui.Dialogs.EditMenuDialog import EditMenuDialog
-from Gui.Dialogs.EditMenuItemDialog import EditMenuItemDialog
-from Gui.Dialogs.NewFileDialog import NewFileDialog
-from Gui.Dialogs.PlainTextEditDialog import PlainTextEditDialog
-from Gui.Dialogs.RichTextSpellcheckerDialog import RichTextSpellCheckerDialog
-from Gui.Dialogs.SpellCheckSetupDialog import SpellCheckSetupDialog
-from Gui.Dialogs.SpellCheckerDialog import SpellCheckerDialog
-from Gui.Dialogs.UploadDialog import UploadDialog
+# Dialogs are imported in the methods that open them, so their dependencies like paramiko or PIL are only loaded when
+# the user needs them and do not slow down the start of the editor.
 from Gui.Panels.AsideImagePanel import AsideImagePanel
 from Gui.Panels.CustomRichText import CustomRichText
+from Gui.Panels.FileList import FileList
+from Gui.WxAdapter import WxAdapter
 from Resources.Fetch import Fetch
 from Threads.FileListThread import FileListThread
+from Threads.ImageVariantThread import ImageVariantThread
+from Threads.OnlineAuditThread import OnlineAuditThread
+from Threads.ReloadThread import ReloadThread
 from Threads.SavingThread import SavingThread
+from Threads.SeoTestThread import SeoTestThread
 from Threads.SitemapThread import SitemapThread
 from Threads.WorkerThread import WorkerThread
 from Tools.ConfigManager import ConfigManager
+from Tools.DirectoryLoader import DirectoryLoader
 from Tools.Document.AsideImage import AsideImage
 from Tools.Document.MenuItem import MenuItem
 from Tools.Document.WhitebearDocument import WhitebearDocument
@@ -43,6 +41,9 @@ from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
 from Tools.Document.WhitebearDocumentCSS import WhitebearDocumentCSS
 from Tools.Document.WhitebearDocumentIndex import WhitebearDocumentIndex
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
+from Tools.StartupProfiler import StartupProfiler
 from Tools.Tools import Tools
 
 
@@ -72,6 +73,10 @@ class MainFrame(wx.Frame):
             self._config_manager: ConfigManager = ConfigManager.get_instance()
         except PermissionError as e:
             self._show_error_dialog(f'{Strings.exception_conf_inaccessible}\n{e}')
+        self._profiler: StartupProfiler = StartupProfiler.get_instance()
+        self._profiler.mark('configuration loaded')
+        self._instrumentation: Instrumentation = Instrumentation.get_instance()
+        self._instrumentation.set_enabled(self._config_manager.get_instrumentation())
 
         self._tool_ids = []
         self._disableable_menu_items = []
@@ -85,6 +90,42 @@ class MainFrame(wx.Frame):
         self._no_save = False
         self._enabled = True
         self._saved_documents = []
+        # The sitemap is generated once all documents being saved are done, with the files that were rewritten.
+        self._pending_conversions = 0
+        self._rewritten_files: List[str] = []
+        # Background SEO test of the current document. Only the latest state is tested, requests that arrive while a
+        # test is running are coalesced into one.
+        self._seo_test_thread = None
+        self._seo_test_pending = False
+        # Incremented with every started or synchronous test and document switch, results of older tests are thrown away.
+        self._seo_generation = 0
+        self._seo_text_edited = False
+        self._seo_snapshot = {}
+        self._seo_test_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_seo_test_timer, self._seo_test_timer)
+        # Files changed by other programs are collected for a while and then reloaded together.
+        self._directory_loader = None
+        self._watcher = None
+        self._changed_files = set()
+        # The loaded documents are replaced while files are reloaded, background tests wait until the reload is done.
+        self._reloading = False
+        self._resume_online_audit = False
+        self._resume_image_variants = False
+        self._watcher_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_watcher_timer, self._watcher_timer)
+        self.Bind(wx.EVT_FSWATCHER, self._file_watcher_handler)
+        # Articles are shown in the file list while the directory is still loading. Whole site actions and saving wait
+        # until all articles are parsed, saves requested in the meantime are done when the load finishes.
+        self._directory_loading = False
+        self._pending_document = None
+        # Articles with unsaved changes when files changed on disk are reloaded, they are not replaced unconfirmed.
+        self._unsaved_articles: Dict[str, WhitebearDocumentArticle] = {}
+        self._deferred_saves: List[Tuple[List[WhitebearDocument], bool, bool]] = []
+        # Links and videos of all articles are tested online in the background after the directory is loaded.
+        self._online_audit_thread = None
+        # Other widths of thumbnails and webp and avif variants of thumbnails and menu logos are created in the
+        # background after the directory is loaded.
+        self._image_variant_thread = None
 
         self._search_term = None
         self._search_results: List[int] = []
@@ -98,6 +139,7 @@ class MainFrame(wx.Frame):
         self._bind_handlers()
         self._init_top_tool_bar()
         self._setup_main_text_area()
+        self._profiler.mark('widgets created')
 
         # Set minimal size of the frame on screen, smaller frame would squish GUI too much.
         self.SetMinClientSize(wx.Size(Numbers.minimal_window_size_width, Numbers.minimal_window_size_height))
@@ -107,17 +149,13 @@ class MainFrame(wx.Frame):
         self._set_status_text(Strings.status_loading, 3)
         # Find the last opened whitebear directory, switch config manager to it and load it.
         if self._config_manager.set_active_dir(self._config_manager.get_last_directory()):
-            h = httplib2.Http(timeout=Numbers.online_test_timeout)
-            try:
-                h.request(Strings.test_url, 'HEAD')
-            except (ConnectionResetError, OSError, httplib2.ServerNotFoundError) as _:
-                self._config_manager.store_online_test(False)
-            finally:
-                h.close()
-            self._load_working_directory(self._config_manager.get_working_dir())
+            # The internet connection is tested in the file list thread so that the window shows up immediately.
+            self._load_working_directory(self._config_manager.get_working_dir(), test_connection=True)
             # Load online test state.
             self._file_menu.Check(wx.ID_NETWORK, self._config_manager.get_online_test())
-            self._edit_menu.Check(Numbers.ID_SPELLCHECK_TEST, self._config_manager.get_spellcheck_test())
+            self._file_menu.Check(GuiNumbers.ID_VIDEO_FACADE, self._config_manager.get_video_facade())
+            self._file_menu.Check(GuiNumbers.ID_MINIFY, self._config_manager.get_minify())
+            self._edit_menu.Check(GuiNumbers.ID_SPELLCHECK_TEST, self._config_manager.get_spellcheck_test())
         else:
             self._disable_editor(True)
 
@@ -154,7 +192,7 @@ class MainFrame(wx.Frame):
                                                Strings.label_menu_item_new_hint)
         self._disableable_menu_items.append(self._file_menu_item_new)
 
-        self._file_menu_item_new_dir = wx.MenuItem(self._file_menu, Numbers.ID_NEW_DIR, Strings.label_menu_item_new_dir,
+        self._file_menu_item_new_dir = wx.MenuItem(self._file_menu, GuiNumbers.ID_NEW_DIR, Strings.label_menu_item_new_dir,
                                                    Strings.label_menu_item_new_dir_hint)
 
         self._file_menu_item_open = wx.MenuItem(self._file_menu, wx.ID_OPEN, Strings.label_menu_item_open,
@@ -176,12 +214,12 @@ class MainFrame(wx.Frame):
                                                  Strings.label_menu_item_page_setup_hint)
         self._disableable_menu_items.append(self._file_menu_item_setup)
 
-        self._file_menu_item_edit_menu = wx.MenuItem(self._file_menu, Numbers.ID_EDIT_MENU,
+        self._file_menu_item_edit_menu = wx.MenuItem(self._file_menu, GuiNumbers.ID_EDIT_MENU,
                                                      Strings.label_menu_item_edit_menu,
                                                      Strings.label_menu_item_edit_menu_hint)
         self._disableable_menu_items.append(self._file_menu_item_edit_menu)
 
-        self._file_menu_item_export_all = wx.MenuItem(self._file_menu, Numbers.ID_EXPORT_ALL,
+        self._file_menu_item_export_all = wx.MenuItem(self._file_menu, GuiNumbers.ID_EXPORT_ALL,
                                                       Strings.label_menu_item_export_all,
                                                       Strings.label_menu_item_export_all_hint)
         self._disableable_menu_items.append(self._file_menu_item_export_all)
@@ -192,11 +230,11 @@ class MainFrame(wx.Frame):
 
         recent = wx.Menu()
         # Special None item that is always disabled.
-        none_item = wx.MenuItem(recent, Numbers.ID_NONE_ITEM, Strings.label_none)
+        none_item = wx.MenuItem(recent, GuiNumbers.ID_NONE_ITEM, Strings.label_none)
         last_open = self._config_manager.get_all_directories()
         if not last_open:
             recent.Append(none_item)
-            recent.Enable(Numbers.ID_NONE_ITEM, False)
+            recent.Enable(GuiNumbers.ID_NONE_ITEM, False)
         else:
             for directory in last_open:
                 dir_item = wx.MenuItem(recent, wx.ID_ANY, directory)
@@ -222,6 +260,10 @@ class MainFrame(wx.Frame):
         self._file_menu.AppendSeparator()
         self._file_menu.AppendCheckItem(wx.ID_NETWORK, Strings.label_menu_item_online_test,
                                         Strings.label_menu_item_online_test_hint)
+        self._file_menu.AppendCheckItem(GuiNumbers.ID_VIDEO_FACADE, Strings.label_menu_item_video_facade,
+                                        Strings.label_menu_item_video_facade_hint)
+        self._file_menu.AppendCheckItem(GuiNumbers.ID_MINIFY, Strings.label_menu_item_minify,
+                                        Strings.label_menu_item_minify_hint)
 
         # Edit menu ----------------------------------------------------------------------------------------------------
         self._edit_menu_item_undo = wx.MenuItem(self._edit_menu, wx.ID_UNDO, Strings.label_menu_item_undo,
@@ -251,11 +293,11 @@ class MainFrame(wx.Frame):
                                                             Strings.label_menu_item_spellcheck_setup,
                                                             Strings.label_menu_item_spellcheck_setup_hint)
         self._disableable_menu_items.append(self._edit_menu_item_spellcheck_setup)
-        self._edit_menu_item_edit_robots = wx.MenuItem(self._edit_menu, Numbers.ID_EDIT_ROBOTS,
+        self._edit_menu_item_edit_robots = wx.MenuItem(self._edit_menu, GuiNumbers.ID_EDIT_ROBOTS,
                                                        Strings.label_menu_item_edit_robots,
                                                        Strings.label_menu_item_edit_robots_hint)
         self._disableable_menu_items.append(self._edit_menu_item_edit_robots)
-        self._edit_menu_item_edit_css = wx.MenuItem(self._edit_menu, Numbers.ID_EDIT_CSS,
+        self._edit_menu_item_edit_css = wx.MenuItem(self._edit_menu, GuiNumbers.ID_EDIT_CSS,
                                                     Strings.label_menu_item_edit_css,
                                                     Strings.label_menu_item_edit_css_hint)
         self._disableable_menu_items.append(self._edit_menu_item_edit_css)
@@ -268,7 +310,7 @@ class MainFrame(wx.Frame):
         self._edit_menu.Append(self._edit_menu_item_paste)
         self._edit_menu.Append(self._edit_menu_item_select_all)
         self._edit_menu.AppendSeparator()
-        self._edit_menu.AppendCheckItem(Numbers.ID_SPELLCHECK_TEST, Strings.label_menu_item_spelling_test,
+        self._edit_menu.AppendCheckItem(GuiNumbers.ID_SPELLCHECK_TEST, Strings.label_menu_item_spelling_test,
                                         Strings.label_menu_item_spelling_test_hint)
         self._edit_menu.Append(self._edit_menu_item_spellcheck)
         self._edit_menu.Append(self._edit_menu_item_spellcheck_setup)
@@ -280,11 +322,11 @@ class MainFrame(wx.Frame):
         self._add_menu_item_add_image = wx.MenuItem(self._add_menu, wx.ID_ADD, Strings.label_menu_item_add_text_image,
                                                     Strings.label_menu_item_add_text_image_hint)
         self._disableable_menu_items.append(self._add_menu_item_add_image)
-        self._add_menu_item_add_logo = wx.MenuItem(self._add_menu, Numbers.ID_MENU_LOGO,
+        self._add_menu_item_add_logo = wx.MenuItem(self._add_menu, GuiNumbers.ID_MENU_LOGO,
                                                    Strings.label_menu_item_add_logo,
                                                    Strings.label_menu_item_add_logo_hint)
         self._disableable_menu_items.append(self._add_menu_item_add_logo)
-        self._add_menu_item_side_image = wx.MenuItem(self._add_menu, Numbers.ID_SIDE_IMAGE,
+        self._add_menu_item_side_image = wx.MenuItem(self._add_menu, GuiNumbers.ID_SIDE_IMAGE,
                                                      Strings.label_menu_item_add_side_image,
                                                      Strings.label_menu_item_add_side_image_hint)
         self._disableable_menu_items.append(self._add_menu_item_side_image)
@@ -298,6 +340,12 @@ class MainFrame(wx.Frame):
         self._help_menu_item_about = wx.MenuItem(self._help_menu, wx.ID_ABOUT, Strings.label_menu_item_about,
                                                  Strings.label_menu_item_about_hint)
         self._help_menu.Append(self._help_menu_item_about)
+        self._help_menu.AppendSeparator()
+        self._help_menu.AppendCheckItem(GuiNumbers.ID_STATISTICS, Strings.label_menu_item_statistics,
+                                        Strings.label_menu_item_statistics_hint)
+        self._help_menu.Check(GuiNumbers.ID_STATISTICS, self._instrumentation.is_enabled())
+        self._help_menu.Append(GuiNumbers.ID_SAVE_STATISTICS, Strings.label_menu_item_save_statistics,
+                               Strings.label_menu_item_save_statistics_hint)
 
         self.SetMenuBar(self._menu_bar)
 
@@ -394,7 +442,7 @@ class MainFrame(wx.Frame):
         """
         if event.IsChecked():
             self._current_document_instance.set_enabled(True)
-            self._public_checkbox.SetForegroundColour(Numbers.DARK_GREEN_COLOR)
+            self._public_checkbox.SetForegroundColour(GuiNumbers.DARK_GREEN_COLOR)
         else:
             self._current_document_instance.set_enabled(False)
             self._public_checkbox.SetForegroundColour(wx.RED)
@@ -552,8 +600,7 @@ class MainFrame(wx.Frame):
         # File list section --------------------------------------------------------------------------------------------
         self._style_picker = wx.ListBox(self._left_panel, -1, size=(-1, 127))
         self._style_sizer.Add(self._style_picker, 1, flag=wx.EXPAND)
-        self._file_list = wx.ListCtrl(self._left_panel, -1, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.LC_HRULES)
-        self._file_list.SetFont(self.small_font)
+        self._file_list = FileList(self._left_panel, self.small_font, self.bold_small_font)
         self._filelist_column_sizer.Add(self._style_sizer, flag=wx.EXPAND, border=Numbers.widget_border_size)
         # Add the list into the bottom sizer, give it a sizing weight and let it expand vertically
         self._filelist_column_sizer.Add(self._file_list, flag=wx.EXPAND, border=Numbers.widget_border_size,
@@ -577,7 +624,7 @@ class MainFrame(wx.Frame):
         # Add text boxes
         self._field_article_date = wx.TextCtrl(self._right_panel, -1, value=Strings.label_article_date,
                                                size=wx.Size(160, 30))
-        self._field_article_date_tip = Tools.get_warning_tip(self._field_article_date, Strings.label_article_date)
+        self._field_article_date_tip = WxAdapter.get_warning_tip(self._field_article_date, Strings.label_article_date)
 
         self._field_article_name = wx.TextCtrl(self._right_panel, -1, value=Strings.label_article_title,
                                                size=wx.Size(-1, 43))
@@ -585,16 +632,16 @@ class MainFrame(wx.Frame):
         font.SetWeight(wx.FONTWEIGHT_BOLD)
         font.SetPointSize(Numbers.main_heading_size)
         self._field_article_name.SetFont(font)
-        self._field_article_name_tip = Tools.get_warning_tip(self._field_article_name, Strings.label_article_title)
+        self._field_article_name_tip = WxAdapter.get_warning_tip(self._field_article_name, Strings.label_article_title)
 
         self._field_article_keywords = wx.TextCtrl(self._right_panel, -1, value=Strings.label_article_keywords,
                                                    size=wx.Size(-1, 30))
-        self._field_article_keywords_tip = Tools.get_warning_tip(self._field_article_keywords,
+        self._field_article_keywords_tip = WxAdapter.get_warning_tip(self._field_article_keywords,
                                                                  Strings.label_article_keywords)
 
         self._field_article_description = wx.TextCtrl(self._right_panel, -1, value=Strings.label_article_description,
                                                       size=wx.Size(-1, 60), style=wx.TE_MULTILINE)
-        self._field_article_description_tip = Tools.get_warning_tip(self._field_article_description,
+        self._field_article_description_tip = WxAdapter.get_warning_tip(self._field_article_description,
                                                                     Strings.label_article_description)
 
         date_keywords_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -669,9 +716,13 @@ class MainFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self._new_dir_handler, self._file_menu_item_new_dir)
         self.Bind(wx.EVT_MENU, self._upload_handler, self._file_menu_item_upload)
         self.Bind(wx.EVT_MENU, self._online_test_handler, id=wx.ID_NETWORK)
-        self.Bind(wx.EVT_MENU, self._spellcheck_test_handler, id=Numbers.ID_SPELLCHECK_TEST)
-        self.Bind(wx.EVT_MENU, self._edit_text_file_handler, id=Numbers.ID_EDIT_ROBOTS)
-        self.Bind(wx.EVT_MENU, self._edit_text_file_handler, id=Numbers.ID_EDIT_CSS)
+        self.Bind(wx.EVT_MENU, self._video_facade_handler, id=GuiNumbers.ID_VIDEO_FACADE)
+        self.Bind(wx.EVT_MENU, self._minify_handler, id=GuiNumbers.ID_MINIFY)
+        self.Bind(wx.EVT_MENU, self._spellcheck_test_handler, id=GuiNumbers.ID_SPELLCHECK_TEST)
+        self.Bind(wx.EVT_MENU, self._edit_text_file_handler, id=GuiNumbers.ID_EDIT_ROBOTS)
+        self.Bind(wx.EVT_MENU, self._edit_text_file_handler, id=GuiNumbers.ID_EDIT_CSS)
+        self.Bind(wx.EVT_MENU, self._statistics_handler, id=GuiNumbers.ID_STATISTICS)
+        self.Bind(wx.EVT_MENU, self._save_statistics_handler, id=GuiNumbers.ID_SAVE_STATISTICS)
 
         # Bind other controls clicks
         self.Bind(wx.EVT_LIST_ITEM_SELECTED, self._list_item_click_handler, self._file_list)
@@ -737,7 +788,7 @@ class MainFrame(wx.Frame):
         self.Enable()
         if state:
             # Disabling the editor (disable editor True)
-            self._main_text_area.SetBackgroundColour(Numbers.LIGHT_GREY_COLOR)
+            self._main_text_area.SetBackgroundColour(GuiNumbers.LIGHT_GREY_COLOR)
             if not leave_files:
                 self._split_screen.Disable()
                 self._file_list.SetBackgroundColour(wx.LIGHT_GREY)
@@ -764,7 +815,9 @@ class MainFrame(wx.Frame):
         # Disable menu items
         self._public_checkbox.Enable(not state)
         self._file_menu.Enable(wx.ID_NETWORK, not state)
-        self._edit_menu.Enable(Numbers.ID_SPELLCHECK_TEST, not state)
+        self._file_menu.Enable(GuiNumbers.ID_VIDEO_FACADE, not state)
+        self._file_menu.Enable(GuiNumbers.ID_MINIFY, not state)
+        self._edit_menu.Enable(GuiNumbers.ID_SPELLCHECK_TEST, not state)
         menu_items_to_disable = []
         menu_items_to_disable.extend(self._disableable_menu_items)
         if all_menu:
@@ -780,14 +833,22 @@ class MainFrame(wx.Frame):
             self._file_menu_item_new.Enable(True)
             self._file_menu_item_edit_menu.Enable(True)
             self.tool_bar.EnableTool(wx.ID_NEW, True)
+        if self._directory_loading:
+            # These need all articles of the directory or would start another load.
+            for menu_item in (self._file_menu_item_new, self._file_menu_item_upload, self._file_menu_item_setup,
+                              self._file_menu_item_edit_menu, self._file_menu_item_export_all,
+                              self._file_menu_item_delete, self._file_menu_item_open, self._file_menu_item_new_dir):
+                menu_item.Enable(False)
+            self.tool_bar.EnableTool(wx.ID_NEW, False)
         self.Refresh()
         self.Layout()
         self.Update()
 
-    def _load_working_directory(self, path: str) -> None:
+    def _load_working_directory(self, path: str, test_connection: bool = False) -> None:
         """
         Load a working directory into the editor.
         :param path: str, path to the working directory
+        :param test_connection: Turn off the online test before loading if there is no internet connection.
         :return: None
         """
         self._loading_screen_on(True)
@@ -796,7 +857,9 @@ class MainFrame(wx.Frame):
         self._set_status_text(Strings.status_loading, 3)
         self._set_status_text(f'Work dir: {path}', 1)
         self._set_status_text(Strings.status_ready, 0)
-        file_list_thread = FileListThread(self, str(path))
+        self._stop_online_audit()
+        self._stop_image_variants()
+        file_list_thread = FileListThread(self, str(path), test_connection)
         file_list_thread.start()
 
     def on_filelist_load_fail(self, path: str, e: Exception) -> None:
@@ -807,6 +870,8 @@ class MainFrame(wx.Frame):
         :param e: Exception that caused the call of this method.
         :return: None
         """
+        self._directory_loading = False
+        self._deferred_saves.clear()
         self._loading_screen_on(False)
         self._show_error_dialog(str(e))
         self._disable_editor(state=True, all_menu=False)
@@ -834,57 +899,98 @@ class MainFrame(wx.Frame):
         self._css_document = css
         css_colors = css.get_colors()
         for name, color in css_colors.items():
-            self._create_color_tool(name, self.tool_bar, color)
+            self._create_color_tool(name, self.tool_bar, WxAdapter.css_color(color))
         self._init_toolbar_controls()
 
+    def on_filelist_started(self, menus: Dict[str, WhitebearDocumentMenu], index: WhitebearDocumentIndex,
+                            loader: DirectoryLoader) -> None:
+        """
+        Prepare the empty file list once the menus and the index are loaded. Articles are added by on_filelist_batch
+        as they are parsed and the load is finished by on_filelist_loaded.
+        :param menus: Dictionary of file names and documents of article pages {file name, WhitebearDocumentMenu, ...}
+        :param index: WhitebearDocumentIndex instance.
+        :param loader: The directory loader that owns the documents, it is used to reload files changed on disk.
+        :return: None
+        """
+        self._directory_loading = True
+        self._pending_document = self._config_manager.get_last_document()
+        self._articles = {}
+        self._menus = menus
+        self._index_document = index
+        self._directory_loader = loader
+        self._clear_editor(leave_files=False)
+        self._file_list.set_documents(self._articles)
+        self._set_status_text(Strings.status_loading, 3)
+        self._loading_screen_on(False)
+        self._disable_editor(True, leave_files=True)
+
+    def on_filelist_batch(self, documents: List[WhitebearDocumentArticle]) -> None:
+        """
+        Add a batch of parsed articles into the file list. The last opened document is opened as soon as it arrives.
+        :param documents: The parsed articles.
+        :return: None
+        """
+        if not self._directory_loading:
+            # The load failed or another directory is being loaded.
+            return
+        unuploaded = self._config_manager.get_not_uploaded()
+        for doc in documents:
+            self._articles[doc.get_filename()] = doc
+            if doc.get_filename() in unuploaded:
+                self._mark_not_uploaded(doc)
+        self._file_list.add_documents(doc.get_filename() for doc in documents)
+        self._set_status_text(f'{Strings.status_articles} {(len(self._articles))}', 2)
+        if self._pending_document in self._articles:
+            # Select last used document.
+            self._file_list.Select(self._file_list.find_row(self._pending_document))
+            self._pending_document = None
+
     def on_filelist_loaded(self, documents: Dict[str, WhitebearDocumentArticle],
-                           menus: Dict[str, WhitebearDocumentMenu], index: WhitebearDocumentIndex) -> None:
+                           menus: Dict[str, WhitebearDocumentMenu], index: WhitebearDocumentIndex,
+                           loader: DirectoryLoader) -> None:
         """
-        This method fills up the left side page file list and is called when the FileListThread finishes.
+        This method finishes the load of a directory and is called when the FileListThread finishes. All articles are
+        already in the file list.
         :param documents: Dictionary of file names and documents of article pages {file name, WhitebearDocument, ...}
         :param menus: Dictionary of file names and documents of article pages {file name, WhitebearDocumentMenu, ...}
         :param index: WhitebearDocumentIndex instance.
+        :param loader: The directory loader that owns the documents, it is used to reload files changed on disk.
         :return: None
         """
-        self._disable_editor(True, leave_files=True)
+        self._directory_loading = False
+        # The loader keeps its dictionaries up to date when files are reloaded.
         self._articles = documents
+        self._file_list.set_documents(self._articles)
         self._menus = menus
+        self._directory_loader = loader
+        self._index_document = index
+        if self._file_list.GetFirstSelected() != wx.NOT_FOUND:
+            self._disable_editor(False)
+        else:
+            self._disable_editor(True, leave_files=True)
         if not menus:
             self._file_menu_item_new.Enable(False)
             self.tool_bar.EnableTool(wx.ID_NEW, False)
             self._file_menu_item_edit_menu.Enable(True)
-        self._index_document = index
-        self._clear_editor(leave_files=False)
-        unuploaded = self._config_manager.get_not_uploaded()
-        for document_name in sorted(list(self._articles), reverse=True):
-            if document_name in unuploaded:
-                # Set blue color to documents have been modified but not uploaded yet.
-                self._articles[document_name].set_modified(True)
-                self._articles[document_name].set_saved(True)
-                self._articles[document_name].set_uploaded(False)
-                # Set html code to something not False because at this point we have the final html on disk.
-                self._articles[document_name].set_html('current html on disk')
-                # Rerun self test because document attributes were changed.
-                self._articles[document_name].test_self(self._config_manager.get_online_test())
-            self._file_list.InsertItem(0, document_name)
-            self._update_file_color(0)
-
-        # Select last used document
-        last_document = self._config_manager.get_last_document()
-        if last_document:
-            index = self._file_list.FindItem(0, last_document)
-            if index > -1:
-                self._file_list.Select(index)
-            else:
-                self._loading_screen_on(False)
-                self._show_error_dialog(f'{Strings.warning_last_document_not_found}:\n{last_document}')
-                self._clear_editor(leave_files=True)
+        # The file list thread may have turned off the online test.
+        self._file_menu.Check(wx.ID_NETWORK, self._config_manager.get_online_test())
+        self._file_menu.Check(GuiNumbers.ID_VIDEO_FACADE, self._config_manager.get_video_facade())
+        self._file_menu.Check(GuiNumbers.ID_MINIFY, self._config_manager.get_minify())
+
+        if self._pending_document:
+            self._show_error_dialog(f'{Strings.warning_last_document_not_found}:\n{self._pending_document}')
+            self._pending_document = None
 
         os.chdir(self._config_manager.get_working_dir())
+        self._watch_working_directory(self._config_manager.get_working_dir())
         # Enable GUI when the load is done
         self._set_status_text(Strings.status_ready, 3)
         self._set_status_text(f'{Strings.status_articles} {(len(self._articles))}', 2)
-        self._loading_screen_on(False)
+        self._start_online_audit()
+        self._start_image_variants()
+        for save_list, save_as, disable in self._deferred_saves:
+            self._save(save_list, save_as, disable)
+        self._deferred_saves.clear()
 
         # Store this as last known open directory.
         self._config_manager.store_working_dir(self._index_document.get_working_directory())
@@ -892,6 +998,7 @@ class MainFrame(wx.Frame):
             # Check that no default values are missing.
             self._show_error_dialog(Strings.exception_default_value_not_set)
             # Open defaults dialog if anything is missing.
+            from Gui.Dialogs.EditDefaultValuesDialog import EditDefaultValuesDialog
             dlg = EditDefaultValuesDialog(self, no_cancel=True)
             dlg.ShowModal()
             dlg.Destroy()
@@ -912,7 +1019,7 @@ class MainFrame(wx.Frame):
         :return:
         """
         tool: wx.ToolBarToolBase = self.tool_bar.FindById(evt.GetId())
-        color = self._css_document.translate_str_color(tool.GetShortHelp())
+        color = WxAdapter.css_color(self._css_document.translate_str_color(tool.GetShortHelp()))
         self._main_text_area: CustomRichText
         if self._main_text_area.HasSelection():
             self._main_text_area.BeginBatchUndo(Strings.undo_last_action)
@@ -995,15 +1102,23 @@ class MainFrame(wx.Frame):
         save_list.append(self._index_document)
         self._save(save_list, False, disable)
 
-    def _save_sitemap(self, disable: bool) -> None:
+    def _save_sitemap(self, rewritten: List[str], disable: bool) -> None:
         """
         Generate and save a sitemap of the current pages.
+        :param rewritten: File names of the documents whose files were just written, their last modification is now.
         :param disable: Leave the editor disabled after threads finish.
         :return: None
         """
-        pages = [Strings.index + Strings.extension_html, Strings.birds + Strings.extension_html]
-        pages.extend(list(self._articles))
-        pages.extend(list(self._menus))
+        # Unknown modification times are 0, the generator uses the modification time of the file on disk then.
+        pages = {Strings.index + Strings.extension_html: 0, Strings.birds + Strings.extension_html: 0}
+        for name, article in self._articles.items():
+            pages[name] = article.get_computable_date()
+        for name in self._menus:
+            pages[name] = 0
+        now = pendulum.now().float_timestamp
+        for name in rewritten:
+            if name in pages:
+                pages[name] = now
         sitemap_thread = SitemapThread(self, pages, self._config_manager.get_working_dir(), disable)
         sitemap_thread.start()
 
@@ -1014,11 +1129,16 @@ class MainFrame(wx.Frame):
         :param disable: Leave the editor disabled after threads finish.
         :return: None.
         """
+        if self._directory_loading:
+            # The menus and the index can not be saved before all their articles are parsed.
+            self._deferred_saves.append((save_list, save_as, disable))
+            self._set_status_text(Strings.status_loading, 3)
+            return
         if self._enabled:
             # Editor will be enabled when all threads finish.
             self._disable_editor(True)
 
-        self._save_sitemap(disable)
+        self._pending_conversions += len(save_list)
         saving_thread = SavingThread(self, save_list, save_as, disable)
         saving_thread.start()
 
@@ -1045,13 +1165,28 @@ class MainFrame(wx.Frame):
             if not os.access(file_path, os.R_OK) or not os.access(file_path, os.W_OK):
                 self._show_error_dialog(f'{Strings.warning_can_not_save}\n{Strings.exception_access_html}\n{file_path}')
                 self._disable_editor(False)
+                self._conversion_finished(disable)
                 return
         if save_as:
             file_path = self._get_new_file_path(suffix)
-        if file_path:
+        if file_path and Tools.is_same_content(file_path, html_string.encode('utf-8')):
+            # Keep the file and its modification time so that it is not uploaded again.
+            self._set_status_text(f'{Strings.status_unchanged}: {file_name}', 3)
+            if isinstance(doc, WhitebearDocumentArticle) and file_name not in self._config_manager.get_not_uploaded():
+                # The same html is already online.
+                doc.set_uploaded(True)
+                doc.set_modified(False)
+                with doc.get_test_lock():
+                    doc.test_self(changed_only=True)
+        elif file_path:
             try:
                 with open(file_path, 'w', encoding='utf-8') as file:
                     file.write(html_string)
+                self._rewritten_files.append(file_name)
+                if isinstance(doc, WhitebearDocumentArticle):
+                    # Save the fact that this file is changed into the list of file that we need to upload. This
+                    # survives editor exit and can be restored on start. This list is cleared when a file is uploaded.
+                    self._config_manager.store_not_uploaded(file_name)
             except IOError:
                 self._show_error_dialog(f'{Strings.warning_can_not_save}\n{Strings.exception_access_html}\n{file_path}')
             self._set_status_text(f'{Strings.label_saving}: {file_name}', 3)
@@ -1059,13 +1194,14 @@ class MainFrame(wx.Frame):
         if isinstance(doc, WhitebearDocumentArticle):
             # This is used after all threads are done to update the color of all saved documents.
             self._saved_documents.append(doc)
+            self._directory_loader.get_dependency_graph().update_article(doc)
         # The last thread is the main thread.
-        if threading.active_count() == 1:
+        if self._saving_threads_finished():
             for doc in self._saved_documents:
                 # Update file color on all saved once all threads are done. Menu saving thread runs self test on all
                 # documents in that menu. Updating color while threads are still running sometimes breaks colors
                 # because of concurrent run.
-                self._update_file_color(self._file_list.FindItem(-1, doc.get_filename()))
+                self._update_file_color(self._file_list.find_row(doc.get_filename()))
             self._update_file_status_description(self._current_document_instance)
             self._saved_documents.clear()
             if not disable:
@@ -1073,31 +1209,60 @@ class MainFrame(wx.Frame):
                 self._disable_editor(False)
             if file_path:
                 self._set_status_text(f'{Strings.status_saved}: {last_save}', 3)
+        self._conversion_finished(disable)
 
-    def on_sitemap_done(self, sitemap: str, disable: bool) -> None:
+    def _conversion_finished(self, disable: bool) -> None:
         """
-        :param sitemap: The sitemap xml as string.
+        Count a saved or failed document and generate the sitemap when the last document being saved is done. Only the
+        documents whose files were rewritten get a new modification time, unchanged files keep theirs.
+        :param disable: Leave the editor disabled after threads finish.
+        :return: None
+        """
+        self._pending_conversions -= 1
+        if self._pending_conversions == 0:
+            self._save_sitemap(self._rewritten_files, disable)
+            self._rewritten_files = []
+
+    def on_sitemap_done(self, files: List[str], disable: bool) -> None:
+        """
+        Called when SitemapThread finishes writing the sitemap. Creates robots.txt if it is not present.
+        :param files: List of sitemap file names that were written.
         :param disable: Leave the editor disabled after threads finish.
         :return: None
         """
-        sitemap_file = os.path.join(self._config_manager.get_working_dir(), Strings.sitemap_file)
         robots_txt = os.path.join(self._config_manager.get_working_dir(), Strings.robots_file)
         last_save = pendulum.now().to_time_string()
+        self._set_status_text(f'{Strings.status_saved}: {last_save}', 3)
+        self._set_status_text(f'{Strings.label_saving}: {", ".join(files)}', 3)
         try:
-            # Save sitemap
-            with open(sitemap_file, 'w', encoding='utf-8') as file:
-                file.write(sitemap)
-                self._set_status_text(f'{Strings.status_saved}: {last_save}', 3)
-                self._set_status_text(f'{Strings.label_saving}: {Strings.sitemap_file}', 3)
             # Save robots.txt if not present
             if not os.path.exists(robots_txt):
                 with open(robots_txt, 'w', encoding='utf-8') as file:
                     file.write(f'{Strings.sitemap_keyword} {self._config_manager.get_url()}/{Strings.sitemap_file}')
                     self._set_status_text(f'{Strings.label_saving}: {Strings.robots_file}', 3)
         except IOError:
-            self._show_error_dialog(f'{Strings.warning_can_not_save}\n{Strings.exception_access_html}\n{sitemap_file}')
+            self._show_error_dialog(f'{Strings.warning_can_not_save}\n{Strings.exception_access_html}\n{robots_txt}')
+        self._on_sitemap_finished(disable)
+
+    def on_sitemap_fail(self, e: Exception, disable: bool) -> None:
+        """
+        Called when SitemapThread fails to write the sitemap.
+        :param e: The exception that was raised.
+        :param disable: Leave the editor disabled after threads finish.
+        :return: None
+        """
+        sitemap_file = os.path.join(self._config_manager.get_working_dir(), Strings.sitemap_file)
+        self._show_error_dialog(f'{Strings.warning_can_not_save}\n{Strings.exception_access_html}\n{sitemap_file}\n{e}')
+        self._on_sitemap_finished(disable)
+
+    def _on_sitemap_finished(self, disable: bool) -> None:
+        """
+        Enable the editor if the sitemap thread was the last one running.
+        :param disable: Leave the editor disabled after threads finish.
+        :return: None
+        """
         # The last thread is the main thread.
-        if threading.active_count() == 1 and not disable:
+        if self._saving_threads_finished() and not disable:
             # Enable only when all threads have finished.
             self._disable_editor(False)
 
@@ -1128,6 +1293,7 @@ class MainFrame(wx.Frame):
         """
         self._show_error_dialog(f'{Strings.warning_can_not_save}\n\n{e}')
         self._disable_editor(False)
+        self._conversion_finished(False)
 
     # noinspection PyUnusedLocal
     def _main_image_handler(self, event: wx.CommandEvent) -> None:
@@ -1136,6 +1302,7 @@ class MainFrame(wx.Frame):
         :param event: Not used
         :return: None
         """
+        from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
         main_image: AsideImage = self._current_document_instance.get_article_image()
         edit_dialog = EditAsideImageDialog(self, main_image, self._current_document_instance.get_working_directory())
         edit_dialog.ShowModal()
@@ -1151,6 +1318,7 @@ class MainFrame(wx.Frame):
         :param event: Not used
         :return: None
         """
+        from Gui.Dialogs.EditMenuItemDialog import EditMenuItemDialog
         menu_item: MenuItem = self._current_document_instance.get_menu_item()
         edit_dialog = EditMenuItemDialog(self, menu_item, self._current_document_instance.get_working_directory())
         # We first need to show the dialog so that the name label can calculate it's size and then switch to modal.
@@ -1180,7 +1348,15 @@ class MainFrame(wx.Frame):
             # Store last selected document
             selected_page = self._file_list.GetFirstSelected()
             if selected_page != wx.NOT_FOUND:
-                self._config_manager.store_last_open_document(self._file_list.GetItemText(selected_page, 0))
+                self._config_manager.store_last_open_document(self._file_list.get_name(selected_page))
+            self._stop_online_audit()
+            self._stop_image_variants()
+            if self._instrumentation.is_enabled():
+                try:
+                    self._instrumentation.dump()
+                except OSError as _:
+                    # Statistics are not important enough to prevent the editor from closing.
+                    pass
             for doc in self._articles.values():
                 doc: WhitebearDocumentArticle
                 if doc.is_modified() and not doc.is_saved():
@@ -1237,6 +1413,7 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.AboutDialog import AboutDialog
         AboutDialog(self)
 
     # noinspection PyUnusedLocal
@@ -1265,8 +1442,7 @@ class MainFrame(wx.Frame):
         placeholder_main_image.Replace(0, 0, 0, 245, 255, 255)
         self._main_image_button.SetBitmap(wx.Bitmap(placeholder_main_image))
         if not leave_files:
-            self._file_list.ClearAll()
-            self._file_list.InsertColumn(0, Strings.label_filelist, format=wx.LIST_FORMAT_LEFT)
+            self._file_list.clear()
             self._file_list.SetColumnWidth(0, self._left_panel.GetSize()[0])
         self._side_photo_panel.clear_panel()
         self._main_text_area.clear_self()
@@ -1278,10 +1454,14 @@ class MainFrame(wx.Frame):
         self._field_article_keywords.SetValue(Strings.label_article_keywords)
         self._field_article_name.SetBackgroundColour(wx.WHITE)
         self._field_article_date.SetBackgroundColour(wx.WHITE)
-        Tools.set_field_background(self._field_article_description, wx.WHITE)
+        WxAdapter.set_field_background(self._field_article_description, wx.WHITE)
         self._field_article_keywords.SetBackgroundColour(wx.WHITE)
         self._set_status_text(Strings.status_ready, 0)
         self._set_status_text(Strings.status_ready, 3)
+        # Forget the results of the background test, they belong to the previous document.
+        self._seo_test_timer.Stop()
+        self._seo_generation += 1
+        self._seo_snapshot = {}
         self._ignore_change = False
 
     def _list_item_click_handler(self, event):
@@ -1296,7 +1476,7 @@ class MainFrame(wx.Frame):
             self._save_current_doc(confirm=True)
 
         self._disable_editor(True)
-        self._current_document_name = event.GetText()
+        self._current_document_name = self._file_list.get_name(event.GetIndex())
         self._current_document_instance: WhitebearDocumentArticle = self._articles[
             self._current_document_name]
         try:
@@ -1323,7 +1503,8 @@ class MainFrame(wx.Frame):
         self._file_menu_item_delete.Enable(True)
         # If the document is correct, now we can show it.
         # Do not do online test, this slows down load.
-        self._current_document_instance.test_self()
+        with self._current_document_instance.get_test_lock():
+            self._current_document_instance.test_self()
         self._fill_editor(self._current_document_instance)
 
     def _fill_editor(self, doc: WhitebearDocumentArticle) -> None:
@@ -1333,6 +1514,10 @@ class MainFrame(wx.Frame):
         :return: None
         """
         self._ignore_change = True
+        # The next background test result of this document has to be applied in full.
+        self._seo_test_timer.Stop()
+        self._seo_generation += 1
+        self._seo_snapshot = {}
         self._update_file_color()
         self._update_file_status_description(doc)
 
@@ -1346,16 +1531,16 @@ class MainFrame(wx.Frame):
             tip = value[1]
             if value[0][1]:
                 if value[0][1] == Strings.status_ok:
-                    Tools.set_field_background(field, Numbers.GREEN_COLOR)
+                    WxAdapter.set_field_background(field, GuiNumbers.GREEN_COLOR)
                 else:
-                    Tools.set_field_background(field, Numbers.RED_COLOR)
+                    WxAdapter.set_field_background(field, GuiNumbers.RED_COLOR)
                 tip.SetMessage(f'{Strings.seo_check}\n{value[0][1]}')
                 tip.EnableTip(True)
             field.SetValue(value[0][0])
 
         # Set main image
-        self._main_image_button.SetBitmap(wx.Bitmap(doc.get_article_image().get_image()))
-        self._menu_logo_button.SetBitmap(wx.Bitmap(doc.get_menu_item().get_image()))
+        self._main_image_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(doc.get_article_image())))
+        self._menu_logo_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(doc.get_menu_item())))
 
         # Set aside images
         self._side_photo_panel.load_document_images(doc)
@@ -1377,7 +1562,7 @@ class MainFrame(wx.Frame):
             self._public_checkbox.SetForegroundColour(wx.RED)
         else:
             self._public_checkbox.SetValue(True)
-            self._public_checkbox.SetForegroundColour(Numbers.DARK_GREEN_COLOR)
+            self._public_checkbox.SetForegroundColour(GuiNumbers.DARK_GREEN_COLOR)
 
         # Clear any search terms.
         self._text_changed = True
@@ -1412,7 +1597,7 @@ class MainFrame(wx.Frame):
             self._update_field_color(self._field_article_date, self._field_article_date_tip,
                                      self._current_document_instance.seo_test_date)
             self._current_document_instance.set_date(self._field_article_date.GetValue())
-            self._update_seo_colors()
+            self._request_seo_test()
 
     # noinspection PyUnusedLocal
     def _handle_keywords_change(self, event: wx.CommandEvent) -> None:
@@ -1426,7 +1611,7 @@ class MainFrame(wx.Frame):
                                      self._current_document_instance.seo_test_keywords)
             keywords_list = [word.strip() for word in self._field_article_keywords.GetValue().split(',')]
             self._current_document_instance.set_keywords(keywords_list)
-            self._update_seo_colors()
+            self._request_seo_test()
 
     # noinspection PyUnusedLocal
     def _handle_description_change(self, event: wx.CommandEvent) -> None:
@@ -1438,7 +1623,7 @@ class MainFrame(wx.Frame):
         if not self._ignore_change:
             self._update_description_color()
             self._current_document_instance.set_description(self._field_article_description.GetValue())
-            self._update_seo_colors()
+            self._request_seo_test()
 
     @staticmethod
     def _update_field_color(field: wx.TextCtrl, tip: SuperToolTip, seo_test: Callable) -> None:
@@ -1449,8 +1634,8 @@ class MainFrame(wx.Frame):
         :param seo_test: The seo method to run.
         :return: None
         """
-        correct, message, color = seo_test(field.GetValue())
-        field.SetBackgroundColour(color)
+        correct, message, status = seo_test(field.GetValue())
+        field.SetBackgroundColour(WxAdapter.field_color(status))
         tip.SetMessage(f'{Strings.seo_check}\n{message}')
 
     def _update_description_color(self) -> None:
@@ -1458,13 +1643,14 @@ class MainFrame(wx.Frame):
         Set meta description field color and tip based on the result of it's seo test.
         :return: None
         """
-        correct, message, color = self._current_document_instance.seo_test_description(
+        correct, message, status = self._current_document_instance.seo_test_description(
             self._field_article_description.GetValue())
+        color = WxAdapter.field_color(status)
 
         # Set color
         self._field_article_description.SetBackgroundColour(color)
         # Set color for the current text separately, it does not work with just background color
-        Tools.set_field_background(self._field_article_description, color)
+        WxAdapter.set_field_background(self._field_article_description, color)
 
         self._field_article_description_tip.SetMessage(f'{Strings.seo_check}\n{message}')
 
@@ -1487,26 +1673,185 @@ class MainFrame(wx.Frame):
             if event.GetInt():
                 # The event will have int 1 set if change has occurred
                 self._current_document_instance.set_modified(True)
-            self._update_seo_colors()
+            # Every keystroke only needs the plain text tested again. Links are recolored by a pass over the whole
+            # text area which runs once the text area reports the edit after the user stopped typing.
+            self._request_seo_test(text_edited=event.GetEventType() != wx.wxEVT_TEXT)
+
+    def _mark_not_uploaded(self, doc: WhitebearDocumentArticle) -> None:
+        """
+        Set the state of a document whose final html is on disk but was not uploaded yet.
+        :param doc: The document.
+        :return: None
+        """
+        # Set blue color to documents have been modified but not uploaded yet.
+        doc.set_modified(True)
+        doc.set_saved(True)
+        doc.set_uploaded(False)
+        # Set html code to something not False because at this point we have the final html on disk.
+        doc.set_html('current html on disk')
+        # Rerun self test because document attributes were changed, the content has already been tested.
+        with doc.get_test_lock():
+            doc.test_self(changed_only=True)
+
+    def _watch_working_directory(self, path: str) -> None:
+        """
+        Watch the working directory and its images and files folders for changes made by other programs like git or
+        another editor. wx uses inotify on Linux.
+        :param path: The working directory.
+        :return: None
+        """
+        if self._watcher:
+            self._watcher.RemoveAll()
+        else:
+            self._watcher = wx.FileSystemWatcher()
+            self._watcher.SetOwner(self)
+        self._watcher_timer.Stop()
+        self._changed_files.clear()
+        # Loading the directory starts the background threads itself.
+        self._reloading = False
+        self._resume_online_audit = False
+        self._resume_image_variants = False
+        events = wx.FSW_EVENT_CREATE | wx.FSW_EVENT_DELETE | wx.FSW_EVENT_RENAME | wx.FSW_EVENT_MODIFY
+        self._watcher.Add(wx.FileName.DirName(path), events)
+        for folder in (Strings.folder_images, Strings.folder_files):
+            if os.path.isdir(os.path.join(path, folder)):
+                self._watcher.AddTree(wx.FileName.DirName(os.path.join(path, folder)), events)
+
+    def _file_watcher_handler(self, event: wx.FileSystemWatcherEvent) -> None:
+        """
+        Remember a file changed on disk and restart the timer that reloads all changed files.
+        :param event: Used to get the changed paths.
+        :return: None
+        """
+        if event.IsError() or event.GetChangeType() & (wx.FSW_EVENT_WARNING | wx.FSW_EVENT_ERROR):
+            return
+        self._changed_files.add(os.path.realpath(event.GetPath().GetFullPath()))
+        if event.GetChangeType() & wx.FSW_EVENT_RENAME:
+            self._changed_files.add(os.path.realpath(event.GetNewPath().GetFullPath()))
+        self._watcher_timer.StartOnce(Numbers.watcher_timeout)
+
+    # noinspection PyUnusedLocal
+    def _on_watcher_timer(self, event: wx.TimerEvent) -> None:
+        """
+        Reload the files changed on disk once nothing changed for a while. The editor's own saves are ignored by the
+        directory loader because the file content is the same as the saved html.
+        :param event: Not used.
+        :return: None
+        """
+        if not self._directory_loader or self._directory_loading or not self._enabled or \
+                not self._saving_threads_finished():
+            # Wait until the editor finishes loading or writing its own files.
+            self._watcher_timer.StartOnce(Numbers.watcher_timeout)
+            return
+        if not self._changed_files:
+            return
+        # The reload replaces documents that background threads may be testing, stop them first and continue later.
+        self._resume_online_audit = self._resume_online_audit or bool(self._online_audit_thread)
+        self._resume_image_variants = self._resume_image_variants or bool(self._image_variant_thread)
+        self._stop_online_audit()
+        self._stop_image_variants()
+        self._reloading = True
+        if not self._background_threads_finished():
+            self._watcher_timer.StartOnce(Numbers.watcher_timeout)
+            return
+        paths = self._changed_files
+        self._changed_files = set()
+        self._unsaved_articles = {name: doc for name, doc in self._articles.items() if not doc.is_saved()}
+        self._disable_editor(True, all_menu=True)
+        thread = ReloadThread(self, self._directory_loader, paths)
+        thread.start()
+
+    def on_files_reloaded(self, reparsed: Set[str], retested: Set[str], removed: Set[str]) -> None:
+        """
+        Update the file list and the editor after files changed on disk were reloaded. Reparsed articles are marked as
+        not uploaded, retested articles only get their new color. The user is asked before an article with unsaved
+        changes is replaced by the reparsed one.
+        :param reparsed: File names of articles that were parsed again from disk.
+        :param retested: File names of articles that were only tested again.
+        :param removed: File names of deleted articles.
+        :return: None
+        """
+        self._index_document = self._directory_loader.get_index_page()
+        self.on_css_parsed(self._css_document)
+        self._finish_reload()
+        for name, doc in sorted(self._unsaved_articles.items()):
+            if name not in reparsed:
+                continue
+            result = wx.MessageBox(f'{Strings.warning_changed_on_disk}\n{doc.get_filename()}', Strings.status_warning,
+                                   wx.YES_NO | wx.ICON_WARNING)
+            if result == wx.NO:
+                # Keep the edited instance, it replaces the file on disk when it is saved.
+                self._articles[name] = doc
+                self._directory_loader.get_dependency_graph().update_article(doc)
+                reparsed = reparsed - {name}
+        self._unsaved_articles = {}
+        for name in removed:
+            self._config_manager.remove_uploaded(name)
+            self._file_list.remove_document(name)
+        for name in reparsed:
+            self._config_manager.store_not_uploaded(name)
+            self._mark_not_uploaded(self._articles[name])
+        self._file_list.add_documents(reparsed)
+        for name in reparsed | retested:
+            self._update_file_color(self._file_list.find_row(name))
+        self._set_status_text(f'{Strings.status_articles} {len(self._articles)}', 2)
+        self._set_status_text(f'{Strings.status_reloaded}: {len(reparsed) + len(retested) + len(removed)}', 3)
+        if self._current_document_name in removed:
+            self._current_document_instance = None
+            self._current_document_name = ''
+            self._clear_editor(leave_files=True)
+            self._disable_editor(True, leave_files=True)
+            return
+        self._disable_editor(False)
+        if self._current_document_name in reparsed:
+            # The document was parsed again, show the new instance.
+            self._current_document_instance = self._articles[self._current_document_name]
+            self._fill_editor(self._current_document_instance)
+        elif self._current_document_name in retested:
+            self._update_file_status_description(self._current_document_instance)
+
+    def _finish_reload(self) -> None:
+        """
+        Start the background threads that were stopped or postponed while files changed on disk were reloaded.
+        :return: None
+        """
+        self._reloading = False
+        if self._resume_online_audit:
+            self._resume_online_audit = False
+            self._start_online_audit()
+        if self._resume_image_variants:
+            self._resume_image_variants = False
+            self._start_image_variants()
+        if self._seo_test_pending and not self._seo_test_thread:
+            self._seo_test_pending = False
+            self._start_seo_test()
+
+    def on_files_reload_fail(self, e: Exception) -> None:
+        """
+        Reload the whole working directory if the changed files could not be reloaded one by one.
+        :param e: Exception that caused the call of this method.
+        :return: None
+        """
+        self._show_error_dialog(str(e))
+        self._unsaved_articles = {}
+        # Loading the whole directory starts the background threads again.
+        self._reloading = False
+        self._resume_online_audit = False
+        self._resume_image_variants = False
+        self._seo_test_pending = False
+        self._current_document_instance = None
+        self._load_working_directory(self._config_manager.get_working_dir())
 
     def _update_file_color(self, index: int = -1) -> None:
         """
-        Change the color of the currently selected file in the filelist according to the document's state.
+        Redraw a file in the filelist with the color according to the document's state.
         :param index: The index of the file in the list that should be updated, -1 if current file.
         :return: None
         """
         if index == -1:
             index = self._file_list.GetFirstSelected()
-        if index == -1:
-            # Nothing is selected nor given an index to update.
-            return
-        doc = self._articles[self._file_list.GetItemText(index)]
-        new_color = doc.get_status_color()
-        if doc.is_modified and not doc.is_saved():
-            self._file_list.SetItemFont(index, self.bold_small_font)
-        else:
-            self._file_list.SetItemFont(index, self.small_font)
-        self._file_list.SetItemBackgroundColour(index, new_color)
+        # Nothing happens if nothing is selected nor given an index to update.
+        self._file_list.refresh_row(index)
 
     def _update_file_status_description(self, doc: WhitebearDocumentArticle) -> None:
         """
@@ -1522,7 +1867,7 @@ class MainFrame(wx.Frame):
             status_string += f'\n{Strings.status_state}:\t{Strings.status_uploaded}'
         else:
             status_string += f'\n{Strings.status_state}:\t{Strings.status_unuploaded}'
-        if doc.get_status_color() == Numbers.RED_COLOR:
+        if doc.get_status() == Status.ERROR:
             self._stats_display.SetForegroundColour(wx.RED)
             status_string += f'\n{Strings.status_self_test}:\t{Strings.status_warning}'
             self._set_status_text(f'{Strings.status_warning}: {doc.get_filename()} - '
@@ -1540,7 +1885,7 @@ class MainFrame(wx.Frame):
         :param menu_item: The modified menu item
         :return: None
         """
-        self._menu_logo_button.SetBitmap(wx.Bitmap(menu_item.get_image()))
+        self._menu_logo_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(menu_item)))
         self._text_menu_item_name.SetLabelText(menu_item.get_article_name()[0])
         self._text_menu_item_name.Wrap(Numbers.menu_logo_image_size)
         self._menu_logo_static_sizer.Layout()
@@ -1551,7 +1896,7 @@ class MainFrame(wx.Frame):
         :param image: The modified image
         :return: None
         """
-        self._main_image_button.SetBitmap(wx.Bitmap(image.get_image()))
+        self._main_image_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(image)))
         self._text_main_image_caption.SetLabelText(image.get_caption()[0])
 
     # noinspection PyUnusedLocal
@@ -1561,6 +1906,7 @@ class MainFrame(wx.Frame):
         :param event: Not used
         :return: None
         """
+        from Gui.Dialogs.AddImageDialog import AddImageDialog
         dlg = AddImageDialog(self, self._current_document_instance.get_working_directory())
         dlg.ShowModal()
         dlg.Destroy()
@@ -1571,6 +1917,7 @@ class MainFrame(wx.Frame):
         :param event: Not used
         :return: None
         """
+        from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
         # Create a new placeholder text image or video
         new_image = AsideImage('', '', '', '', '', Strings.label_none, Strings.label_none)
         # This will set the image internal state to missing image placeholder.
@@ -1594,6 +1941,7 @@ class MainFrame(wx.Frame):
         :param event: Not used
         :return: None
         """
+        from Gui.Dialogs.AddLogoDialog import AddLogoDialog
         dlg = AddLogoDialog(self, self._current_document_instance.get_working_directory(), '')
         dlg.ShowModal()
         dlg.Destroy()
@@ -1693,10 +2041,13 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.NewFileDialog import NewFileDialog
         dlg = NewFileDialog(self, self._menus, self._articles, self._css_document, self._index_document)
         if dlg.ShowModal() == wx.ID_OK:
             new_document = dlg.get_new_document()
             self._articles[new_document.get_filename()] = new_document
+            # Links to the new page are not broken anymore.
+            FileSnapshot.get_instance().update([new_document.get_path()])
             new_document.convert_to_html()
             if self._file_list.GetFirstSelected() == -1:
                 # When no document is selected leave editor disabled after save.
@@ -1706,8 +2057,10 @@ class MainFrame(wx.Frame):
                 save_list = [new_document, new_document.get_menu_section(), new_document.get_index_document()]
                 self._save(save_list, save_as=False)
             # Add to list
-            self._file_list.InsertItem(0, new_document.get_filename())
+            self._file_list.add_documents([new_document.get_filename()])
             self._set_status_text(f'{Strings.status_articles} {len(self._articles)}', 2)
+            self._directory_loader.get_dependency_graph().update_article(new_document)
+            self._retest_backlinks(new_document.get_filename())
         self._update_seo_colors()
         dlg.Destroy()
 
@@ -1729,6 +2082,7 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.EditMenuDialog import EditMenuDialog
         # Save current document because menu change might require re-saving all documents.
         if self._current_document_instance:
             self._save_current_doc()
@@ -1752,6 +2106,7 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.EditDefaultValuesDialog import EditDefaultValuesDialog
         dlg = EditDefaultValuesDialog(self)
         result = dlg.ShowModal()
         if result == wx.ID_OK:
@@ -1777,10 +2132,15 @@ class MainFrame(wx.Frame):
             path = self._current_document_instance.get_path()
             if os.path.exists(path) and os.access(path, os.R_OK) and os.access(path, os.W_OK):
                 os.remove(path)
+                # Links to the deleted page are broken now.
+                FileSnapshot.get_instance().update([path])
                 # Remove from unuploaded list if it is there.
                 self._config_manager.remove_uploaded(self._current_document_name)
                 self._articles.pop(self._current_document_name)
-                self._file_list.DeleteItem(self._file_list.FindItem(-1, self._current_document_instance.get_filename()))
+                self._index_document.remove_article(self._current_document_name)
+                self._file_list.remove_document(self._current_document_name)
+                self._directory_loader.get_dependency_graph().remove_article(self._current_document_name)
+                self._retest_backlinks(self._current_document_name)
                 self._save_all(disable=True)
                 if self._file_list.GetItemCount() == 0:
                     self._current_document_instance = None
@@ -1797,6 +2157,19 @@ class MainFrame(wx.Frame):
             else:
                 self._show_error_dialog(f'{Strings.warning_can_not_delete}:\n{path}')
 
+    def _retest_backlinks(self, file_name: str) -> None:
+        """
+        Run self test on the articles that link to a created or deleted article and update their color in the file
+        list, their links became valid or broken.
+        :param file_name: The file name of the created or deleted article.
+        :return: None
+        """
+        for name in self._directory_loader.get_dependency_graph().get_backlinks(file_name):
+            if name in self._articles:
+                with self._articles[name].get_test_lock():
+                    self._articles[name].test_self()
+                self._update_file_color(self._file_list.find_row(name))
+
     # noinspection PyUnusedLocal
     def _new_dir_handler(self, event: wx.CommandEvent) -> None:
         """
@@ -1842,10 +2215,12 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
-        dlg = UploadDialog(self, self._articles, self._index_document, self._css_document)
+        from Gui.Dialogs.UploadDialog import UploadDialog
+        dlg = UploadDialog(self, self._articles, self._index_document, self._css_document,
+                           self._directory_loader.get_dependency_graph())
         dlg.ShowModal()
         for file in dlg.get_uploaded():
-            self._update_file_color(self._file_list.FindItem(-1, file))
+            self._update_file_color(self._file_list.find_row(file))
         dlg.Destroy()
 
     def _online_test_handler(self, event: wx.CommandEvent) -> None:
@@ -1856,8 +2231,145 @@ class MainFrame(wx.Frame):
         """
         if event.IsChecked():
             self._config_manager.store_online_test(True)
+            self._start_online_audit()
         else:
             self._config_manager.store_online_test(False)
+            self._stop_online_audit()
+
+    def _video_facade_handler(self, event: wx.CommandEvent) -> None:
+        """
+        Handle changes to the check menu item for saving videos as poster images. Store the value in config manager.
+        Articles use the new setting the next time they are saved.
+        :param event: Used to get value.
+        :return: None
+        """
+        self._config_manager.store_video_facade(event.IsChecked())
+
+    def _minify_handler(self, event: wx.CommandEvent) -> None:
+        """
+        Handle changes to the check menu item for minifying the output. Store the value in config manager. Pages use the
+        new setting the next time they are saved.
+        :param event: Used to get value.
+        :return: None
+        """
+        self._config_manager.store_minify(event.IsChecked())
+
+    def _start_online_audit(self) -> None:
+        """
+        Start the online test of links and videos of all loaded articles in the background if the online test is
+        turned on. An audit that is already running is stopped first.
+        :return: None
+        """
+        self._stop_online_audit()
+        if not self._articles or not self._config_manager.get_online_test():
+            return
+        self._online_audit_thread = OnlineAuditThread(self, list(self._articles.values()),
+                                                      lambda: self._current_document_instance)
+        self._online_audit_thread.start()
+
+    def _stop_online_audit(self) -> None:
+        """
+        Stop the background online test. Results that are already on the way are ignored.
+        :return: None
+        """
+        if self._online_audit_thread:
+            self._online_audit_thread.stop()
+            self._online_audit_thread = None
+
+    def on_online_audit_progress(self, thread: OnlineAuditThread, doc: WhitebearDocumentArticle, done: int,
+                                 total: int) -> None:
+        """
+        Update the file list color of an article tested online by the background audit.
+        :param thread: The audit that tested the article.
+        :param doc: The tested article.
+        :param done: Number of articles tested so far.
+        :param total: Number of all articles in the audit.
+        :return: None
+        """
+        if thread is not self._online_audit_thread or self._articles.get(doc.get_filename()) is not doc:
+            # The audit was stopped or replaced, or the article was reloaded or deleted in the meantime.
+            return
+        self._set_status_text(f'{Strings.status_online_test} {done}/{total}', 3)
+        self._file_list.refresh_row(self._file_list.find_row(doc.get_filename()))
+        if doc is self._current_document_instance:
+            # The background test reuses the online results and recolors the links and videos.
+            self._request_seo_test(text_edited=True)
+
+    def on_online_audit_done(self, thread: OnlineAuditThread) -> None:
+        """
+        Forget the finished background online test.
+        :param thread: The finished audit.
+        :return: None
+        """
+        if thread is self._online_audit_thread:
+            self._online_audit_thread = None
+            self._set_status_text(Strings.status_ready, 3)
+
+    def _start_image_variants(self) -> None:
+        """
+        Start creating the missing widths of all thumbnails and the missing webp and avif variants of all thumbnails and
+        menu logos in the background.
+        :return: None
+        """
+        self._stop_image_variants()
+        snapshot = FileSnapshot.get_instance()
+        images = []
+        for folder in (Strings.folder_thumbnails, Strings.folder_logos):
+            for path in snapshot.get_files(os.path.join(self._config_manager.get_working_dir(), Strings.folder_images,
+                                                        folder)):
+                if path.lower().endswith((Strings.extension_jpg, Strings.extension_png)):
+                    images.append(path)
+        if images:
+            self._image_variant_thread = ImageVariantThread(self, images)
+            self._image_variant_thread.start()
+
+    def _stop_image_variants(self) -> None:
+        """
+        Stop creating image variants in the background.
+        :return: None
+        """
+        if self._image_variant_thread:
+            self._image_variant_thread.stop()
+            self._image_variant_thread = None
+
+    def on_image_variants_done(self, thread: ImageVariantThread, created: List[str], failed: List[str]) -> None:
+        """
+        Remember the created image widths and variants, pages refer to them the next time they are saved.
+        :param thread: The finished thread.
+        :param created: Full disk paths of the created widths and variants.
+        :param failed: Error messages of images that could not be converted.
+        :return: None
+        """
+        if thread is not self._image_variant_thread:
+            return
+        self._image_variant_thread = None
+        FileSnapshot.get_instance().update(created)
+        if created:
+            self._set_status_text(f'{Strings.status_image_variants} {len(created)}', 3)
+        if failed:
+            self._show_error_dialog(f'{Strings.warning_image_variants_fail}\n' + '\n'.join(failed))
+
+    def _statistics_handler(self, event: wx.CommandEvent) -> None:
+        """
+        Handle changes to the check menu item for collecting performance statistics. Store the value in config manager.
+        :param event: Used to get value.
+        :return: None
+        """
+        self._instrumentation.set_enabled(event.IsChecked())
+        self._config_manager.store_instrumentation(event.IsChecked())
+
+    # noinspection PyUnusedLocal
+    def _save_statistics_handler(self, event: wx.CommandEvent) -> None:
+        """
+        Save the collected performance statistics into a json file in the home directory.
+        :param event: Not used.
+        :return: None
+        """
+        try:
+            self._instrumentation.dump()
+            self._set_status_text(f'{Strings.status_saved}: {Strings.instrumentation_file}', 3)
+        except OSError as e:
+            self._show_error_dialog(f'{Strings.warning_can_not_save}\n{e}')
 
     def _spellcheck_test_handler(self, event: wx.CommandEvent) -> None:
         """
@@ -1878,6 +2390,7 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.SpellCheckSetupDialog import SpellCheckSetupDialog
         dlg = SpellCheckSetupDialog(self)
         dlg.ShowModal()
         if dlg.rerun_spellchecks():
@@ -1897,7 +2410,8 @@ class MainFrame(wx.Frame):
             :return: None
             """
             for doc in documents:
-                doc.test_self()
+                with doc.get_test_lock():
+                    doc.test_self()
 
         self._disable_editor(True, all_menu=True)
         document_list = list(self._articles.values())
@@ -1925,36 +2439,151 @@ class MainFrame(wx.Frame):
         :param return_value: None, not used.
         :return: None
         """
-        for i in range(0, self._file_list.GetItemCount()):
-            self._update_file_color(i)
+        self._file_list.refresh_all()
         self._disable_editor(False)
 
     def _update_seo_colors(self) -> None:
         """
         Run self test on currently shown document and update the background color of all items in the loaded document.
+        This runs on the main thread and is used where the result is needed immediately.
+        :return: None
+        """
+        # A synchronous test makes any scheduled or running background test unnecessary.
+        self._seo_test_timer.Stop()
+        self._seo_generation += 1
+        self._seo_test_pending = False
+        self._seo_text_edited = False
+        doc = self._current_document_instance
+        # A running background test or online audit of the document finishes first, a stale result is ignored.
+        with doc.get_test_lock():
+            # Replace the plain text version of the page in the document first from the edited but not yet saved text
+            # field. Reset status color and calculate it again.
+            doc.set_plain_text(self._main_text_area.get_text())
+            # Do not run online test which is slow.
+            doc.test_self()
+            with doc.get_index_document().get_test_lock():
+                doc.get_index_document().test_self()
+            with doc.get_menu_section().get_test_lock():
+                doc.get_menu_section().test_self()
+            self._seo_snapshot = SeoTestThread.create_snapshot(doc)
+        # The full snapshot is applied as a diff against an empty gui.
+        self._apply_seo_diff(self._seo_snapshot, True)
+
+    def _request_seo_test(self, text_edited: bool = False) -> None:
+        """
+        Schedule a background self test of the currently shown document. Repeated requests within the timeout are
+        merged into one test.
+        :param text_edited: True if the main text was edited and links in it need to be updated.
+        :return: None
+        """
+        self._seo_text_edited = self._seo_text_edited or text_edited
+        self._seo_test_timer.StartOnce(Numbers.seo_test_timeout)
+
+    # noinspection PyUnusedLocal
+    def _on_seo_test_timer(self, event: wx.TimerEvent) -> None:
+        """
+        Start the background self test once the user stopped editing for a while.
+        :param event: Not used.
         :return: None
         """
-        # Replace the plain text version of the page in the document first from the edited but not yet saved text field.
-        # Reset status color and calculate it again.
-        self._current_document_instance.set_plain_text(self._main_text_area.get_text())
-        # Do not run online test which is slow.
-        self._current_document_instance.test_self()
-        self._current_document_instance.get_index_document().test_self()
-        self._current_document_instance.get_menu_section().test_self()
-
-        self._update_article_image_sizer(self._current_document_instance.get_article_image())
-        self._side_photo_panel.update_image_backgrounds()
-        self._update_menu_sizer(self._current_document_instance.get_menu_item())
-        self._main_text_area.update_seo_colors()
-        self._update_field_color(self._field_article_date, self._field_article_date_tip,
-                                 self._current_document_instance.seo_test_date)
-        self._update_field_color(self._field_article_name, self._field_article_name_tip,
-                                 self._current_document_instance.seo_test_name)
-        self._update_field_color(self._field_article_keywords, self._field_article_keywords_tip,
-                                 self._current_document_instance.seo_test_keywords)
-        self._update_description_color()
-        self._update_file_color()
-        self._update_file_status_description(self._current_document_instance)
+        self._start_seo_test()
+
+    def _start_seo_test(self) -> None:
+        """
+        Start the background self test of the currently shown document. If a test is already running, only remember
+        that another one is needed, it will be started with the latest document state when the running one finishes.
+        :return: None
+        """
+        if not self._current_document_instance:
+            return
+        if self._seo_test_thread or self._reloading:
+            # The reload starts the test when it is done.
+            self._seo_test_pending = True
+            return
+        # Only results of the latest started test are shown, a test running while the user types is still used.
+        self._seo_generation += 1
+        self._seo_test_thread = SeoTestThread(self, self._current_document_instance, self._main_text_area.get_text(),
+                                              self._seo_snapshot, self._seo_text_edited, self._seo_generation)
+        self._seo_text_edited = False
+        self._seo_test_thread.start()
+
+    def on_seo_test_done(self, thread: SeoTestThread, doc: WhitebearDocumentArticle, snapshot: Dict[str, Tuple],
+                         diff: Dict[str, Tuple], text_edited: bool) -> None:
+        """
+        Receive the result of the background self test and update only the parts of the gui that changed.
+        :param thread: The thread that ran the test.
+        :param doc: The tested document.
+        :param snapshot: All test results of the document.
+        :param diff: Test results that differ from the previous snapshot.
+        :param text_edited: True if the main text was edited and links in it need to be updated.
+        :return: None
+        """
+        if thread is self._seo_test_thread:
+            self._seo_test_thread = None
+        # The result is thrown away if the document changed or the user switched to a different document since the
+        # test was requested.
+        if thread.get_generation() == self._seo_generation and doc is self._current_document_instance:
+            self._seo_snapshot = snapshot
+            self._apply_seo_diff(diff, text_edited)
+        elif text_edited:
+            # The links were not recolored, the next test has to do it.
+            self._seo_text_edited = True
+        if self._seo_test_pending and not self._seo_test_thread:
+            self._seo_test_pending = False
+            self._start_seo_test()
+
+    def _apply_seo_diff(self, diff: Dict[str, Tuple], text_edited: bool) -> None:
+        """
+        Update the background color and messages of items in the loaded document that are present in the diff.
+        :param diff: Dictionary of gui part name to its new test results.
+        :param text_edited: True if the main text was edited and links in it need to be updated.
+        :return: None
+        """
+        if 'article_image' in diff:
+            self._update_article_image_sizer(self._current_document_instance.get_article_image())
+        if 'aside_images' in diff:
+            self._side_photo_panel.update_image_backgrounds()
+        if 'menu_item' in diff:
+            self._update_menu_sizer(self._current_document_instance.get_menu_item())
+        if text_edited or 'text_elements' in diff:
+            self._main_text_area.update_seo_colors()
+        for key, field, tip in (('date', self._field_article_date, self._field_article_date_tip),
+                                ('name', self._field_article_name, self._field_article_name_tip),
+                                ('keywords', self._field_article_keywords, self._field_article_keywords_tip),
+                                ('description', self._field_article_description,
+                                 self._field_article_description_tip)):
+            if key in diff:
+                correct, message, status = diff[key]
+                color = WxAdapter.field_color(status)
+                field.SetBackgroundColour(color)
+                if field == self._field_article_description:
+                    # Set color for the current text separately, it does not work with just background color
+                    WxAdapter.set_field_background(field, color)
+                tip.SetMessage(f'{Strings.seo_check}\n{message}')
+        if 'document' in diff:
+            self._update_file_color()
+            self._update_file_status_description(self._current_document_instance)
+
+    @staticmethod
+    def _background_threads_finished() -> bool:
+        """
+        Return True if no background self test, online audit or image variant thread is running. Stopped threads may
+        still be finishing the document or image they were working on.
+        :return: True if no background thread is running.
+        """
+        return not any(isinstance(thread, (SeoTestThread, OnlineAuditThread, ImageVariantThread))
+                       for thread in threading.enumerate())
+
+    @staticmethod
+    def _saving_threads_finished() -> bool:
+        """
+        Return True if all threads except the main thread have finished. The background self test and the daemon
+        threads of the online audit and of the image variants with its process pool are not saving threads and are
+        ignored.
+        :return: True if all threads except the main thread have finished.
+        """
+        return all(isinstance(thread, SeoTestThread) or thread.daemon for thread in threading.enumerate()
+                   if thread is not threading.main_thread())
 
     # noinspection PyUnusedLocal
     def _self_test_handler(self, event: wx.CommandEvent) -> None:
@@ -1963,6 +2592,8 @@ class MainFrame(wx.Frame):
         :param event: Not used.
         :return: None
         """
+        from Gui.Dialogs.RichTextSpellcheckerDialog import RichTextSpellCheckerDialog
+        from Gui.Dialogs.SpellCheckerDialog import SpellCheckerDialog
         # We must run this at least once to find errors.
         self._save_current_doc()
         self._update_seo_colors()
@@ -1996,45 +2627,45 @@ class MainFrame(wx.Frame):
         :return: None
         """
         error_report = ''
-        if self._current_document_instance.get_status_color() == Numbers.RED_COLOR:
+        if self._current_document_instance.get_status() == Status.ERROR:
             # Keywords, date, description, title
             for field, name in ((self._field_article_keywords, Strings.label_article_keywords),
                                 (self._field_article_description, Strings.label_article_description),
                                 (self._field_article_date, Strings.label_article_date),
                                 (self._field_article_name, Strings.label_article_title)):
-                if field.GetBackgroundColour() == Numbers.RED_COLOR:
+                if field.GetBackgroundColour() == GuiNumbers.RED_COLOR:
                     error_report += f'- {name}\n'
             # Menu item
-            if self._current_document_instance.get_menu_item().get_status_color() == wx.RED:
+            if self._current_document_instance.get_menu_item().get_status() == Status.ERROR:
                 error_report += f'- {Strings.warning_menu_item}\n'
             # Main image
-            if self._current_document_instance.get_article_image().get_status_color() == wx.RED:
+            if self._current_document_instance.get_article_image().get_status() == Status.ERROR:
                 error_report += f'- {Strings.warning_main_image}\n'
             # Aside images
             for img in self._current_document_instance.get_aside_images():
-                if img.get_status_color() == wx.RED:
+                if img.get_status() == Status.ERROR:
                     error_report += f'- {Strings.warning_aside_image}: {img.get_caption()[0]}\n'
             # Text images
             for img in self._current_document_instance.get_text_images():
-                if img.get_status_color() == wx.RED:
+                if img.get_status() == Status.ERROR:
                     error_report += f'- {Strings.warning_text_image}: {img.get_link_title()[0]}\n'
             # Text videos
             for vid in self._current_document_instance.get_videos():
-                if vid.get_status_color() == wx.RED:
+                if vid.get_status() == Status.ERROR:
                     error_report += f'- {Strings.warning_text_video}: {vid.get_title()[0]}\n'
             # Text links
             for link in self._current_document_instance.get_links():
-                if link.get_status_color() == wx.RED:
+                if link.get_status() == Status.ERROR:
                     error_report += f'- {Strings.warning_text_link}: {link.get_text()[0]}\n'
             # Main text spellcheck
             if not self._current_document_instance.is_spellcheck_ok():
                 error_report += f'- {Strings.warning_text_spelling}\n'
 
         # Menu page
-        if self._current_document_instance.get_menu_section().get_status_color() == Numbers.RED_COLOR:
+        if self._current_document_instance.get_menu_section().get_status() == Status.ERROR:
             error_report += f'- {Strings.warning_menu_page}\n'
         # Index page
-        if self._current_document_instance.get_index_document().get_status_color() == Numbers.RED_COLOR:
+        if self._current_document_instance.get_index_document().get_status() == Status.ERROR:
             error_report += f'- {Strings.warning_index}\n'
 
         if not error_report:
@@ -2073,10 +2704,11 @@ class MainFrame(wx.Frame):
         :param event: Used to decide which file to open.
         :return: None
         """
+        from Gui.Dialogs.PlainTextEditDialog import PlainTextEditDialog
         file = None
-        if event.GetId() == Numbers.ID_EDIT_ROBOTS:
+        if event.GetId() == GuiNumbers.ID_EDIT_ROBOTS:
             file = os.path.join(self._config_manager.get_working_dir(), Strings.robots_file)
-        elif event.GetId() == Numbers.ID_EDIT_CSS:
+        elif event.GetId() == GuiNumbers.ID_EDIT_CSS:
             file = os.path.join(self._config_manager.get_working_dir(), Strings.css_file)
 
         if not os.path.exists(file):
@@ -3,9 +3,8 @@ from typing import List
 import wx
 import wx.lib.scrolledpanel
 
-from Constants.Constants import Events
 from Constants.Constants import Strings
-from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
+from Constants.GuiConstants import Events
 from Gui.Panels.ImagePanel import ImagePanel
 from Tools.Document.AsideImage import AsideImage
 from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
@@ -59,6 +58,7 @@ class AsideImagePanel(wx.lib.scrolledpanel.ScrolledPanel):
             set_modified = True
         else:
             # Modify image data
+            from Gui.Dialogs.EditAsideImageDialog import EditAsideImageDialog
             edit_dialog = EditAsideImageDialog(self, self._images[self._img_index], self._doc.get_working_directory())
             edit_dialog.ShowModal()
             set_modified = edit_dialog.was_modified()
@@ -4,10 +4,10 @@ from typing import List, Tuple
 import wx
 import wx.richtext as rt
 
-from Constants.Constants import Strings, Numbers, Events
-from Gui.Dialogs.EditLinkDialog import EditLinkDialog
-from Gui.Dialogs.EditTextImageDialog import EditTextImageDialog
-from Gui.Dialogs.EditVideoDialog import EditVideoDialog
+from Constants.Constants import Status
+from Constants.Constants import Strings, Numbers
+from Constants.GuiConstants import Events
+from Gui.WxAdapter import WxAdapter
 from Tools.ConfigManager import ConfigManager
 from Tools.Document.ArticleElements.Heading import Heading
 from Tools.Document.ArticleElements.ImageInText import ImageInText
@@ -1309,7 +1309,7 @@ class CustomRichText(rt.RichTextCtrl):
         if isinstance(element, Text):
             if element.is_bold():
                 self.BeginBold()
-            self.BeginTextColour(self._css_document.translate_str_color(element.get_color()))
+            self.BeginTextColour(WxAdapter.css_color(self._css_document.translate_str_color(element.get_color())))
             self.WriteText(element.get_text())
             self.EndTextColour()
             if element.is_bold():
@@ -1317,7 +1317,7 @@ class CustomRichText(rt.RichTextCtrl):
         elif isinstance(element, Break):
             self.Newline()
         elif isinstance(element, Link):
-            self._insert_link(element.get_text()[0], element.get_id(), element.get_status_color())
+            self._insert_link(element.get_text()[0], element.get_id(), element.get_status())
 
     def _url_in_text_click_handler(self, evt: wx.TextUrlEvent) -> None:
         """
@@ -1335,6 +1335,7 @@ class CustomRichText(rt.RichTextCtrl):
             link.test_self(self._config_manager.get_online_test())
 
         link.set_text(link_text)
+        from Gui.Dialogs.EditLinkDialog import EditLinkDialog
         edit_dialog = EditLinkDialog(self, link)
         result = edit_dialog.ShowModal()
         self._handle_link_edit(result, link, evt)
@@ -1364,7 +1365,7 @@ class CustomRichText(rt.RichTextCtrl):
                     self._doc.add_link(link)
                 # Replace the text with link
                 self.Remove(evt.GetURLStart(), evt.GetURLEnd() + 1)
-                self._insert_link(link.get_text()[0], link.get_id(), link.get_status_color())
+                self._insert_link(link.get_text()[0], link.get_id(), link.get_status())
             elif result == wx.ID_DELETE:
                 # The DELETE button was pressed:
                 style: rt.RichTextAttr = self._stylesheet.FindCharacterStyle(Strings.style_url).GetStyle()
@@ -1382,16 +1383,16 @@ class CustomRichText(rt.RichTextCtrl):
         if self.BatchingUndo():
             self.EndBatchUndo()
 
-    def _insert_link(self, text: str, link_id: str, color: wx.Colour) -> None:
+    def _insert_link(self, text: str, link_id: str, status: Status) -> None:
         """
         Insert a link into text at current position.
         :param text: The visible text.
         :param link_id: The ID of the link
-        :param color: The color of the background of the link.
+        :param status: The SEO status of the link which decides the background color of the link.
         :return: None
         """
         url_style: rt.RichTextAttr = self._stylesheet.FindCharacterStyle(Strings.style_url).GetStyle()
-        if color == wx.RED:
+        if status == Status.ERROR:
             url_style.SetBackgroundColour(wx.RED)
         else:
             # Links do not turn white with null color so use white.
@@ -1405,7 +1406,9 @@ class CustomRichText(rt.RichTextCtrl):
 
     def update_seo_colors(self) -> None:
         """
-        Update the color of all links and images/videos in this document based on their seo status.
+        Update the color of all links and images/videos in this document based on their seo status. Only links whose
+        text changed are tested again and only links whose color changed are rewritten. All links are rewritten in one
+        pass without undo history and the text area is laid out and refreshed once.
         :return: None.
         """
         # Changing paragraph style inside the loop changes address in memory and causes segfault. Create a list of
@@ -1413,35 +1416,50 @@ class CustomRichText(rt.RichTextCtrl):
         ranges_list: List[Tuple[Tuple[int, int], Link]] = []
         buffer: rt.RichTextBuffer = self.GetBuffer()
         paragraphs: List[rt.RichTextParagraph] = buffer.GetChildren()
-        for p in paragraphs:
-            par_style: str = p.GetAttributes().GetFontFaceName()
-            # Update links.
-            if par_style == Strings.style_paragraph or par_style == Strings.style_list:
-                for child in p.GetChildren():
-                    child: rt.RichTextPlainText
-                    attrs: rt.RichTextAttr = child.GetAttributes()
-                    if attrs.HasURL():
-                        stored_link: Link = self._doc.find_link(attrs.GetURL())
-                        if stored_link:
-                            stored_link.set_text(child.GetText())
-                            stored_link.test_self(False)
-                            ranges_list.append((child.GetRange(), stored_link))
-
+        # The links belong to the document, background tests of the document must not test them at the same time.
+        with self._doc.get_test_lock():
+            for p in paragraphs:
+                par_style: str = p.GetAttributes().GetFontFaceName()
+                # Update links.
+                if par_style == Strings.style_paragraph or par_style == Strings.style_list:
+                    for child in p.GetChildren():
+                        child: rt.RichTextPlainText
+                        attrs: rt.RichTextAttr = child.GetAttributes()
+                        if attrs.HasURL():
+                            stored_link: Link = self._doc.find_link(attrs.GetURL())
+                            if stored_link:
+                                # The link is only tested again if the text changed since the last test.
+                                stored_link.set_text(child.GetText())
+                                stored_link.test_if_dirty(False)
+                                ranges_list.append((child.GetRange(), stored_link))
+
+        changed_list: List[Tuple[Tuple[int, int], Link]] = []
         for link_range, link in ranges_list:
-            # for some reason changing style on a link does not work, starting before the link does, but destroys the
-            # style. So instead we replace the whole link.
             attr = rt.RichTextAttr()
             self.GetStyleForRange(link_range, attr)
-            if attr.GetBackgroundColour() != link.get_status_color():
-                self.BeginSuppressUndo()
-                with self.load_indicator_manager():
+            if attr.GetBackgroundColour() != WxAdapter.element_color(link.get_status()):
+                changed_list.append((link_range, link))
+
+        if changed_list:
+            position = self.GetInsertionPoint()
+            self.Freeze()
+            self.BeginSuppressUndo()
+            with self.load_indicator_manager():
+                # For some reason changing style on a link does not work, starting before the link does, but destroys
+                # the style. So instead we replace the whole link. The text of the link stays the same, so the ranges
+                # of the other links do not move, go from the end anyway to be safe.
+                for link_range, link in reversed(changed_list):
                     self.Remove(link_range[0], link_range[1] + 1)
-                    self._insert_link(link.get_text()[0], link.get_id(), link.get_status_color())
-                # If the refresh is not there, font breaks if you use undo and the spellcheck again.
-                self.MoveLeft(0)
-                self.Invalidate()
-                self.Refresh()
-                self.EndSuppressUndo()
+                    self.SetInsertionPoint(link_range[0])
+                    self._insert_link(link.get_text()[0], link.get_id(), link.get_status())
+            self.EndSuppressUndo()
+            self.SetInsertionPoint(position)
+            # If the refresh is not there, font breaks if you use undo and the spellcheck again.
+            self.MoveLeft(0)
+            self.Thaw()
+            self.LayoutContent()
+            self.Invalidate()
+            self.Refresh()
 
         # Update images and videos
         for field in self._fields:
@@ -1464,8 +1482,10 @@ class CustomRichText(rt.RichTextCtrl):
             new_element.test_self(self._config_manager.get_online_test())
         # Open edit dialog.
         if evt.GetId() == self._img_tool_id:
+            from Gui.Dialogs.EditTextImageDialog import EditTextImageDialog
             edit_dialog = EditTextImageDialog(self._parent, new_element, self._doc.get_working_directory())
         else:
+            from Gui.Dialogs.EditVideoDialog import EditVideoDialog
             edit_dialog = EditVideoDialog(self._parent, new_element)
         result = edit_dialog.ShowModal()
         if result == wx.ID_OK:
@@ -1624,7 +1644,7 @@ class CustomRichText(rt.RichTextCtrl):
         child: rt.RichTextPlainText = p.GetChild(0)
         attrs: rt.RichTextAttr = child.GetAttributes()
         text: str = child.GetText()
-        color: str = self._css_document.translate_color_str(attrs.GetTextColour())
+        color: str = self._css_document.translate_color_str(WxAdapter.css_rgb(attrs.GetTextColour()))
         size: int = Heading.SIZE_H3 if attrs.GetFontFaceName() == Strings.style_heading_3 else Heading.SIZE_H4
         # Create the Heading instance.
         # Headings are never explicitly bold.
@@ -1656,7 +1676,7 @@ class CustomRichText(rt.RichTextCtrl):
             color = None
             # Color is irrelevant for links.
             if not attrs.HasURL():
-                color = self._css_document.translate_color_str(attrs.GetTextColour())
+                color = self._css_document.translate_color_str(WxAdapter.css_rgb(attrs.GetTextColour()))
 
             if attrs.HasURL():
                 # This will be a link
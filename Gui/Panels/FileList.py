@@ -0,0 +1,186 @@
+import bisect
+from typing import Dict, Iterable, List, Tuple
+
+import wx
+
+from Constants.Constants import Status
+from Constants.Constants import Strings
+from Gui.WxAdapter import WxAdapter
+from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
+
+
+class FileList(wx.ListCtrl):
+    """
+    Virtual list of the article file names sorted by name. Rows are not stored in the control, their text, color and
+    font are taken from the article documents when a row is drawn. A row changes its color when it is refreshed after
+    the state of its document changed. The selection stays on the same document when rows are added or removed, this
+    does not send selection events.
+    """
+
+    def __init__(self, parent, font: wx.Font, bold_font: wx.Font):
+        """
+        Constructor for the file list.
+        :param parent: Parent panel.
+        :param font: Font of saved documents.
+        :param bold_font: Font of documents that are not saved.
+        """
+        wx.ListCtrl.__init__(self, parent, -1, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.LC_HRULES)
+        self.SetFont(font)
+        self.InsertColumn(0, Strings.label_filelist, format=wx.LIST_FORMAT_LEFT)
+        self._font = font
+        self._bold_font = bold_font
+        self._documents: Dict[str, WhitebearDocumentArticle] = {}
+        self._names: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # The list control keeps only a pointer to the returned attributes, they must stay alive.
+        self._attrs: Dict[Tuple[Status, bool], wx.ItemAttr] = {}
+        self._moving_selection = False
+        self.Bind(wx.EVT_LIST_ITEM_SELECTED, self._selection_handler)
+        self.Bind(wx.EVT_LIST_ITEM_DESELECTED, self._selection_handler)
+
+    def _selection_handler(self, event: wx.ListEvent) -> None:
+        """
+        Stop selection events caused by moving the selection to the new row of the selected document.
+        :param event: The selection event.
+        :return: None
+        """
+        if not self._moving_selection:
+            event.Skip()
+
+    def set_documents(self, documents: Dict[str, WhitebearDocumentArticle]) -> None:
+        """
+        Show all documents of a dictionary. The dictionary is not copied, documents added to it later are shown after
+        add_documents is called with their names.
+        :param documents: Dictionary of file names and documents of article pages {file name, WhitebearDocument, ...}
+        :return: None
+        """
+        selected = self._get_selected_name()
+        self._documents = documents
+        self._names = sorted(documents)
+        self._update_rows(0, selected)
+
+    def add_documents(self, names: Iterable[str]) -> None:
+        """
+        Add rows of documents that were added into the dictionary of documents.
+        :param names: File names of the new documents.
+        :return: None
+        """
+        new_names = [name for name in names if name not in self._rows]
+        if not new_names:
+            return
+        selected = self._get_selected_name()
+        self._names = sorted(self._names + new_names)
+        self._update_rows(min(bisect.bisect_left(self._names, name) for name in new_names), selected)
+
+    def remove_document(self, name: str) -> None:
+        """
+        Remove the row of a document.
+        :param name: File name of the document.
+        :return: None
+        """
+        selected = self._get_selected_name()
+        row = self._rows.pop(name, wx.NOT_FOUND)
+        if row == wx.NOT_FOUND:
+            return
+        self._names.pop(row)
+        self._update_rows(row, selected)
+
+    def clear(self) -> None:
+        """
+        Remove all rows. Documents added to the dictionary later are shown after add_documents is called.
+        :return: None
+        """
+        self._names = []
+        self._update_rows(0, None)
+
+    def _get_selected_name(self) -> str:
+        """
+        Return the file name of the selected document.
+        :return: The file name or None if nothing is selected.
+        """
+        row = self.GetFirstSelected()
+        if 0 <= row < len(self._names):
+            return self._names[row]
+        return None
+
+    def _update_rows(self, start: int, selected: str) -> None:
+        """
+        Update the row numbers of the documents from a row on, move the selection to the row of the selected document
+        and redraw the list.
+        :param start: The first row whose document changed.
+        :param selected: File name of the document that was selected before the change.
+        :return: None
+        """
+        if start == 0:
+            self._rows.clear()
+        for row in range(start, len(self._names)):
+            self._rows[self._names[row]] = row
+        old_row = self.GetFirstSelected()
+        new_row = self._rows.get(selected, wx.NOT_FOUND)
+        self._moving_selection = True
+        if old_row != new_row and old_row != wx.NOT_FOUND:
+            self.Select(old_row, on=False)
+        self.SetItemCount(len(self._names))
+        if old_row != new_row and new_row != wx.NOT_FOUND:
+            self.Select(new_row)
+        self._moving_selection = False
+        self.Refresh()
+
+    def find_row(self, name: str) -> int:
+        """
+        Return the row of a document.
+        :param name: File name of the document.
+        :return: The row or wx.NOT_FOUND.
+        """
+        return self._rows.get(name, wx.NOT_FOUND)
+
+    def get_name(self, row: int) -> str:
+        """
+        Return the file name of the document in a row.
+        :param row: The row.
+        :return: The file name.
+        """
+        return self._names[row]
+
+    def refresh_row(self, row: int) -> None:
+        """
+        Redraw one row with the current state of its document.
+        :param row: The row.
+        :return: None
+        """
+        if 0 <= row < len(self._names):
+            self.RefreshItem(row)
+
+    def refresh_all(self) -> None:
+        """
+        Redraw all rows with the current state of their documents.
+        :return: None
+        """
+        if self._names:
+            self.RefreshItems(0, len(self._names) - 1)
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        """
+        Overrides wx.ListCtrl.OnGetItemText, called by the control when it draws a row.
+        :param item: The row.
+        :param column: The column, there is only one.
+        :return: The file name of the document in the row.
+        """
+        return self._names[item]
+
+    def OnGetItemAttr(self, item: int) -> wx.ItemAttr:
+        """
+        Overrides wx.ListCtrl.OnGetItemAttr, called by the control when it draws a row.
+        :param item: The row.
+        :return: The color and font of the row according to the document's state.
+        """
+        doc = self._documents.get(self._names[item])
+        if not doc:
+            return None
+        key = (doc.get_status(), not doc.is_saved())
+        attr = self._attrs.get(key)
+        if not attr:
+            attr = wx.ItemAttr(wx.NullColour, WxAdapter.document_color(key[0]),
+                               self._bold_font if key[1] else self._font)
+            self._attrs[key] = attr
+        return attr
@@ -2,6 +2,7 @@ import wx
 
 from Constants.Constants import Numbers
 from Constants.Constants import Strings
+from Gui.WxAdapter import WxAdapter
 from Tools.Document.AsideImage import AsideImage
 
 
@@ -81,8 +82,8 @@ class ImagePanel(wx.Panel):
 
     def update_image(self) -> None:
         """
-        Update the color from the status color of the image.
+        Update the color from the status of the image.
         :return: None
         """
-        self._bitmap_button.SetBitmap(wx.Bitmap(self._image.get_image()))
-        self.SetBackgroundColour(self._image.get_status_color())
+        self._bitmap_button.SetBitmap(wx.Bitmap(WxAdapter.get_image(self._image)))
+        self.SetBackgroundColour(WxAdapter.element_color(self._image.get_status()))
@@ -0,0 +1,153 @@
+import os
+from typing import Dict, Tuple
+
+import wx
+from wx.lib.agw.supertooltip import SuperToolTip
+
+from Constants.Constants import Status
+from Constants.GuiConstants import GuiNumbers
+
+
+class WxAdapter:
+    """
+    Translates the plain statuses, colors and image paths of the document model into wx objects. The document model
+    does not import wx, so it can be loaded and tested without a running wx.App.
+    """
+    # Decoded images by disk path with the modification time of the file they were decoded from. Images are only used
+    # in the gui thread.
+    _images: Dict[str, Tuple[float, wx.Image]] = {}
+
+    @staticmethod
+    def document_color(status: Status) -> wx.Colour:
+        """
+        Return the file list color of a document status.
+        :param status: The status of the document.
+        :return: Red if the SEO test failed, blue if the document is modified or not uploaded, white otherwise.
+        """
+        if status == Status.ERROR:
+            return GuiNumbers.RED_COLOR
+        if status == Status.CHANGED:
+            return GuiNumbers.BLUE_COLOR
+        return wx.WHITE
+
+    @staticmethod
+    def field_color(status: Status) -> wx.Colour:
+        """
+        Return the background color of a text field tested by one of the seo_test methods.
+        :param status: The status returned by the seo_test method.
+        :return: Red if the test failed, green otherwise.
+        """
+        if status == Status.ERROR:
+            return GuiNumbers.RED_COLOR
+        return GuiNumbers.GREEN_COLOR
+
+    @staticmethod
+    def element_color(status: Status) -> wx.Colour:
+        """
+        Return the border or background color of an element inside a document like an image, a link or a video.
+        :param status: The status of the element.
+        :return: Red if the SEO test failed, white if the element is ok, null colour if there is nothing to display.
+        """
+        if status == Status.ERROR:
+            return wx.RED
+        if status == Status.OK:
+            return wx.WHITE
+        return wx.NullColour
+
+    @staticmethod
+    def css_color(rgb: Tuple[int, int, int]) -> wx.Colour:
+        """
+        Return a wx.Colour for a css color of the WhitebearDocumentCSS.
+        :param rgb: (red, green, blue) tuple.
+        :return: The wx.Colour.
+        """
+        return wx.Colour(*rgb)
+
+    @staticmethod
+    def css_rgb(color: wx.Colour) -> Tuple[int, int, int]:
+        """
+        Return the (red, green, blue) value of a text color for the WhitebearDocumentCSS.
+        :param color: The wx.Colour of the text.
+        :return: (red, green, blue) tuple or None if the text has no color.
+        """
+        if not color.IsOk():
+            return None
+        return color.Red(), color.Green(), color.Blue()
+
+    @staticmethod
+    def get_image(element, normal: bool = False) -> wx.Image:
+        """
+        Load the image that the SEO test chose to display for an image, menu item or video. If there was a seo error
+        the image will be red. The file is decoded again only when it changed on disk, the caller gets its own copy.
+        :param element: Any element with get_display_image_path and get_status methods.
+        :param normal: Do not return red image even if there was a problem.
+        :return: Return the image as wx image instance, None if the element was not tested yet.
+        """
+        path = element.get_display_image_path()
+        if not path:
+            return None
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError as _:
+            mtime = None
+        cached = WxAdapter._images.get(path)
+        if cached and cached[0] == mtime:
+            image = cached[1].Copy()
+        else:
+            image = wx.Image(path, wx.BITMAP_TYPE_ANY)
+            if mtime is not None and image.IsOk():
+                WxAdapter._images[path] = (mtime, image.Copy())
+        if not normal and element.get_status() == Status.ERROR:
+            return image.AdjustChannels(0.9, 0.5, 0.5)
+        return image
+
+    @staticmethod
+    def get_warning_tip(field, title: str) -> SuperToolTip:
+        """
+        Create and return an instance of SuperToolTip targeted for a specific TextCtrl and set up to show SEO warnings.
+        :param field: The text field for the new tip.
+        :param title: The header text of the tip.
+        :return: Set up SuperToolTip
+        """
+        tip = SuperToolTip(None, footer='   ')
+        tip.SetHeader(title)
+        tip.SetTarget(field)
+        tip.SetTopGradientColor(GuiNumbers.YELLOW_COLOR)
+        tip.SetMiddleGradientColor(GuiNumbers.YELLOW_COLOR)
+        tip.SetBottomGradientColor(GuiNumbers.YELLOW_COLOR)
+        tip.SetTextColor(wx.BLACK)
+        return tip
+
+    @staticmethod
+    def set_field_background(field: wx.TextCtrl, color: wx.Colour) -> None:
+        """
+        Set background color for a field.
+        :param field: wx.TextCtrl.
+        :param color: The wx.Color to set.
+        :return: None
+        """
+        field.SetBackgroundColour(color)
+        style_carrier = wx.TextAttr()
+        # Set color for the current text separately, it does not work with just background color
+        field.GetStyle(0, style_carrier)
+        style_carrier.SetBackgroundColour(color)
+        field.SetStyle(0, len(field.GetValue()), style_carrier)
+
+    @staticmethod
+    def inplace_rescale(image: wx.Image, target_width: int, target_height: int, border: int) -> None:
+        """
+        Rescale image in place to fit into a defined size. The image will retain original aspect ratio.
+        :param image: Image to rescale
+        :param target_width: Width of the new image.
+        :param target_height: Height of the new image.
+        :param border: Leave space for a border.
+        :return: None
+        """
+        width_scale = target_width / image.GetWidth()
+        height_scale = target_height / image.GetHeight()
+        bounded_scale = min(width_scale, height_scale)
+        width = int(image.GetWidth() * bounded_scale) - border
+        height = int(image.GetHeight() * bounded_scale) - border
+        width = width if width > 0 else 1
+        height = height if height > 0 else 1
+        image.Rescale(width, height, quality=wx.IMAGE_QUALITY_HIGH)
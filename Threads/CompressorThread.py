@@ -0,0 +1,64 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+
+import wx
+from Tools.Tools import Tools
+
+
+class CompressorThread(threading.Thread):
+    """
+    Creates gzip and brotli compressed copies of html, css, xml and txt files before upload. The files are compressed
+    in parallel, compression releases the GIL.
+    """
+
+    def __init__(self, parent, files: List[str]):
+        """
+        Compressor thread constructor.
+        :param parent: The gui object that should receive the results.
+        :param files: List of file paths to compress.
+        """
+        threading.Thread.__init__(self)
+        self._parent = parent
+        self._stop_event = threading.Event()
+        self._files_to_compress = files
+        self._files_done: int = 0
+
+    def _compress(self, file: str) -> List[str]:
+        """
+        Compress one file unless the thread was stopped.
+        :param file: Full disk path to the file.
+        :return: List of full disk paths of the compressed copies.
+        """
+        if self._stop_event.is_set():
+            return []
+        return Tools.precompress(file)
+
+    def run(self) -> None:
+        """
+        Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
+        :return: None, this method calls the wx.CallAfter to pass results back into GUI.
+        """
+        error = False
+        sidecars = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {executor.submit(self._compress, file): file for file in self._files_to_compress}
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    sidecars.extend(future.result())
+                    self._files_done += 1
+                    wx.CallAfter(self._parent.on_compression_done, file, self._files_done)
+                except OSError as e:
+                    # OSError is raised when the file could not be read or the copy could not be written.
+                    wx.CallAfter(self._parent.on_compression_fail, f'{file} {e}')
+                    error = True
+        wx.CallAfter(self._parent.on_compression_finished, sorted(sidecars), error or self._stop_event.is_set())
+
+    def stop(self) -> None:
+        """
+        Stop the execution of this thread, files that are being compressed are finished.
+        :return: None
+        """
+        self._stop_event.set()
@@ -30,14 +30,17 @@ class ConvertorThread(threading.Thread):
         Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
         :return: None, this method calls the wx.CallAfter to pass results back into GUI.
         """
-        self._doc.set_uploaded(False)
-        if isinstance(self._doc, WhitebearDocumentArticle):
-            self._doc.test_self(self._config_manager.get_online_test())
-        else:
-            self._doc.test_self()
-        try:
-            self._doc.convert_to_html()
-            self._doc.set_saved(True)
-            self._parent.conversion_done(self._doc, self._save_as, self._disable)
-        except UnrecognizedFileException as e:
-            self._parent.conversion_fail(e)
+        # A background SEO test or the online audit may be testing the same document.
+        with self._doc.get_test_lock():
+            self._doc.set_uploaded(False)
+            if isinstance(self._doc, WhitebearDocumentArticle):
+                self._doc.test_self(self._config_manager.get_online_test())
+            else:
+                self._doc.test_self()
+            try:
+                self._doc.convert_to_html()
+                self._doc.set_saved(True)
+            except UnrecognizedFileException as e:
+                self._parent.conversion_fail(e)
+                return
+        self._parent.conversion_done(self._doc, self._save_as, self._disable)
@@ -1,12 +1,20 @@
 import threading
+import time
+from typing import List
 
+import httplib2
 import wx
 
+from Constants.Constants import Numbers
+from Constants.Constants import Strings
+
 from Exceptions.AccessException import AccessException
 from Exceptions.IndexException import IndexException
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Exceptions.WrongFormatException import WrongFormatException
+from Tools.ConfigManager import ConfigManager
 from Tools.DirectoryLoader import DirectoryLoader
+from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
 
 
 class FileListThread(threading.Thread):
@@ -15,33 +23,91 @@ class FileListThread(threading.Thread):
     the main thread and send it results.
     """
 
-    def __init__(self, parent, path: str):
+    def __init__(self, parent, path: str, test_connection: bool = False):
         """
         Filelist thread constructor. This thread parses a supposed WhiteBear web directory and passes a list of
         websites back into the GUI.
         :param parent: The gui object that should receive the result.
         :param path: The path to whitebear web directory on disk.
+        :param test_connection: Turn off the online test before loading if there is no internet connection.
         """
         threading.Thread.__init__(self)
         self._parent = parent
         self._path = path
+        self._test_connection = test_connection
         self._directory_loader = None
+        # Articles are passed into the gui in batches as they are parsed, not one by one.
+        self._first_article = ConfigManager.get_instance().get_last_document()
+        self._batch: List[WhitebearDocumentArticle] = []
+        self._last_batch_time = 0.0
+
+    @staticmethod
+    def _check_connection() -> None:
+        """
+        Turn off the online test of links and videos if there is no internet connection.
+        :return: None
+        """
+        h = httplib2.Http(timeout=Numbers.online_test_timeout)
+        try:
+            h.request(Strings.test_url, 'HEAD')
+        except (ConnectionResetError, OSError, httplib2.ServerNotFoundError) as _:
+            ConfigManager.get_instance().store_online_test(False)
+        finally:
+            h.close()
 
     def run(self) -> None:
         """
         Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
         :return: None, this method calls the wx.CallAfter to pass results back into GUI.
         """
+        if self._test_connection:
+            # The online test of the loaded documents is started once the directory is loaded, turn it off now if it
+            # can not work.
+            self._check_connection()
         try:
             self._directory_loader = DirectoryLoader()
-            self._directory_loader.load_directory(self._path)
-            # The CallAfter method functions as a carrier between threads, the callable function passed into the method
-            # will be called in the main GUI thread. This passes an event into the main thread in background which is
-            # processed normally in the wx main thread queue.
-            wx.CallAfter(self._parent.on_css_parsed, self._directory_loader.get_css_file())
+            self._directory_loader.load_directory(self._path, self._on_menus_loaded, self._on_article_loaded,
+                                                  self._first_article)
+            self._send_batch()
             wx.CallAfter(self._parent.on_filelist_loaded, self._directory_loader.get_articles(),
-                         self._directory_loader.get_menus(), self._directory_loader.get_index_page())
+                         self._directory_loader.get_menus(), self._directory_loader.get_index_page(),
+                         self._directory_loader)
         except (AccessException, FileNotFoundError, UnrecognizedFileException, WrongFormatException) as e:
             wx.CallAfter(self._parent.on_filelist_load_fail, '', e)
         except IndexException as e:
             wx.CallAfter(self._parent.on_filelist_load_fail, self._path, e)
+
+    def _on_menus_loaded(self) -> None:
+        """
+        Pass the css, menus and index into the gui before articles are parsed.
+        :return: None
+        """
+        # The CallAfter method functions as a carrier between threads, the callable function passed into the method
+        # will be called in the main GUI thread. This passes an event into the main thread in background which is
+        # processed normally in the wx main thread queue.
+        wx.CallAfter(self._parent.on_css_parsed, self._directory_loader.get_css_file())
+        wx.CallAfter(self._parent.on_filelist_started, self._directory_loader.get_menus(),
+                     self._directory_loader.get_index_page(), self._directory_loader)
+        self._last_batch_time = time.monotonic()
+
+    def _on_article_loaded(self, article: WhitebearDocumentArticle) -> None:
+        """
+        Collect a parsed article and pass the collected articles into the gui once in a while. The last opened article
+        is passed right away so that it can be edited as soon as possible.
+        :param article: The parsed article.
+        :return: None
+        """
+        self._batch.append(article)
+        if article.get_filename() == self._first_article or \
+                time.monotonic() - self._last_batch_time >= Numbers.file_list_batch_interval:
+            self._send_batch()
+
+    def _send_batch(self) -> None:
+        """
+        Pass the collected articles into the gui.
+        :return: None
+        """
+        if self._batch:
+            wx.CallAfter(self._parent.on_filelist_batch, self._batch)
+            self._batch = []
+        self._last_batch_time = time.monotonic()
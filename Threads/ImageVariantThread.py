@@ -0,0 +1,57 @@
+import multiprocessing
+import os
+import threading
+from typing import List
+
+import wx
+from Tools.Tools import Tools
+
+
+class ImageVariantThread(threading.Thread):
+    """
+    Creates the srcset widths of thumbnails and webp and avif variants of thumbnails and menu logos in the background.
+    The images are converted in a pool of worker processes to use all cores without slowing down the gui. Images
+    whose widths and variants are up to date are skipped quickly.
+    """
+
+    def __init__(self, parent, images: List[str]):
+        """
+        Image variant thread constructor.
+        :param parent: The gui object that should receive the results.
+        :param images: Full disk paths of the jpg and png images.
+        """
+        threading.Thread.__init__(self)
+        # Do not keep the editor running while the workers finish after the window was closed.
+        self.daemon = True
+        self._parent = parent
+        self._images = images
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Stop the conversion, the worker processes are terminated. No more results are passed into the gui.
+        :return: None
+        """
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """
+        Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
+        :return: None, this method calls the wx.CallAfter to pass results back into GUI.
+        """
+        created = []
+        failed = []
+        # Forking a process with a running gui is not safe, the workers are started fresh. The worker function is in
+        # Tools so the workers do not import wx when they unpickle it.
+        pool = multiprocessing.get_context('spawn').Pool(os.cpu_count())
+        try:
+            for written, error in pool.imap_unordered(Tools.create_image_set, self._images):
+                if self._stop_event.is_set():
+                    return
+                created.extend(written)
+                if error:
+                    failed.append(error)
+        finally:
+            pool.terminate()
+        if not self._stop_event.is_set():
+            wx.CallAfter(self._parent.on_image_variants_done, self, created, failed)
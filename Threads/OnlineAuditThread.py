@@ -0,0 +1,58 @@
+import threading
+from typing import Callable, List
+
+import wx
+
+from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
+
+
+class OnlineAuditThread(threading.Thread):
+    """
+    Runs the online test of links and videos of all articles after the working directory was loaded with only the
+    offline test. Every tested article is passed back into the gui right away so the file list colors are updated one
+    by one. The audit can be stopped between articles. The article open in the editor is skipped, the editor tests it
+    itself and a slow online test must not keep the gui waiting for its test lock.
+    """
+
+    def __init__(self, parent, articles: List[WhitebearDocumentArticle],
+                 get_current: Callable[[], WhitebearDocumentArticle]):
+        """
+        Online audit thread constructor.
+        :param parent: The gui object that should receive the results.
+        :param articles: The articles to test.
+        :param get_current: Returns the article that is open in the editor.
+        """
+        threading.Thread.__init__(self)
+        # Do not keep the editor running while waiting for a slow server after the window was closed.
+        self.daemon = True
+        self._parent = parent
+        self._articles = articles
+        self._get_current = get_current
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Stop the audit after the article that is being tested now. No more results are passed into the gui.
+        :return: None
+        """
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """
+        Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
+        :return: None, this method calls the wx.CallAfter to pass results back into GUI.
+        """
+        total = len(self._articles)
+        for done, article in enumerate(self._articles, start=1):
+            if self._stop_event.is_set():
+                return
+            if article is self._get_current():
+                continue
+            # Only links and videos that were not tested online yet are tested, the offline results are reused. Other
+            # tests of the article wait until this one is done.
+            with article.get_test_lock():
+                article.test_self(online=True, changed_only=True)
+            if self._stop_event.is_set():
+                return
+            wx.CallAfter(self._parent.on_online_audit_progress, self, article, done, total)
+        wx.CallAfter(self._parent.on_online_audit_done, self)
@@ -0,0 +1,38 @@
+import threading
+from typing import Set
+
+import wx
+
+from Exceptions.AccessException import AccessException
+from Exceptions.UnrecognizedFileException import UnrecognizedFileException
+from Exceptions.WrongFormatException import WrongFormatException
+from Tools.DirectoryLoader import DirectoryLoader
+
+
+class ReloadThread(threading.Thread):
+    """
+    Reloads the files that were changed on disk by another program without reloading the whole directory.
+    """
+
+    def __init__(self, parent, loader: DirectoryLoader, paths: Set[str]):
+        """
+        Reload thread constructor.
+        :param parent: The gui object that should receive the result.
+        :param loader: The directory loader that loaded the working directory.
+        :param paths: Full disk paths of the changed files.
+        """
+        threading.Thread.__init__(self)
+        self._parent = parent
+        self._loader = loader
+        self._paths = paths
+
+    def run(self) -> None:
+        """
+        Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
+        :return: None, this method calls the wx.CallAfter to pass results back into GUI.
+        """
+        try:
+            reparsed, retested, removed = self._loader.reload_files(self._paths)
+            wx.CallAfter(self._parent.on_files_reloaded, reparsed, retested, removed)
+        except (AccessException, FileNotFoundError, UnrecognizedFileException, WrongFormatException) as e:
+            wx.CallAfter(self._parent.on_files_reload_fail, e)
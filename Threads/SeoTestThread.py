@@ -0,0 +1,78 @@
+import threading
+from typing import Dict, Tuple
+
+import wx
+
+from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
+
+
+class SeoTestThread(threading.Thread):
+    """
+    Runs the SEO self test of the currently edited article, its index and menu off the main thread and passes back only
+    the parts of the result that changed since the last run.
+    """
+
+    def __init__(self, parent, doc: WhitebearDocumentArticle, plain_text: str, previous: Dict[str, Tuple],
+                 text_edited: bool, generation: int):
+        """
+        SEO test thread constructor.
+        :param parent: The gui object that should receive the result.
+        :param doc: The article to test.
+        :param plain_text: Plain text of the article taken from the text area at the time of the request.
+        :param previous: The snapshot of the last test of this document that the gui has already displayed.
+        :param text_edited: A value that is simply passed into the callback, True if the main text was edited.
+        :param generation: Number of the test request, the gui ignores results of requests that are out of date.
+        """
+        threading.Thread.__init__(self)
+        self._parent = parent
+        self._doc = doc
+        self._plain_text = plain_text
+        self._previous = previous
+        self._text_edited = text_edited
+        self._generation = generation
+
+    def run(self) -> None:
+        """
+        Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
+        :return: None, this method calls the wx.CallAfter to pass results back into GUI.
+        """
+        # The gui thread, the online audit and saving take the same locks before they test the documents. The article
+        # lock is always taken before the index and menu locks.
+        with self._doc.get_test_lock():
+            self._doc.set_plain_text(self._plain_text)
+            # Do not run online test which is slow. Only elements changed by the user since the last test are retested.
+            self._doc.test_self(changed_only=True)
+            with self._doc.get_index_document().get_test_lock():
+                self._doc.get_index_document().test_self()
+            with self._doc.get_menu_section().get_test_lock():
+                self._doc.get_menu_section().test_self()
+            snapshot = self.create_snapshot(self._doc)
+        diff = {key: value for key, value in snapshot.items() if self._previous.get(key) != value}
+        wx.CallAfter(self._parent.on_seo_test_done, self, self._doc, snapshot, diff, self._text_edited)
+
+    def get_generation(self) -> int:
+        """
+        Return the number of the test request this thread runs.
+        :return: The number of the test request this thread runs.
+        """
+        return self._generation
+
+    @staticmethod
+    def create_snapshot(doc: WhitebearDocumentArticle) -> Dict[str, Tuple]:
+        """
+        Collect the statuses and messages of everything that is displayed in the gui for an already tested
+        article.
+        :param doc: The tested article.
+        :return: Dictionary of gui part name to a tuple of values that decide how the part is displayed.
+        """
+        elements = doc.get_links() + doc.get_text_images() + doc.get_videos()
+        return {'date': doc.seo_test_date(doc.get_date()[0]),
+                'name': doc.seo_test_name(doc.get_page_name()[0]),
+                'keywords': doc.seo_test_keywords(doc.get_keywords_string()[0]),
+                'description': doc.seo_test_description(doc.get_description()[0]),
+                'article_image': (doc.get_article_image().get_status(),
+                                  doc.get_article_image().get_caption()[0]),
+                'menu_item': (doc.get_menu_item().get_status(), doc.get_menu_item().get_article_name()[0]),
+                'aside_images': tuple(image.get_status() for image in doc.get_aside_images()),
+                'text_elements': tuple(element.get_status() for element in elements),
+                'document': (doc.get_status(), doc.is_saved(), doc.is_modified(), doc.is_uploaded())}
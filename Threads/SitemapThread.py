@@ -1,5 +1,5 @@
 import threading
-from typing import List
+from typing import Dict
 
 import wx
 
@@ -8,14 +8,14 @@ from Tools.SitemapGenerator import SitemapGenerator
 
 class SitemapThread(threading.Thread):
     """
-    Creates a sitemap.
+    Creates a sitemap and writes it into the working directory.
     """
 
-    def __init__(self, parent, pages: List[str], work_dir: str, disable: bool):
+    def __init__(self, parent, pages: Dict[str, float], work_dir: str, disable: bool):
         """
         Sitemap thread constructor.
         :param parent: The gui object that should receive the result.
-        :param pages: List of pages to put into the sitemap.
+        :param pages: Dictionary of pages to put into the sitemap and their last known modification timestamps.
         :param work_dir: Working directory of the editor. The sitemap and robots.txt will be saved there.
         :param disable: Leave editor disabled after thread finishes.
         """
@@ -24,12 +24,15 @@ class SitemapThread(threading.Thread):
         self._pages = pages
         self._work_dir = work_dir
         self._disable = disable
-        self._generator = SitemapGenerator(self._pages)
+        self._generator = SitemapGenerator(self._pages, self._work_dir)
 
     def run(self) -> None:
         """
         Overrides Thread.run. Don't call this directly its called internally when you call Thread.start().
         :return: None, this method calls the wx.CallAfter to pass results back into GUI.
         """
-        sitemap = self._generator.create_sitemap()
-        wx.CallAfter(self._parent.on_sitemap_done, sitemap, self._disable)
+        try:
+            files = self._generator.create_sitemap()
+            wx.CallAfter(self._parent.on_sitemap_done, files, self._disable)
+        except OSError as e:
+            wx.CallAfter(self._parent.on_sitemap_fail, e, self._disable)
@@ -41,6 +41,14 @@ class ConfigManager:
     CONF_SPELLCHECK_TEST: str = 'spellcheckTest'
     CONF_LAST_IMG_DIR: str = 'lastImgDir'
     CONF_UNUPLOADED: str = 'unuploaded'
+    CONF_INSTRUMENTATION: str = 'instrumentation'
+    CONF_PRECOMPRESS: str = 'precompress'
+    CONF_VIDEO_FACADE: str = 'videoFacade'
+    CONF_MINIFY: str = 'minify'
+
+    # Use the much faster libyaml bindings if pyyaml was built with them.
+    _yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    _yaml_dumper = getattr(yaml, 'CDumper', yaml.Dumper)
 
     @staticmethod
     def get_instance():
@@ -87,6 +95,9 @@ class ConfigManager:
                 self.CONF_LAST_UPLOAD: '',
                 self.CONF_ONLINE_TEST: '1',
                 self.CONF_SPELLCHECK_TEST: '1',
+                self.CONF_PRECOMPRESS: '0',
+                self.CONF_VIDEO_FACADE: '0',
+                self.CONF_MINIFY: '0',
                 self.CONF_LANG: enchant.get_default_language(),
                 self.CONF_LAST_IMG_DIR: Strings.home_directory,
                 self.CONF_NEWS: str(Numbers.default_news),
@@ -109,7 +120,7 @@ class ConfigManager:
         """
         try:
             with open(Strings.editor_config_file, "r", encoding='utf-8') as yml:
-                self._whole_conf = yaml.safe_load(yml)
+                self._whole_conf = yaml.load(yml, Loader=self._yaml_loader)
                 if not self._whole_conf:
                     self._init_config()
         except (ParserError, ScannerError, FileNotFoundError, KeyError) as _:
@@ -124,7 +135,7 @@ class ConfigManager:
         # At this point after constructor, the config file exists and is full or empty, but it is writeable.
         # This clears the file and writes new contents.
         with open(Strings.editor_config_file, 'w', encoding='utf-8') as file:
-            yaml.dump(self._whole_conf, file)
+            yaml.dump(self._whole_conf, file, Dumper=self._yaml_dumper)
 
     def check_set_config_values(self) -> bool:
         """
@@ -334,6 +345,50 @@ class ConfigManager:
             self._dir_conf[self.CONF_ONLINE_TEST] = '1'
             return True
 
+    def get_precompress(self) -> bool:
+        """
+        Return True when compressed copies of text files are uploaded. If the value is damaged, assume it is disabled.
+        :return: True when compressed copies of text files are uploaded.
+        """
+        try:
+            return bool(int(self._dir_conf[self.CONF_PRECOMPRESS]))
+        except (ValueError, KeyError) as _:
+            self._dir_conf[self.CONF_PRECOMPRESS] = '0'
+            return False
+
+    def get_video_facade(self) -> bool:
+        """
+        Return True when videos are saved as a poster image instead of an iframe. If the value is damaged, assume it is
+        disabled.
+        :return: True when videos are saved as a poster image instead of an iframe.
+        """
+        try:
+            return bool(int(self._dir_conf[self.CONF_VIDEO_FACADE]))
+        except (ValueError, KeyError) as _:
+            self._dir_conf[self.CONF_VIDEO_FACADE] = '0'
+            return False
+
+    def get_minify(self) -> bool:
+        """
+        Return True when saved pages and the stylesheet are minified. If the value is damaged, assume it is disabled.
+        :return: True when saved pages and the stylesheet are minified.
+        """
+        try:
+            return bool(int(self._dir_conf[self.CONF_MINIFY]))
+        except (ValueError, KeyError) as _:
+            self._dir_conf[self.CONF_MINIFY] = '0'
+            return False
+
+    def get_instrumentation(self) -> bool:
+        """
+        Return True when collecting performance statistics is enabled. This is shared by all directories.
+        :return: True when collecting performance statistics is enabled. If the value is damaged, assume it is disabled.
+        """
+        try:
+            return bool(int(self._whole_conf[self.CONF_INSTRUMENTATION]))
+        except (ValueError, KeyError) as _:
+            return False
+
     def get_spellcheck_test(self) -> bool:
         """
         Return True when spellcheck is enabled. If the value is damaged, assume it is enabled.
@@ -460,6 +515,54 @@ class ConfigManager:
             self._dir_conf[self.CONF_ONLINE_TEST] = '0'
         self.save_config_file()
 
+    def store_precompress(self, enabled: bool) -> None:
+        """
+        Save the preference of uploading compressed copies of text files into the dictionary.
+        :param enabled: True if the compressed copies are uploaded.
+        :return: None
+        """
+        if enabled:
+            self._dir_conf[self.CONF_PRECOMPRESS] = '1'
+        else:
+            self._dir_conf[self.CONF_PRECOMPRESS] = '0'
+        self.save_config_file()
+
+    def store_video_facade(self, enabled: bool) -> None:
+        """
+        Save the preference of replacing video iframes with a poster image that loads the player on click.
+        :param enabled: True if videos are saved as a poster image.
+        :return: None
+        """
+        if enabled:
+            self._dir_conf[self.CONF_VIDEO_FACADE] = '1'
+        else:
+            self._dir_conf[self.CONF_VIDEO_FACADE] = '0'
+        self.save_config_file()
+
+    def store_minify(self, enabled: bool) -> None:
+        """
+        Save the preference of minifying saved pages and the stylesheet into the dictionary.
+        :param enabled: True if pages and the stylesheet are minified.
+        :return: None
+        """
+        if enabled:
+            self._dir_conf[self.CONF_MINIFY] = '1'
+        else:
+            self._dir_conf[self.CONF_MINIFY] = '0'
+        self.save_config_file()
+
+    def store_instrumentation(self, enabled: bool) -> None:
+        """
+        Save performance statistics collection preference into the dictionary.
+        :param enabled: True if the collection is enabled.
+        :return: None
+        """
+        if enabled:
+            self._whole_conf[self.CONF_INSTRUMENTATION] = '1'
+        else:
+            self._whole_conf[self.CONF_INSTRUMENTATION] = '0'
+        self.save_config_file()
+
     def store_spellcheck_test(self, enabled: bool) -> None:
         """
         Save spellcheck preference into the dictionary
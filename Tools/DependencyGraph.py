@@ -0,0 +1,149 @@
+import os
+import threading
+from typing import Dict, Set
+
+from Constants.Constants import Strings
+from Tools.Tools import Tools
+
+
+class DependencyGraph:
+    """
+    Keeps track of what the loaded articles depend on: the menu they belong to, the images, menu logo and files they
+    use and the other pages they link to. The reverse edges are kept too, so it is cheap to find out which articles
+    are affected when a menu, an image, a file or another article changes. The graph is updated whenever an article is
+    parsed, saved or deleted.
+    """
+
+    def __init__(self):
+        """
+        Constructor for an empty dependency graph.
+        """
+        self._lock = threading.Lock()
+        # Article file name: menu file name and menu file name: article file names.
+        self._menu_of: Dict[str, str] = {}
+        self._menu_articles: Dict[str, Set[str]] = {}
+        # Article file name: disk paths of images, menu logo and files and real disk path: article file names.
+        self._assets: Dict[str, Set[str]] = {}
+        self._asset_users: Dict[str, Set[str]] = {}
+        # Article file name: linked page file names and page file name: file names of articles that link to it.
+        self._links: Dict[str, Set[str]] = {}
+        self._backlinks: Dict[str, Set[str]] = {}
+
+    def clear(self) -> None:
+        """
+        Forget all articles.
+        :return: None
+        """
+        with self._lock:
+            for edges in (self._menu_of, self._menu_articles, self._assets, self._asset_users, self._links,
+                          self._backlinks):
+                edges.clear()
+
+    def update_article(self, article) -> None:
+        """
+        Replace all edges of an article with the ones found in its current content.
+        :param article: Parsed WhitebearDocumentArticle.
+        :return: None
+        """
+        name = article.get_filename()
+        images = [article.get_article_image()] + article.get_aside_images() + article.get_text_images()
+        assets = set()
+        for image in images:
+            if image:
+                assets.add(image.get_original_image_path())
+                assets.add(image.get_thumbnail_image_path())
+        if article.get_menu_item():
+            assets.add(article.get_menu_item().get_image_path())
+        for video in article.get_videos():
+            # Videos saved as a poster image link use a poster image downloaded when the article was saved.
+            poster = Tools.get_video_poster_path(article.get_working_directory(), video.get_url()[0])
+            if poster and os.path.exists(poster):
+                assets.add(poster)
+        links = set()
+        for link in article.get_links():
+            url = link.get_url()[0]
+            if url.startswith(Strings.folder_files):
+                assets.add(os.path.join(article.get_working_directory(), url))
+            elif url.endswith(Strings.extension_html) and os.path.basename(url) == url:
+                links.add(url)
+        assets.discard(None)
+        menu = article.get_menu_section().get_filename() if article.get_menu_section() else None
+        with self._lock:
+            self._remove_edges(name)
+            if menu:
+                self._menu_of[name] = menu
+                self._menu_articles.setdefault(menu, set()).add(name)
+            self._assets[name] = assets
+            for path in assets:
+                self._asset_users.setdefault(os.path.realpath(path), set()).add(name)
+            self._links[name] = links
+            for target in links:
+                self._backlinks.setdefault(target, set()).add(name)
+
+    def remove_article(self, file_name: str) -> None:
+        """
+        Remove the outgoing edges of a deleted article. Links from other articles to it are kept, they are broken now.
+        :param file_name: The file name of the deleted article.
+        :return: None
+        """
+        with self._lock:
+            self._remove_edges(file_name)
+
+    def _remove_edges(self, file_name: str) -> None:
+        """
+        Remove the outgoing edges of an article and their reverse edges. Must be called with the lock held.
+        :param file_name: The file name of the article.
+        :return: None
+        """
+        menu = self._menu_of.pop(file_name, None)
+        if menu:
+            self._menu_articles[menu].discard(file_name)
+        for path in self._assets.pop(file_name, set()):
+            self._asset_users.get(os.path.realpath(path), set()).discard(file_name)
+        for target in self._links.pop(file_name, set()):
+            self._backlinks.get(target, set()).discard(file_name)
+
+    def get_menu_articles(self, menu_file_name: str) -> Set[str]:
+        """
+        Return the file names of the articles that belong to a menu.
+        :param menu_file_name: The file name of the menu.
+        :return: Set of article file names.
+        """
+        with self._lock:
+            return set(self._menu_articles.get(menu_file_name, set()))
+
+    def get_assets(self, file_name: str) -> Set[str]:
+        """
+        Return the disk paths of all images, thumbnails, the menu logo and files an article uses.
+        :param file_name: The file name of the article.
+        :return: Set of disk paths.
+        """
+        with self._lock:
+            return set(self._assets.get(file_name, set()))
+
+    def get_asset_users(self, path: str) -> Set[str]:
+        """
+        Return the file names of the articles that use an image or a file.
+        :param path: Disk path of the image or file.
+        :return: Set of article file names.
+        """
+        with self._lock:
+            return set(self._asset_users.get(os.path.realpath(path), set()))
+
+    def get_links(self, file_name: str) -> Set[str]:
+        """
+        Return the file names of the pages an article links to.
+        :param file_name: The file name of the article.
+        :return: Set of page file names.
+        """
+        with self._lock:
+            return set(self._links.get(file_name, set()))
+
+    def get_backlinks(self, file_name: str) -> Set[str]:
+        """
+        Return the file names of the articles that link to a page.
+        :param file_name: The file name of the page.
+        :return: Set of article file names.
+        """
+        with self._lock:
+            return set(self._backlinks.get(file_name, set()))
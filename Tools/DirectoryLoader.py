@@ -1,21 +1,23 @@
 import glob
 import os
-from typing import Dict
+from typing import Callable, Dict, Set
 
-from lxml import etree
 from lxml import html
-from lxml.etree import XMLSyntaxError, XMLSchemaParseError
+from lxml.etree import XMLSyntaxError
 
 from Constants.Constants import Strings
 from Exceptions.AccessException import AccessException
 from Exceptions.IndexException import IndexException
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Exceptions.WrongFormatException import WrongFormatException
-from Resources.Fetch import Fetch
+from Tools.DependencyGraph import DependencyGraph
 from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
 from Tools.Document.WhitebearDocumentCSS import WhitebearDocumentCSS
 from Tools.Document.WhitebearDocumentIndex import WhitebearDocumentIndex
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
+from Tools.Tools import Tools
 
 
 class DirectoryLoader:
@@ -31,13 +33,7 @@ class DirectoryLoader:
         self._menu_documents: Dict[str, WhitebearDocumentMenu] = {}
         self._index_document = None
         self._css_document = None
-        # Prepare xml schemas
-        try:
-            self._xmlschema_index = etree.XMLSchema(etree.parse(Fetch.get_resource_path('schema_index.xsd')))
-            self._xmlschema_article = etree.XMLSchema(etree.parse(Fetch.get_resource_path('schema_article.xsd')))
-            self._xmlschema_menu = etree.XMLSchema(etree.parse(Fetch.get_resource_path('schema_menu.xsd')))
-        except XMLSchemaParseError as ex:
-            raise UnrecognizedFileException(f'{Strings.exception_schema_syntax_error}:\n{ex}')
+        self._dependency_graph = DependencyGraph()
 
     def get_directory(self) -> str:
         """
@@ -74,15 +70,29 @@ class DirectoryLoader:
         """
         return self._css_document
 
-    def load_directory(self, directory_path: str) -> None:
+    def get_dependency_graph(self) -> DependencyGraph:
+        """
+        Returns the dependency graph of the loaded articles.
+        :return: The dependency graph of the loaded articles.
+        """
+        return self._dependency_graph
+
+    def load_directory(self, directory_path: str, menus_callback: Callable[[], None] = None,
+                       article_callback: Callable[[WhitebearDocumentArticle], None] = None,
+                       first_article: str = None) -> None:
         """
         Return the selected white bear directory as a dictionary of paths to files with file names as keys.
+        The callbacks are called from the loading thread and allow the gui to show the documents before all of them
+        are parsed.
         :param directory_path: Path to the whitebear web root directory.
+        :param menus_callback: Called once the css, all menus and the index are parsed, before any article is parsed.
+        :param article_callback: Called with every parsed article.
+        :param first_article: File name of the article that should be parsed first, usually the last opened one.
         :return: None
         """
         self._directory_path = directory_path
         if self._is_white_bear_directory(self._directory_path):
-            self._prepare_documents(self._directory_path)
+            self._prepare_documents(self._directory_path, menus_callback, article_callback, first_article)
 
     def _is_white_bear_directory(self, path: str) -> bool:
         """
@@ -103,24 +113,58 @@ class DirectoryLoader:
         else:
             try:
                 xml_doc = html.parse(os.path.join(path, 'index.html'))
-                if not self._xmlschema_index.validate(xml_doc):
-                    raise IndexException(f'{Strings.exception_not_white_bear}\n{self._xmlschema_index.error_log}')
+                is_valid, errors = Tools.validate_tree(xml_doc, 'schema_index.xsd')
+                if not is_valid:
+                    raise IndexException(f'{Strings.exception_not_white_bear}\n' + '\n'.join(errors))
             except XMLSyntaxError as e:
                 raise IndexException(f'{Strings.exception_html_syntax_error}:\n{e}:\nindex.html')
             except ValueError as e:
                 raise IndexException(f'{Strings.exception_html_syntax_error}:\n{e}\nindex.html')
         return True
 
-    def _prepare_documents(self, path: str) -> None:
+    @staticmethod
+    def _recognize(file_path: str) -> str:
+        """
+        Find out which kind of whitebear page a html file is by validating it against the page schemas.
+        :param file_path: Full disk path to the html file.
+        :return: Strings.article, Strings.menu, Strings.index or an empty string for known non-editable files.
+        :raises UnrecognizedFileException if the file is not a whitebear page or can not be parsed.
+        """
+        filename = os.path.basename(file_path)
+        try:
+            xml_doc = html.parse(file_path)
+            if Tools.validate_tree(xml_doc, 'schema_article.xsd')[0]:
+                return Strings.article
+            elif Tools.validate_tree(xml_doc, 'schema_menu.xsd')[0]:
+                return Strings.menu
+            elif Tools.validate_tree(xml_doc, 'schema_index.xsd')[0]:
+                return Strings.index
+            # Skip known non-editable files
+            if 'google' in filename or '404' in filename:
+                return ''
+            raise UnrecognizedFileException(f'{Strings.exception_file_unrecognized} {filename}')
+        except (XMLSyntaxError, ValueError) as e:
+            raise UnrecognizedFileException(f'{Strings.exception_html_syntax_error}\n{e}\n{file_path}')
+
+    @Instrumentation.timed()
+    def _prepare_documents(self, path: str, menus_callback: Callable[[], None] = None,
+                           article_callback: Callable[[WhitebearDocumentArticle], None] = None,
+                           first_article: str = None) -> None:
         """
         Goes through all supposed whitebear files in a directory. Files have to be readable and writeable. Constructs a
-        dictionary {file name:path to the file}.
+        dictionary {file name:path to the file}. Articles are parsed last, the first article first and then the most
+        recently modified ones.
         :param path: Path to the supposed whitebear root directory.
+        :param menus_callback: Called once the css, all menus and the index are parsed.
+        :param article_callback: Called with every parsed article.
+        :param first_article: File name of the article that should be parsed first.
         :raises AccessException if a file are not readable or not writeable.
         :return: None
         :raises UnrecognizedFileException if the file can not be validated
         """
         file: str
+        # Images and files are looked up in the snapshot while parsing instead of asking the disk for each of them.
+        FileSnapshot.get_instance().scan(path)
         # Parse CSS, so we can send the instance into articles for color translation.
         file = os.path.join(path, 'styles.css')
         if os.path.isfile(file):
@@ -142,38 +186,139 @@ class DirectoryLoader:
                 else:
                     filename: str = os.path.basename(file)
                     file_path: str = os.path.realpath(file)
-                    try:
-                        xml_doc = html.parse(os.path.join(path, file))
-                        if self._xmlschema_article.validate(xml_doc):
-                            self._article_documents[filename] = WhitebearDocumentArticle(file_path,
-                                                                                         self._menu_documents,
-                                                                                         self._article_documents,
-                                                                                         self._css_document)
-                        elif self._xmlschema_menu.validate(xml_doc):
-                            menu = WhitebearDocumentMenu(file_path, self._menu_documents)
-                            menu.parse_self()
-                            self._menu_documents[filename] = menu
-                        elif self._xmlschema_index.validate(xml_doc):
-                            self._index_document = WhitebearDocumentIndex(file_path, self._menu_documents,
-                                                                          self._article_documents)
-                        else:
-                            # Skip known non-editable files
-                            if 'google' in filename or '404' in filename:
-                                continue
-                            else:
-                                raise UnrecognizedFileException(f'{Strings.exception_file_unrecognized} {filename}')
-                    except (XMLSyntaxError, ValueError) as e:
-                        raise UnrecognizedFileException(f'{Strings.exception_html_syntax_error}\n{e}\n{file}')
+                    kind = self._recognize(file_path)
+                    if kind == Strings.article:
+                        self._article_documents[filename] = WhitebearDocumentArticle(file_path,
+                                                                                     self._menu_documents,
+                                                                                     self._article_documents,
+                                                                                     self._css_document)
+                    elif kind == Strings.menu:
+                        menu = WhitebearDocumentMenu(file_path, self._menu_documents)
+                        menu.parse_self()
+                        self._menu_documents[filename] = menu
+                    elif kind == Strings.index:
+                        self._index_document = WhitebearDocumentIndex(file_path, self._menu_documents,
+                                                                      self._article_documents)
+
+        try:
+            # Parse index, it does not depend on the articles.
+            self._index_document.parse_self()
+        except IndexError as _:
+            raise WrongFormatException(f'{Strings.exception_broken_html}: {self._index_document.get_path()}')
+        if menus_callback:
+            menus_callback()
 
         # Parse all articles after we have recognized and parsed all menu pages.
-        for article in self._article_documents.values():
+        articles = sorted(self._article_documents.values(), key=lambda doc: (doc.get_filename() != first_article,
+                                                                             -os.path.getmtime(doc.get_path())))
+        for article in articles:
             try:
                 article.parse_self()
                 article.set_index_document(self._index_document)
             except IndexError as _:
                 raise WrongFormatException(f'{Strings.exception_broken_html}: {article.get_path()}')
-        try:
-            # Parse index.
-            self._index_document.parse_self()
-        except IndexError as _:
-            raise WrongFormatException(f'{Strings.exception_broken_html}: {self._index_document.get_path()}')
+            self._dependency_graph.update_article(article)
+            if article_callback:
+                article_callback(article)
+
+    def reload_files(self, paths: Set[str]) -> (Set[str], Set[str], Set[str]):
+        """
+        Reload only the files that were changed on disk by another program. Changed articles, menus, index and css are
+        parsed again and the loaded dictionaries are updated in place. Articles that use a changed image or file and
+        articles that link to created or deleted articles are tested again. Files whose content is the same as the last
+        html saved by the editor are ignored.
+        :param paths: Full disk paths of the changed, created or deleted files.
+        :return: Tuple of the file names of reparsed articles, the file names of articles that were only tested again
+        and the file names of deleted articles.
+        :raises FileNotFoundError if the index page was deleted.
+        :raises AccessException, UnrecognizedFileException, WrongFormatException if a changed file can not be loaded.
+        """
+        root = os.path.realpath(self._directory_path)
+        reparse: Set[str] = set()
+        retest: Set[str] = set()
+        removed: Set[str] = set()
+        new_index = False
+        FileSnapshot.get_instance().update(paths)
+        for path in sorted(paths):
+            directory, filename = os.path.split(path)
+            if path == self._css_document.get_path():
+                # Articles keep only the color names, the instance shared by all articles is updated in place.
+                self._css_document.reload()
+            elif directory == root and filename.endswith(Strings.extension_html):
+                if not os.path.isfile(path):
+                    if filename in self._article_documents:
+                        self._article_documents.pop(filename)
+                        self._index_document.remove_article(filename)
+                        self._dependency_graph.remove_article(filename)
+                        retest.update(self._dependency_graph.get_backlinks(filename))
+                        removed.add(filename)
+                    elif filename in self._menu_documents:
+                        self._menu_documents.pop(filename)
+                        reparse.update(self._dependency_graph.get_menu_articles(filename))
+                    elif filename == os.path.basename(self._index_document.get_path()):
+                        raise FileNotFoundError(f'{Strings.exception_index} {root}')
+                    continue
+                if not os.access(path, os.R_OK) or not os.access(path, os.W_OK):
+                    raise AccessException(f'{Strings.exception_access_html} {path}')
+                if self._is_saved_by_editor(filename, path):
+                    continue
+                kind = self._recognize(path)
+                if kind == Strings.article:
+                    if filename not in self._article_documents:
+                        retest.update(self._dependency_graph.get_backlinks(filename))
+                    reparse.add(filename)
+                elif kind == Strings.menu:
+                    menu = WhitebearDocumentMenu(path, self._menu_documents)
+                    menu.parse_self()
+                    self._menu_documents[filename] = menu
+                    reparse.update(self._dependency_graph.get_menu_articles(filename))
+                elif kind == Strings.index:
+                    new_index = True
+            elif directory.startswith(os.path.join(root, Strings.folder_images)) or \
+                    directory.startswith(os.path.join(root, Strings.folder_files)):
+                retest.update(self._dependency_graph.get_asset_users(path))
+
+        if new_index:
+            self._index_document = WhitebearDocumentIndex(os.path.join(root, Strings.index + Strings.extension_html),
+                                                          self._menu_documents, self._article_documents)
+        for filename in reparse:
+            file_path = os.path.join(root, filename)
+            if not os.path.isfile(file_path):
+                continue
+            article = WhitebearDocumentArticle(file_path, self._menu_documents, self._article_documents,
+                                               self._css_document)
+            try:
+                article.parse_self()
+            except IndexError as _:
+                raise WrongFormatException(f'{Strings.exception_broken_html}: {file_path}')
+            self._article_documents[filename] = article
+            article.set_index_document(self._index_document)
+            self._dependency_graph.update_article(article)
+        if new_index:
+            for article in self._article_documents.values():
+                article.set_index_document(self._index_document)
+            try:
+                self._index_document.parse_self()
+            except IndexError as _:
+                raise WrongFormatException(f'{Strings.exception_broken_html}: {self._index_document.get_path()}')
+        retest = (retest - reparse) & self._article_documents.keys()
+        for filename in retest:
+            with self._article_documents[filename].get_test_lock():
+                self._article_documents[filename].test_self()
+        return reparse & self._article_documents.keys(), retest, removed
+
+    def _is_saved_by_editor(self, filename: str, path: str) -> bool:
+        """
+        Return True if the file on disk contains exactly the html that the editor saved the last time. This prevents
+        reloading documents after the editor saves them.
+        :param filename: The file name of the document.
+        :param path: Full disk path of the document.
+        :return: True if the document on disk is the same as the one loaded in the editor.
+        """
+        document = self._article_documents.get(filename, self._menu_documents.get(filename))
+        if not document and filename == os.path.basename(self._index_document.get_path()):
+            document = self._index_document
+        if not document or not document.get_html_to_save():
+            return False
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read() == document.get_html_to_save()
@@ -5,6 +5,7 @@ class Heading:
     """
     Represents a h3 or h4 heading. Consists of a single instance of Text.
     """
+    __slots__ = ('_text', '_size')
 
     SIZE_H3 = 3
     SIZE_H4 = 4
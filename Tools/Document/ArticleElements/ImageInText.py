@@ -1,10 +1,9 @@
-import os
-
-import wx
-
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Resources.Fetch import Fetch
 from Tools.Document.BaseImage import BaseImage
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Tools import Tools
 
 
 class ImageInText(BaseImage):
@@ -43,29 +42,31 @@ class ImageInText(BaseImage):
         result = super(ImageInText, self).test_self()
 
         # Check thumbnail image disk path
-        if not self._thumbnail_path or not os.path.exists(self._thumbnail_path):
+        if not self._thumbnail_path or not FileSnapshot.get_instance().exists(self._thumbnail_path):
             # The image has generic text and can be reused.
-            self._image = wx.Image(Fetch.get_resource_path('main_image_thumbnail_missing.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('main_image_thumbnail_missing.png'))
             self._thumbnail_size = (0, 0)
             result = False
         else:
             # Image thumbnails in text must not be wider than 534 px.
-            image = wx.Image(Fetch.get_resource_path(self._thumbnail_path), wx.BITMAP_TYPE_ANY)
-            self._thumbnail_size = image.GetSize()
-            if self._thumbnail_size[0] <= Numbers.text_image_max_size:
-                self._image = image
+            try:
+                self._thumbnail_size = Tools.get_image_size(self._thumbnail_path)
+            except OSError as _:
+                self._thumbnail_size = (0, 0)
+            if 0 < self._thumbnail_size[0] <= Numbers.text_image_max_size:
+                self._set_image_path(self._thumbnail_path)
             else:
-                self._image = wx.Image(Fetch.get_resource_path('main_image_thumbnail_wrong.png'), wx.BITMAP_TYPE_PNG)
-                self._thumbnail_size = self._image.GetSize()
+                self._set_image_path(Fetch.get_resource_path('main_image_thumbnail_wrong.png'))
+                self._thumbnail_size = Tools.get_image_size(self._image_path)
                 result = False
 
             # Check full image disk path, size can be whatever the user likes
-            if not self._original_image_path or not os.path.exists(self._original_image_path):
-                self._image = wx.Image(Fetch.get_resource_path('main_image_missing.png'), wx.BITMAP_TYPE_PNG)
+            if not self._original_image_path or not FileSnapshot.get_instance().exists(self._original_image_path):
+                self._set_image_path(Fetch.get_resource_path('main_image_missing.png'))
                 result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
     def __str__(self) -> str:
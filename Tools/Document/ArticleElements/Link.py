@@ -3,13 +3,14 @@ from ssl import SSLCertVerificationError
 from typing import List
 
 import httplib2
-import wx
 
-from Constants.Constants import Numbers, Strings
-from Tools.SpellCheckedObject import SpellCheckedObject
+from Constants.Constants import Numbers, Strings, Status
+from Tools.Document.CachedTestObject import CachedTestObject
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
 
 
-class Link(SpellCheckedObject):
+class Link(CachedTestObject):
     """
     Represents a link inside text.
     """
@@ -38,13 +39,15 @@ class Link(SpellCheckedObject):
 
         self._loaded_pages = loaded_pages
         self._is_local = False
-        self._status_color = None
+        self._status = None
         self._modified = False
+        self._tested_online = False
 
         # Create a unique ID.
         self._link_id = str(Link.count)
         Link.count += 1
 
+    @Instrumentation.timed()
     def test_self(self, online: bool):
         """
         SEO check self for correct title, url and text.
@@ -56,7 +59,7 @@ class Link(SpellCheckedObject):
         self._link_title_error_message = ''
         self._url_error_message = ''
         self._text_error_message = ''
-        self._status_color = wx.WHITE
+        self._status = Status.OK
 
         result = True
         # Check link title
@@ -76,34 +79,35 @@ class Link(SpellCheckedObject):
             result = False
 
         # Check url, if it is one of whitebear pages set local to True and do not try to download it.
-        if self._url in list(self._loaded_pages) or self._url == 'index.html':
+        if self._url in self._loaded_pages or self._url == 'index.html':
             self._is_local = True
         elif self._url.startswith(Strings.folder_files):
             full_path = os.path.join(self._working_directory, self._url)
-            if not os.path.exists(full_path) or not os.access(full_path, os.R_OK) or not os.access(full_path, os.W_OK):
+            if not FileSnapshot.get_instance().is_accessible(full_path):
                 self._url_error_message = Strings.seo_error_url_nonexistent
                 result = False
         else:
             self._is_local = False
             if online:
                 # Cache folder not set because we want to test the existence again every time.
-                h = httplib2.Http(timeout=Numbers.online_test_timeout)
-                try:
-                    resp = h.request(self._url, 'HEAD')
-                    if int(resp[0]['status']) >= 400:
+                with Instrumentation.measure('Link.online_check'):
+                    h = httplib2.Http(timeout=Numbers.online_test_timeout)
+                    try:
+                        resp = h.request(self._url, 'HEAD')
+                        if int(resp[0]['status']) >= 400:
+                            self._url_error_message = Strings.seo_error_url_nonexistent
+                            result = False
+                    except KeyError as _:
+                        self._url_error_message = Strings.seo_error_url_malformed
+                        result = False
+                    except (httplib2.ServerNotFoundError, httplib2.RelativeURIError, SSLCertVerificationError) as _:
                         self._url_error_message = Strings.seo_error_url_nonexistent
                         result = False
-                except KeyError as _:
-                    self._url_error_message = Strings.seo_error_url_malformed
-                    result = False
-                except (httplib2.ServerNotFoundError, httplib2.RelativeURIError, SSLCertVerificationError) as _:
-                    self._url_error_message = Strings.seo_error_url_nonexistent
-                    result = False
-                except (ConnectionResetError, OSError) as _:
-                    # In case we do not have connectivity, ignore the online test. The result would not be relevant.
-                    pass
-                finally:
-                    h.close()
+                    except (ConnectionResetError, OSError) as _:
+                        # In case we do not have connectivity, ignore the online test. The result would not be relevant.
+                        pass
+                    finally:
+                        h.close()
 
         # Spell checks
         if not self._spell_check(self._link_title):
@@ -115,9 +119,27 @@ class Link(SpellCheckedObject):
             result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
+    def test_if_dirty(self, online: bool, force: bool = False) -> bool:
+        """
+        Run the SEO test only if this link or the files on disk changed since the last test or the last test was not
+        online and online test is requested now, otherwise return the last result.
+        :param online: Do online url test.
+        :param force: Run the test even if nothing changed.
+        :return: True if no error is found.
+        """
+        def test() -> bool:
+            """
+            Run the SEO test and remember whether it was online.
+            :return: True if no error is found.
+            """
+            self._tested_online = online
+            return self.test_self(online)
+
+        return self._test_cached(test, force or (online and not self._tested_online))
+
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_id(self) -> str:
         """
@@ -154,12 +176,12 @@ class Link(SpellCheckedObject):
         """
         return list(self._loaded_pages)
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this link. RED if SEO failed.
-        :return: Return the status color of this link. RED if SEO failed.
+        Return the status of this link. ERROR if SEO failed.
+        :return: Return the status of this link. ERROR if SEO failed.
         """
-        return self._status_color
+        return self._status
 
     def is_local(self) -> bool:
         """
@@ -185,6 +207,7 @@ class Link(SpellCheckedObject):
         if self._text != text:
             self._text = text
             self._modified = True
+            self._dirty = True
 
     def set_url(self, url: str) -> None:
         """
@@ -195,6 +218,7 @@ class Link(SpellCheckedObject):
         if self._url != url:
             self._url = url
             self._modified = True
+            self._dirty = True
 
     def set_title(self, title: str) -> None:
         """
@@ -205,6 +229,7 @@ class Link(SpellCheckedObject):
         if self._link_title != title:
             self._link_title = title
             self._modified = True
+            self._dirty = True
 
     def set_local(self, is_local: bool) -> None:
         """
@@ -215,6 +240,7 @@ class Link(SpellCheckedObject):
         if self._is_local != is_local:
             self._is_local = is_local
             self._modified = True
+            self._dirty = True
 
     def set_modified(self, modified: bool) -> None:
         """
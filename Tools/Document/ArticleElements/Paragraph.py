@@ -8,6 +8,7 @@ class Paragraph:
     This class represents one paragraph in an article. A paragraph consists of a list of instances of text, break and
     link.
     """
+    __slots__ = ('_elements_list',)
 
     def __init__(self):
         """
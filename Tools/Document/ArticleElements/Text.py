@@ -1,3 +1,5 @@
+import sys
+
 from Constants.Constants import Strings
 
 
@@ -5,6 +7,7 @@ class Text:
     """
     This class represents a piece of text which can be colored and bold.
     """
+    __slots__ = ('_text', '_bold', '_color')
 
     def __init__(self, text: str, bold: bool = False, color: str = Strings.color_black):
         """
@@ -15,7 +18,8 @@ class Text:
         """
         self._text = text
         self._bold = bold
-        self._color = color
+        # There are only a few color names, all texts share the same string instances.
+        self._color = sys.intern(color) if isinstance(color, str) else color
 
     def get_text(self) -> str:
         """
@@ -44,6 +48,15 @@ class Text:
 
 class Break:
     """
-    Represents a line break but not a new paragraph start.
+    Represents a line break but not a new paragraph start. Breaks carry no data so all of them are one shared instance.
     """
-    pass
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        """
+        Return the shared break instance.
+        """
+        if cls._instance is None:
+            cls._instance = super(Break, cls).__new__(cls)
+        return cls._instance
@@ -7,6 +7,7 @@ class UnorderedList:
     """
     Represents a list in the page. Consists of Paragraph instances.
     """
+    __slots__ = ('_items',)
 
     def __init__(self):
         """
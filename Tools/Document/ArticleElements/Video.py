@@ -1,14 +1,14 @@
 from ssl import SSLCertVerificationError
 
 import httplib2
-import wx
 
-from Constants.Constants import Numbers, Strings
+from Constants.Constants import Numbers, Strings, Status
 from Resources.Fetch import Fetch
-from Tools.SpellCheckedObject import SpellCheckedObject
+from Tools.Document.CachedTestObject import CachedTestObject
+from Tools.Instrumentation import Instrumentation
 
 
-class Video(SpellCheckedObject):
+class Video(CachedTestObject):
     """
     Represents a placeholder for a YouTube video in the text of the page.
     """
@@ -31,9 +31,11 @@ class Video(SpellCheckedObject):
         self._size_error_message: str = ''
         self._url = url
         self._url_error_message: str = ''
-        self._status_color = None
-        self._image = None
+        self._status = None
+        # The SEO test decides which placeholder is displayed, the gui loads it when it needs it.
+        self._image_path = None
         self._modified = False
+        self._tested_online = False
 
         # Create a unique ID.
         self._video_id = str(Video.count)
@@ -50,27 +52,27 @@ class Video(SpellCheckedObject):
         self._link_title_error_message = ''
         self._url_error_message = ''
         self._size_error_message = ''
-        self._status_color = wx.NullColour
+        self._status = Status.NONE
 
         result = True
-        self._image = wx.Image(Fetch.get_resource_path('video_placeholder.png'), wx.BITMAP_TYPE_PNG)
+        self._set_image_path(Fetch.get_resource_path('video_placeholder.png'))
         # Check video link title
         if len(self._link_title) < Numbers.article_image_title_min or len(
                 self._link_title) > Numbers.article_image_title_max:
             self._link_title_error_message = Strings.seo_error_link_title_length
-            self._image = wx.Image(Fetch.get_resource_path('video_seo_error.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('video_seo_error.png'))
             result = False
 
         # Check dimensions
         if self._width != Numbers.video_width or self._height != Numbers.video_height:
             self._size_error_message = Strings.seo_error_video_size_wrong
-            self._image = wx.Image(Fetch.get_resource_path('video_size_incorrect.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('video_size_incorrect.png'))
             result = False
 
         # Check url is an embedded video
         if '/embed/' not in self._url:
             self._url_error_message = Strings.seo_error_video_embed
-            self._image = wx.Image(Fetch.get_resource_path('video_seo_error.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('video_seo_error.png'))
             result = False
 
         # Check url, if online test is not run on document switching this causes wrong results.
@@ -80,14 +82,14 @@ class Video(SpellCheckedObject):
                 resp = h.request(self._url, 'HEAD')
                 if int(resp[0]['status']) >= 400:
                     self._url_error_message = Strings.seo_error_url_nonexistent
-                    self._image = wx.Image(Fetch.get_resource_path('video_seo_error.png'), wx.BITMAP_TYPE_PNG)
+                    self._set_image_path(Fetch.get_resource_path('video_seo_error.png'))
                     result = False
             except KeyError as _:
                 self._url_error_message = Strings.seo_error_url_malformed
                 result = False
             except (httplib2.ServerNotFoundError, httplib2.RelativeURIError, SSLCertVerificationError) as _:
                 self._url_error_message = Strings.seo_error_url_nonexistent
-                self._image = wx.Image(Fetch.get_resource_path('video_seo_error.png'), wx.BITMAP_TYPE_PNG)
+                self._set_image_path(Fetch.get_resource_path('video_seo_error.png'))
                 result = False
             except (ConnectionResetError, OSError) as _:
                 # In case we do not have connectivity, ignore the online test. The result would not be relevant.
@@ -98,27 +100,55 @@ class Video(SpellCheckedObject):
         # Spell check
         if not self._spell_check(self._link_title):
             self._link_title_error_message = Strings.spelling_error
-            self._image = wx.Image(Fetch.get_resource_path('video_seo_error.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('video_seo_error.png'))
             result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
+    def _set_image_path(self, path: str) -> None:
+        """
+        Set the placeholder image file that is displayed in the gui for this video.
+        :param path: Full disk path to the displayed image.
+        :return: None
+        """
+        self._image_path = path
+
+    @Instrumentation.timed()
     def _spell_check(self, text: str) -> bool:
         """
         Do a spellcheck on the text.
         :param text: Text to check.
         :return: Return False if incorrect.
         """
-        self._checker.set_text(text)
+        checker = self._get_checker()
+        checker.set_text(text)
         try:
-            self._checker.next()
+            checker.next()
             return False
         except StopIteration:
             # Next raises exception if no mistake is found.
             return True
 
+    def test_if_dirty(self, online: bool, force: bool = False) -> bool:
+        """
+        Run the SEO test only if this video or the files on disk changed since the last test or the last test was not
+        online and online test is requested now, otherwise return the last result.
+        :param online: Do online url test.
+        :param force: Run the test even if nothing changed.
+        :return: True if no error is found.
+        """
+        def test() -> bool:
+            """
+            Run the SEO test and remember whether it was online.
+            :return: True if no error is found.
+            """
+            self._tested_online = online
+            return self.test_self(online)
+
+        return self._test_cached(test, force or (online and not self._tested_online))
+
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_id(self) -> str:
         """
@@ -127,12 +157,12 @@ class Video(SpellCheckedObject):
         """
         return self._video_id
 
-    def get_image(self) -> wx.Image:
+    def get_display_image_path(self) -> str:
         """
-        Return the placeholder image. Either correct video placeholder or error image.
-        :return: Return the placeholder image. Either correct video placeholder or error image.
+        Return the disk path of the placeholder image. Either correct video placeholder or error image.
+        :return: Return the disk path of the placeholder image, None if the video was not tested yet.
         """
-        return self._image
+        return self._image_path
 
     def get_title(self) -> (str, str):
         """
@@ -162,12 +192,12 @@ class Video(SpellCheckedObject):
         """
         return self._width, self._height
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this video. White if ok, Red if SEO check failed.
-        :return: Return the status color of this video. White if ok, Red if SEO check failed.
+        Return the status of this video. NONE if ok, ERROR if SEO check failed.
+        :return: Return the status of this video. NONE if ok, ERROR if SEO check failed.
         """
-        return self._status_color
+        return self._status
 
     def is_modified(self) -> bool:
         """
@@ -186,6 +216,7 @@ class Video(SpellCheckedObject):
         if self._link_title != title:
             self._link_title = title
             self._modified = True
+            self._dirty = True
 
     def set_url(self, url) -> None:
         """
@@ -196,6 +227,7 @@ class Video(SpellCheckedObject):
         if self._url != url:
             self._url = url
             self._modified = True
+            self._dirty = True
 
     def set_modified(self, modified: bool) -> None:
         """
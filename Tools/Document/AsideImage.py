@@ -1,11 +1,10 @@
-import os
-
-import wx
-
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
 from Resources.Fetch import Fetch
 from Tools.Document.BaseImage import BaseImage
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Tools import Tools
 
 
 class AsideImage(BaseImage):
@@ -62,24 +61,25 @@ class AsideImage(BaseImage):
             result = False
 
         # Check thumbnail image disk path
-        if not self._thumbnail_path or not os.path.exists(self._thumbnail_path):
+        if not self._thumbnail_path or not FileSnapshot.get_instance().exists(self._thumbnail_path):
             # The image has the same dimensions as the main image
-            self._image = wx.Image(Fetch.get_resource_path('main_image_thumbnail_missing.png'), wx.BITMAP_TYPE_PNG)
+            self._set_image_path(Fetch.get_resource_path('main_image_thumbnail_missing.png'))
             self._thumbnail_size = (0, 0)
             result = False
         else:
-            image = wx.Image(Fetch.get_resource_path(self._thumbnail_path), wx.BITMAP_TYPE_ANY)
-            self._thumbnail_size = image.GetSize()
+            try:
+                self._thumbnail_size = Tools.get_image_size(self._thumbnail_path)
+            except OSError as _:
+                self._thumbnail_size = (0, 0)
             if self._thumbnail_size == (Numbers.main_image_width, Numbers.main_image_height):
-                self._image = image
+                self._set_image_path(self._thumbnail_path)
             else:
-                self._image = wx.Image(Fetch.get_resource_path('main_image_thumbnail_wrong.png'), wx.BITMAP_TYPE_PNG)
-                self._thumbnail_size = image.GetSize()
+                self._set_image_path(Fetch.get_resource_path('main_image_thumbnail_wrong.png'))
                 result = False
 
             # Check full image disk path, size can be whatever the user likes
-            if not self._original_image_path or not os.path.exists(self._original_image_path):
-                self._image = wx.Image(Fetch.get_resource_path('main_image_missing.png'), wx.BITMAP_TYPE_PNG)
+            if not self._original_image_path or not FileSnapshot.get_instance().exists(self._original_image_path):
+                self._set_image_path(Fetch.get_resource_path('main_image_missing.png'))
                 result = False
 
         # Spell check
@@ -88,7 +88,7 @@ class AsideImage(BaseImage):
             result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
     # Getters ----------------------------------------------------------------------------------------------------------
@@ -109,6 +109,7 @@ class AsideImage(BaseImage):
         if self._caption != caption:
             self._caption = caption
             self._modified = True
+            self._dirty = True
 
     def __str__(self) -> str:
         return "Aside image: {}, original: {}, thumbnail: {}, title: {}, alt: {}".format(self._caption,
@@ -1,14 +1,15 @@
 import os
-
-import wx
+from typing import List, Tuple
 
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
-from Resources.Fetch import Fetch
-from Tools.SpellCheckedObject import SpellCheckedObject
+from Tools.Document.CachedTestObject import CachedTestObject
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Tools import Tools
 
 
-class BaseImage(SpellCheckedObject):
+class BaseImage(CachedTestObject):
     """
     Base class for AsideImage and ImageInText.
     """
@@ -35,8 +36,9 @@ class BaseImage(SpellCheckedObject):
         self._thumbnail_path = thumbnail_path
         self._full_filename = full_filename
         self._thumbnail_filename = thumbnail_filename
-        self._image = None
-        self._status_color = None
+        # The SEO test decides which file is displayed, the gui loads it when it needs it.
+        self._image_path = None
+        self._status = None
         self._thumbnail_size = (0, 0)
         self._original_size = (0, 0)
         self._modified = False
@@ -55,7 +57,7 @@ class BaseImage(SpellCheckedObject):
         # Clear all error before each retest
         self._link_title_error_message = ''
         self._image_alt_error_message = ''
-        self._status_color = wx.NullColour
+        self._status = Status.NONE
 
         result = True
         # Check article image link title
@@ -88,9 +90,17 @@ class BaseImage(SpellCheckedObject):
             result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
+    def _set_image_path(self, path: str) -> None:
+        """
+        Set the image file that is displayed in the gui for this image. Either the thumbnail or a warning image.
+        :param path: Full disk path to the displayed image.
+        :return: None
+        """
+        self._image_path = path
+
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_id(self) -> str:
         """
@@ -148,24 +158,19 @@ class BaseImage(SpellCheckedObject):
         """
         return self._full_filename
 
-    def get_image(self, normal: bool = False) -> wx.Image:
+    def get_display_image_path(self) -> str:
         """
-        Return the image as wx image instance. If there was a seo error the image will be red.
-        :param normal: Do not return red image even if there was a problem.
-        :return: Return the image as wx image instance.
+        Return the disk path of the image that should be displayed in the gui. Either the thumbnail or a warning image.
+        :return: Return the disk path of the displayed image, None if the image was not tested yet.
         """
-        if normal:
-            return self._image
-        if self._status_color == wx.RED:
-            return self._image.AdjustChannels(0.9, 0.5, 0.5)
-        return self._image
+        return self._image_path
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this image. White if ok, Red if SEO check failed.
-        :return: Return the status color of this image. White if ok, Red if SEO check failed.
+        Return the status of this image. NONE if ok, ERROR if SEO check failed.
+        :return: Return the status of this image. NONE if ok, ERROR if SEO check failed.
         """
-        return self._status_color
+        return self._status
 
     def get_thumbnail_size(self) -> (int, int):
         """
@@ -174,6 +179,24 @@ class BaseImage(SpellCheckedObject):
         """
         return self._thumbnail_size
 
+    def get_srcset(self) -> List[Tuple[str, int]]:
+        """
+        Return the thumbnail and its other widths that exist on disk for the srcset attribute. The thumbnail size is
+        known after the image was tested.
+        :return: List of tuples (file name, width) sorted by width, empty if there are no other widths.
+        """
+        width = self._thumbnail_size[0]
+        if not width or not self._thumbnail_path:
+            return []
+        snapshot = FileSnapshot.get_instance()
+        srcset = [(self._thumbnail_filename, width)]
+        for other_width in Tools.get_srcset_widths(width):
+            if snapshot.exists(Tools.get_width_image_path(self._thumbnail_path, other_width)):
+                srcset.append((Tools.get_width_image_path(self._thumbnail_filename, other_width), other_width))
+        if len(srcset) == 1:
+            return []
+        return sorted(srcset, key=lambda item: item[1])
+
     def get_original_size(self) -> (int, int):
         """
         Return a tuple of this image's original size (width, height).
@@ -183,8 +206,10 @@ class BaseImage(SpellCheckedObject):
             return None
         if not os.path.exists(self._original_image_path):
             return None
-        image = wx.Image(Fetch.get_resource_path(self._original_image_path), wx.BITMAP_TYPE_ANY)
-        self._original_size = image.GetSize()
+        try:
+            self._original_size = Tools.get_image_size(self._original_image_path)
+        except OSError as _:
+            return None
         return self._original_size
 
     # Setters ----------------------------------------------------------------------------------------------------------
@@ -197,6 +222,7 @@ class BaseImage(SpellCheckedObject):
         if self._link_title != title:
             self._link_title = title
             self._modified = True
+            self._dirty = True
 
     def set_alt(self, alt: str) -> None:
         """
@@ -207,6 +233,7 @@ class BaseImage(SpellCheckedObject):
         if self._image_alt != alt:
             self._image_alt = alt
             self._modified = True
+            self._dirty = True
 
     def set_original_image_path(self, path: str) -> None:
         """
@@ -217,6 +244,7 @@ class BaseImage(SpellCheckedObject):
         if self._original_image_path != path:
             self._original_image_path = path
             self._modified = True
+            self._dirty = True
 
     def set_thumbnail_image_path(self, path: str) -> None:
         """
@@ -227,6 +255,7 @@ class BaseImage(SpellCheckedObject):
         if self._thumbnail_path != path:
             self._thumbnail_path = path
             self._modified = True
+            self._dirty = True
 
     def set_full_filename(self, name: str) -> None:
         """
@@ -237,6 +266,7 @@ class BaseImage(SpellCheckedObject):
         if self._full_filename != name:
             self._full_filename = name
             self._modified = True
+            self._dirty = True
 
     def set_thumbnail_filename(self, name: str) -> None:
         """
@@ -247,6 +277,7 @@ class BaseImage(SpellCheckedObject):
         if self._thumbnail_filename != name:
             self._thumbnail_filename = name
             self._modified = True
+            self._dirty = True
 
     def set_modified(self, modified: bool) -> None:
         """
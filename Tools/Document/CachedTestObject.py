@@ -0,0 +1,50 @@
+from typing import Callable
+
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
+from Tools.SpellCheckedObject import SpellCheckedObject
+
+
+class CachedTestObject(SpellCheckedObject):
+    """
+    Base class for images, menu items, links and videos that keep their last SEO test result until they change. The
+    result also becomes outdated when files or pages of the working directory change on disk, because the tests check
+    that the files and pages they point to exist.
+    """
+
+    def __init__(self):
+        """
+        Constructor for a cached test object base class.
+        """
+        super().__init__()
+        # The last SEO test result is kept until a setter changes this object or the files on disk change.
+        self._dirty = True
+        self._test_result = False
+        self._tested_version = -1
+
+    def _test_cached(self, test: Callable[[], bool], force: bool) -> bool:
+        """
+        Run the test only if this object or the files on disk changed since the last test, otherwise return the last
+        result.
+        :param test: The SEO test of this object.
+        :param force: Run the test even if nothing changed.
+        :return: True if test is ok, False otherwise
+        """
+        # Taken before the test, files that change while the test runs are noticed by the next test.
+        version = FileSnapshot.get_instance().get_version()
+        if self._dirty or force or version != self._tested_version:
+            self._test_result = test()
+            self._tested_version = version
+            self._dirty = False
+        else:
+            Instrumentation.count(f'{type(self).__name__}.test_skipped')
+        return self._test_result
+
+    def test_if_dirty(self, force: bool = False) -> bool:
+        """
+        Run the SEO test only if this object or the files on disk changed since the last test, otherwise return the
+        last result.
+        :param force: Run the test even if nothing changed.
+        :return: True if test is ok, False otherwise
+        """
+        return self._test_cached(self.test_self, force)
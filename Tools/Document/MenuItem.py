@@ -1,12 +1,12 @@
-import wx
-
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
 from Resources.Fetch import Fetch
-from Tools.SpellCheckedObject import SpellCheckedObject
+from Tools.Document.CachedTestObject import CachedTestObject
+from Tools.Tools import Tools
 
 
-class MenuItem(SpellCheckedObject):
+class MenuItem(CachedTestObject):
     """
     Carrier class for a parsed menu item.
     """
@@ -30,9 +30,11 @@ class MenuItem(SpellCheckedObject):
         self._image_alt_error_message: str = ''
         self._href = href
         self._menu_image_path = disk_path
-        self._menu_image = None
+        # The SEO test decides which file is displayed, the gui loads it when it needs it.
+        self._menu_image_shown_path = None
+        self._menu_image_size = (0, 0)
         self._modified = False
-        self._status_color = None
+        self._status = None
         self._filename = img_filename
         self._article = None
 
@@ -54,7 +56,7 @@ class MenuItem(SpellCheckedObject):
         self._article_name_error_message: str = ''
         self._link_title_error_message: str = ''
         self._image_alt_error_message: str = ''
-        self._status_color = wx.NullColour
+        self._status = Status.NONE
 
         result = True
         # Check page name length must be at least 3 and must not be default
@@ -69,18 +71,18 @@ class MenuItem(SpellCheckedObject):
 
         # Check menu image disk path
         if not self._menu_image_path:
-            self._menu_image = wx.Image(Fetch.get_resource_path('menu_image_missing.png'), wx.BITMAP_TYPE_PNG)
+            self._set_menu_image(Fetch.get_resource_path('menu_image_missing.png'))
             result = False
         else:
             try:
-                image = wx.Image(Fetch.get_resource_path(self._menu_image_path), wx.BITMAP_TYPE_ANY)
-                if image.GetSize() == (Numbers.menu_logo_image_size, Numbers.menu_logo_image_size):
-                    self._menu_image = image
+                size = Tools.get_image_size(self._menu_image_path)
+                if size == (Numbers.menu_logo_image_size, Numbers.menu_logo_image_size):
+                    self._set_menu_image(self._menu_image_path)
                 else:
-                    self._menu_image = wx.Image(Fetch.get_resource_path('menu_image_wrong.png'), wx.BITMAP_TYPE_PNG)
+                    self._set_menu_image(Fetch.get_resource_path('menu_image_wrong.png'))
                     result = False
-            except FileNotFoundError as _:
-                self._menu_image = wx.Image(Fetch.get_resource_path('menu_image_missing.png'), wx.BITMAP_TYPE_PNG)
+            except OSError as _:
+                self._set_menu_image(Fetch.get_resource_path('menu_image_missing.png'))
                 result = False
 
         # Check article image link title
@@ -117,9 +119,18 @@ class MenuItem(SpellCheckedObject):
             result = False
 
         if not result:
-            self._status_color = wx.RED
+            self._status = Status.ERROR
         return result
 
+    def _set_menu_image(self, path: str) -> None:
+        """
+        Set the image file that is displayed in the gui for this menu item. Either the logo or a warning image.
+        :param path: Full disk path to the displayed image.
+        :return: None
+        """
+        self._menu_image_shown_path = path
+        self._menu_image_size = Tools.get_image_size(path)
+
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_article_name(self) -> (str, str):
         """
@@ -157,24 +168,19 @@ class MenuItem(SpellCheckedObject):
         """
         return self._menu_image_path
 
-    def get_image(self, normal: bool = False) -> wx.Image:
+    def get_display_image_path(self) -> str:
         """
-        Return the image as wx image instance. If there was a seo error the image will be red.
-        :param normal: Do not return red image even if there was a problem.
-        :return: Return the image as wx image instance.
+        Return the disk path of the image that should be displayed in the gui. Either the logo or a warning image.
+        :return: Return the disk path of the displayed image, None if the menu item was not tested yet.
         """
-        if normal:
-            return self._menu_image
-        if self._status_color == wx.RED:
-            return self._menu_image.AdjustChannels(0.9, 0.5, 0.5)
-        return self._menu_image
+        return self._menu_image_shown_path
 
     def get_image_size(self) -> (int, int):
         """
         Return the menu image size (width, height).
         :return: Return the menu image size (width, height).
         """
-        return self._menu_image.GetSize()
+        return self._menu_image_size
 
     def get_filename(self) -> str:
         """
@@ -190,12 +196,12 @@ class MenuItem(SpellCheckedObject):
         """
         return self._article
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this item.
-        :return: Return the status color of this menu item.
+        Return the status of this item.
+        :return: Return the status of this menu item.
         """
-        return self._status_color
+        return self._status
 
     def is_modified(self) -> bool:
         """
@@ -214,6 +220,7 @@ class MenuItem(SpellCheckedObject):
         if self._article != article:
             self._article = article
             self._modified = True
+            self._dirty = True
 
     def set_article_name(self, new_name: str) -> None:
         """
@@ -224,6 +231,7 @@ class MenuItem(SpellCheckedObject):
         if self._article_name != new_name:
             self._article_name = new_name
             self._modified = True
+            self._dirty = True
 
     def set_link_title(self, new_title: str) -> None:
         """
@@ -234,6 +242,7 @@ class MenuItem(SpellCheckedObject):
         if self._link_title != new_title:
             self._link_title = new_title
             self._modified = True
+            self._dirty = True
 
     def set_image_alt(self, new_alt: str) -> None:
         """
@@ -244,6 +253,7 @@ class MenuItem(SpellCheckedObject):
         if self._image_alt != new_alt:
             self._image_alt = new_alt
             self._modified = True
+            self._dirty = True
 
     def set_href(self, new_href: str) -> None:
         """
@@ -254,6 +264,7 @@ class MenuItem(SpellCheckedObject):
         if self._href != new_href:
             self._href = new_href
             self._modified = True
+            self._dirty = True
 
     def set_image_path(self, new_path: str) -> None:
         """
@@ -264,6 +275,7 @@ class MenuItem(SpellCheckedObject):
         if self._menu_image_path != new_path:
             self._menu_image_path = new_path
             self._modified = True
+            self._dirty = True
 
     def set_filename(self, filename: str) -> None:
         """
@@ -274,6 +286,7 @@ class MenuItem(SpellCheckedObject):
         if self._filename != filename:
             self._filename = filename
             self._modified = True
+            self._dirty = True
 
     def set_modified(self, modified: bool) -> None:
         """
@@ -1,13 +1,20 @@
 import os
+import threading
+from typing import Dict
 
 import htmlmin
-import wx
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
 from Exceptions.WrongFormatException import WrongFormatException
+from Tools.Document.BaseImage import BaseImage
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
 from Tools.SpellCheckedObject import SpellCheckedObject
+from Tools.Tools import Tools
 
 
 class WhitebearDocument(SpellCheckedObject):
@@ -33,7 +40,9 @@ class WhitebearDocument(SpellCheckedObject):
         self._uploaded = True
         # We create instances of documents after validation, so we already know they are valid.
         self._valid = True
-        self._status_color = None
+        self._status = None
+        # Tests change the state of the document and its elements, only one thread may test or convert it at a time.
+        self._test_lock = threading.RLock()
 
         # Page data
         self._parsed_html = None
@@ -45,6 +54,33 @@ class WhitebearDocument(SpellCheckedObject):
         self._meta_description: str = ''
         self._description_error_message: str = ''
 
+    def __getstate__(self) -> Dict:
+        """
+        Return the state of this document for pickling. Locks can not be pickled, the lock is left out.
+        :return: The state of this document without the lock.
+        """
+        state = self.__dict__.copy()
+        del state['_test_lock']
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Restore the state of an unpickled document and create a new lock for it.
+        :param state: The state of the document without the lock.
+        :return: None
+        """
+        self.__dict__.update(state)
+        self._test_lock = threading.RLock()
+
+    def get_test_lock(self) -> threading.RLock:
+        """
+        Return the lock that must be held while this document is tested, converted or its text is replaced for a test.
+        Background threads and the gui thread take it so that their tests do not run at the same time.
+        :return: The test lock of this document.
+        """
+        return self._test_lock
+
+    @Instrumentation.timed()
     def parse_self(self) -> None:
         """
         Parse this document and fill internal variables with content. Only call this after the subclass has validated
@@ -52,8 +88,8 @@ class WhitebearDocument(SpellCheckedObject):
         :return: None
         :raises WrongFormatException: if there is a problem with parsing the document.
         """
-        # Reset color when we reparse from disk.
-        self._status_color = None
+        # Reset status when we reparse from disk.
+        self._status = None
         self._get_parsed_html()
         self._parse_meta_description()
         self._parse_meta_keywords()
@@ -97,15 +133,15 @@ class WhitebearDocument(SpellCheckedObject):
             # Does not preserve &nbsp
             self._parsed_html = BeautifulSoup(minimized, 'html5lib')
 
-    def seo_test_keywords(self, keywords: str) -> (bool, str, wx.Colour):
+    def seo_test_keywords(self, keywords: str) -> (bool, str, Status):
         """
-        SEO test keywords and return False, error string and new status color if incorrect.
+        SEO test keywords and return False, error string and new status if incorrect.
         :param keywords: The keywords to check.
-        :return: Return False, error string and new status color if incorrect.
+        :return: Return False, error string and new status if incorrect.
         """
         keywords_error_message = Strings.status_ok
         result = True
-        color = Numbers.GREEN_COLOR
+        status = Status.OK
         keywords_length = 0
         if ',' not in keywords:
             keywords_error_message = Strings.seo_error_keywords_format
@@ -127,18 +163,18 @@ class WhitebearDocument(SpellCheckedObject):
             result = False
 
         if not result:
-            color = Numbers.RED_COLOR
-        return result, keywords_error_message, color
+            status = Status.ERROR
+        return result, keywords_error_message, status
 
-    def seo_test_description(self, description: str) -> (bool, str, wx.Colour):
+    def seo_test_description(self, description: str) -> (bool, str, Status):
         """
-        SEO test description and return False, error string and new status color if incorrect.
+        SEO test description and return False, error string and new status if incorrect.
         :param description: The description to check
-        :return: Return False, error string and new status color if incorrect.
+        :return: Return False, error string and new status if incorrect.
         """
         description_error_message = Strings.status_ok
         result = True
-        color = Numbers.GREEN_COLOR
+        status = Status.OK
         if len(description) < Numbers.description_min_length or len(description) > Numbers.description_max_length:
             description_error_message = Strings.seo_error_description_length
             result = False
@@ -152,18 +188,18 @@ class WhitebearDocument(SpellCheckedObject):
             result = False
 
         if not result:
-            color = Numbers.RED_COLOR
-        return result, description_error_message, color
+            status = Status.ERROR
+        return result, description_error_message, status
 
-    def seo_test_name(self, name: str) -> (bool, str, wx.Colour):
+    def seo_test_name(self, name: str) -> (bool, str, Status):
         """
-        SEO test article name and return False, error string and new status color if incorrect.
+        SEO test article name and return False, error string and new status if incorrect.
         :param name: The name to check
-        :return: Return False, error string and new status color if incorrect.
+        :return: Return False, error string and new status if incorrect.
         """
         page_name_error_message = Strings.status_ok
         result = True
-        color = Numbers.GREEN_COLOR
+        status = Status.OK
         if len(name) < Numbers.article_name_min_length or len(name) > Numbers.article_name_max_length:
             page_name_error_message = Strings.seo_error_name_length
             result = False
@@ -176,13 +212,84 @@ class WhitebearDocument(SpellCheckedObject):
             result = False
 
         if not result:
-            color = Numbers.RED_COLOR
-        return result, page_name_error_message, color
+            status = Status.ERROR
+        return result, page_name_error_message, status
+
+    @staticmethod
+    def _set_srcset(img: Tag, image: BaseImage, display_width: int) -> None:
+        """
+        Offer the other widths of the thumbnail of an image in the srcset attribute of its image tag so browsers on
+        small screens and high density displays download the best fitting size.
+        :param img: The image tag.
+        :param image: The image whose thumbnail is shown.
+        :param display_width: Width of the image in the page in css pixels.
+        :return: None
+        """
+        srcset = image.get_srcset()
+        if srcset:
+            img['srcset'] = ', '.join(f'{file_name} {width}w' for file_name, width in srcset)
+            img['sizes'] = f'{display_width}px'
+
+    def _link_minified_css(self, soup: BeautifulSoup) -> None:
+        """
+        Link the minified copy of the stylesheet instead of the stylesheet if the output is minified and create the
+        copy if it is missing or out of date.
+        :param soup: The parsed template.
+        :return: None
+        """
+        if not self._config_manager.get_minify():
+            return
+        try:
+            Tools.create_minified_css(self._working_directory)
+        except OSError as _:
+            # Without the copy the page keeps linking the stylesheet.
+            return
+        soup.find(name='link', attrs={'rel': 'stylesheet'})['href'] = Strings.css_minified_file
+
+    def _minify(self, html: str) -> str:
+        """
+        Remove comments and unneeded whitespace from validated html if the output is minified. The same whitespace is
+        removed when a page is parsed, so the editor reads the minified page back exactly as the original one.
+        :param html: The validated html code of the page.
+        :return: The html code to save.
+        """
+        if not self._config_manager.get_minify():
+            return html
+        return htmlmin.minify(html, remove_empty_space=True, remove_comments=True)
+
+    def _wrap_in_picture(self, img: Tag, soup: BeautifulSoup) -> None:
+        """
+        Wrap an image tag into a picture tag with a source for each avif and webp variant of the image that exists on
+        disk. Browsers choose the first variant they support and fall back to the original image. If the image tag has
+        a srcset, the sources offer the variants of all its widths.
+        :param img: The image tag that is already placed in the page.
+        :param soup: The parsed template for creating new tags.
+        :return: None
+        """
+        if img.get('srcset'):
+            candidates = [candidate.split(' ') for candidate in img['srcset'].split(', ')]
+        else:
+            candidates = [[img['src']]]
+        snapshot = FileSnapshot.get_instance()
+        sources = []
+        for _, extension, mime in Strings.image_variants:
+            srcset = [' '.join([candidate[0] + extension] + candidate[1:]) for candidate in candidates
+                      if snapshot.exists(os.path.join(self._working_directory, candidate[0] + extension))]
+            if srcset:
+                source = soup.new_tag('source', attrs={'srcset': ', '.join(srcset), 'type': mime})
+                if img.get('sizes'):
+                    source['sizes'] = img['sizes']
+                sources.append(source)
+        if not sources:
+            return
+        img.wrap(soup.new_tag('picture'))
+        for source in sources:
+            img.insert_before(source)
 
     def test_self_basic(self) -> bool:
         """
         Perform basic self test and change internal instance state accordingly. If description, keywords or name are
-        incorrect, change valid to False with set_status_color and change the color of the file list item to red, clear
+        incorrect, change valid to False with set_status and the file list item is shown as failed, clear
         last known converted html. Errors found in the validation are saved are then returned along with the data by
         getter methods.
         :return: False if seo test failed.
@@ -191,21 +298,21 @@ class WhitebearDocument(SpellCheckedObject):
         self._page_name_error_message: str = ''
         self._keywords_error_message: str = ''
         self._description_error_message: str = ''
-        self._status_color = wx.WHITE
+        self._status = Status.OK
 
         # Check meta keywords
-        keywords_result, message, color = self.seo_test_keywords(', '.join(self._meta_keywords))
+        keywords_result, message, status = self.seo_test_keywords(', '.join(self._meta_keywords))
         self._keywords_error_message = message
         if not keywords_result:
-            self.set_status_color(color)
+            self.set_status(status)
 
         # Check meta description
-        description_result, message, color = self.seo_test_description(self._meta_description)
+        description_result, message, status = self.seo_test_description(self._meta_description)
         self._description_error_message = message
         if not description_result:
-            self.set_status_color(color)
+            self.set_status(status)
 
-        if self.get_status_color() == Numbers.RED_COLOR:
+        if self.get_status() == Status.ERROR:
             return False
         return True
 
@@ -226,10 +333,10 @@ class WhitebearDocument(SpellCheckedObject):
 
     def is_seo_ok(self) -> bool:
         """
-        Returns True if the document passed last SEO check and does not have red status color.
-        :return: True if the document passed last SEO check and does not have red status color.
+        Returns True if the document passed last SEO check and does not have error status.
+        :return: True if the document passed last SEO check and does not have error status.
         """
-        return self._status_color != Numbers.RED_COLOR
+        return self._status != Status.ERROR
 
     def is_saved(self) -> bool:
         """
@@ -303,12 +410,12 @@ class WhitebearDocument(SpellCheckedObject):
         """
         return self._working_directory
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this document. White if ok, Red if SEO check failed, Blue if modified.
-        :return: Return the status color of this document. White if ok, Red if SEO check failed, Blue if modified.
+        Return the status of this document. OK if ok, ERROR if SEO check failed, CHANGED if modified.
+        :return: Return the status of this document. OK if ok, ERROR if SEO check failed, CHANGED if modified.
         """
-        return self._status_color
+        return self._status
 
     def set_html(self, html: str) -> None:
         """
@@ -366,7 +473,7 @@ class WhitebearDocument(SpellCheckedObject):
 
     def set_modified(self, modified: bool) -> None:
         """
-        Set the modified attribute and blue color.
+        Set the modified attribute.
         :raises TypeError if the new modified parameter is not bool.
         :param modified: New modified attribute state.
         :return: None
@@ -384,14 +491,14 @@ class WhitebearDocument(SpellCheckedObject):
         self._file_name = name
         self.set_modified(True)
 
-    def set_status_color(self, new_color: wx.Colour) -> None:
+    def set_status(self, new_status: Status) -> None:
         """
-        Set new status color. If the color is red, set valid to False.
-        :param new_color: New wx.Colour color.
+        Set new status. If the status is ERROR, set valid to False.
+        :param new_status: New Status.
         :return: None
         """
-        self._status_color = new_color
-        if new_color == Numbers.RED_COLOR:
+        self._status = new_status
+        if new_status == Status.ERROR:
             self._valid = False
 
     def set_saved(self, saved: bool) -> None:
@@ -3,11 +3,11 @@ import os
 import re
 from typing import List, Dict
 
-import wx
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
 
 from Constants.Constants import Numbers
+from Constants.Constants import Status
 from Constants.Constants import Strings
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Exceptions.WrongFormatException import WrongFormatException
@@ -25,6 +25,8 @@ from Tools.Document.WhitebearDocument import WhitebearDocument
 from Tools.Document.WhitebearDocumentCSS import WhitebearDocumentCSS
 from Tools.Document.WhitebearDocumentIndex import WhitebearDocumentIndex
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
 from Tools.Tools import Tools
 
 
@@ -34,6 +36,8 @@ class WhitebearDocumentArticle(WhitebearDocument):
     with the file along with getters and setters for easy access and methods for working with the file.
     This is just a container for easy manipulation.
     """
+    # Czech month name to month number, shared by all articles for date conversion.
+    month_numbers: Dict[str, int] = {k: v for k, v in zip(Strings.cz_months.split('|'), range(1, 13))}
 
     def __init__(self, path: str, menus: Dict[str, WhitebearDocumentMenu], articles,
                  css: WhitebearDocumentCSS):
@@ -61,8 +65,14 @@ class WhitebearDocumentArticle(WhitebearDocument):
         self._links = []
         self._text_images = []
         self._videos = []
+        # The same elements by their id, the text area looks them up for every link run and field it displays.
+        self._links_by_id: Dict[str, Link] = {}
+        self._text_images_by_id: Dict[str, ImageInText] = {}
+        self._videos_by_id: Dict[str, Video] = {}
 
         self._date = ''
+        # Float timestamp of the date, computed whenever the date changes because sorting articles needs it often.
+        self._computable_date: float = 1
         self._date_error_message: str = ''
         self._spelling_error_message: str = ''
         self._main_text = None
@@ -71,6 +81,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         self._article_image = None
         self._html = ''
 
+    @Instrumentation.timed()
     def parse_self(self) -> None:
         """
         Parse this document and fill internal variables with content.
@@ -86,17 +97,18 @@ class WhitebearDocumentArticle(WhitebearDocument):
         self._parse_aside_images()
         self._parse_main_text()
         self._parse_enabled_attribute()
-        self.test_self(self._config_manager.get_online_test())
+        # Only the offline test, links and videos are tested online in the background after the whole directory loads.
+        self.test_self()
 
-    def seo_test_date(self, date: str) -> (bool, str, wx.Colour):
+    def seo_test_date(self, date: str) -> (bool, str, Status):
         """
-        SEO test date and return False, error string and new status color if incorrect.
+        SEO test date and return False, error string and new status if incorrect.
         :param date: The name to check
-        :return: Return False, error string and new status color if incorrect.
+        :return: Return False, error string and new status if incorrect.
         """
         date_error_message = Strings.status_ok
         result = True
-        color = Numbers.GREEN_COLOR
+        status = Status.OK
         if not re.search(self._date_regex, date):
             date_error_message = Strings.seo_error_date_format
             result = False
@@ -113,76 +125,84 @@ class WhitebearDocumentArticle(WhitebearDocument):
                 result = False
 
         if not result:
-            color = Numbers.RED_COLOR
-        return result, date_error_message, color
+            status = Status.ERROR
+        return result, date_error_message, status
 
-    def test_self(self, online=False) -> bool:
+    @Instrumentation.timed()
+    def test_self(self, online=False, changed_only=False) -> bool:
         """
-        Perform a SEO test on this document and set new status color.
-        # white - ok, saved, uploaded
-        # blue - ok, not uploaded
-        # red - error, turns to blue when fixed.
+        Perform a SEO test on this document and set new status.
+        # OK - ok, saved, uploaded
+        # CHANGED - ok, not uploaded
+        # ERROR - error, turns to CHANGED when fixed.
         # bold - modified and not saved.
         :param online: Do online test of urls.
+        :param changed_only: Retest only images, links and videos that changed since their last test and reuse the last
+        result of the rest. Changes on disk or in the spellchecker dictionary are not noticed this way.
         :return: True if seo test passed.
         """
-        # Check meta keywords and description. Resets color to white in the beginning. Result color might be red.
+        force = not changed_only
+        # Check meta keywords and description. Resets status to OK in the beginning. Result might be ERROR.
         basic_result: bool = super(WhitebearDocumentArticle, self).test_self_basic()
         if basic_result and (self.is_modified() or not self.is_uploaded()):
-            self.set_status_color(Numbers.BLUE_COLOR)
+            self.set_status(Status.CHANGED)
         # Clear all errors on every new test
         self._date_error_message: str = ''
         self._spelling_error_message: str = ''
 
         # Check page name length must be at least 3 and must not be default.
-        name_result, message, color = self.seo_test_name(self._page_name)
+        name_result, message, status = self.seo_test_name(self._page_name)
         # Message may contain OK if seo passed.
         self._page_name_error_message = message
         if not name_result:
-            self.set_status_color(color)
+            self.set_status(status)
 
         # Check date format
-        date_result, message, color = self.seo_test_date(self._date)
+        date_result, message, status = self.seo_test_date(self._date)
         self._date_error_message = message
         if not date_result:
-            self.set_status_color(color)
+            self.set_status(status)
 
         # Test main image
-        if not self._article_image.test_self():
-            self.set_status_color(Numbers.RED_COLOR)
+        if not self._article_image.test_if_dirty(force):
+            self.set_status(Status.ERROR)
 
         # Test menu item
-        if not self._menu_item.test_self():
-            self.set_status_color(Numbers.RED_COLOR)
+        if not self._menu_item.test_if_dirty(force):
+            self.set_status(Status.ERROR)
 
         # Test aside images
         for aside_image in self._aside_images:
-            if not aside_image.test_self():
-                self.set_status_color(Numbers.RED_COLOR)
+            if not aside_image.test_if_dirty(force):
+                self.set_status(Status.ERROR)
 
         # Test videos
         for video in self._videos:
-            if not video.test_self(online):
-                self.set_status_color(Numbers.RED_COLOR)
+            if not video.test_if_dirty(online, force):
+                self.set_status(Status.ERROR)
 
         # Test in text images
         for image in self._text_images:
-            if not image.test_self():
-                self.set_status_color(Numbers.RED_COLOR)
+            if not image.test_if_dirty(force):
+                self.set_status(Status.ERROR)
 
         # Test links
         for link in self._links:
-            if not link.test_self(online):
-                self.set_status_color(Numbers.RED_COLOR)
+            if not link.test_if_dirty(online, force):
+                self.set_status(Status.ERROR)
 
         if not self._spell_check(self._plain_text):
             self._spelling_error_message = Strings.spelling_error
-            self.set_status_color(Numbers.RED_COLOR)
+            self.set_status(Status.ERROR)
 
         if not self._enabled:
-            self.set_status_color(Numbers.RED_COLOR)
+            self.set_status(Status.ERROR)
 
-        if self.get_status_color() == Numbers.RED_COLOR:
+        # Keep the index news in order with the new date, publication state and test result.
+        if self._index_document:
+            self._index_document.update_article(self)
+
+        if self.get_status() == Status.ERROR:
             return False
         return True
 
@@ -221,6 +241,9 @@ class WhitebearDocumentArticle(WhitebearDocument):
         self._text_images.clear()
         self._links.clear()
         self._videos.clear()
+        self._links_by_id.clear()
+        self._text_images_by_id.clear()
+        self._videos_by_id.clear()
         text_section = self._parsed_html.find(name='section', attrs={'class': 'mainText'})
         child: Tag
         for child in text_section.children:
@@ -233,13 +256,20 @@ class WhitebearDocumentArticle(WhitebearDocument):
             elif child.name == 'h3' or child.name == 'h4':
                 self._main_text_elements.append(self._process_h(child))
             elif child.name == 'div':
-                if child.next.name == 'a':
+                if child.next.name == 'a' and Strings.video_facade_class in child.a.get('class', []):
+                    video = self._process_video_facade(child)
+                    self._videos.append(video)
+                    self._videos_by_id[video.get_id()] = video
+                    self._main_text_elements.append(video)
+                elif child.next.name == 'a':
                     image = self._process_img(child)
                     self._text_images.append(image)
+                    self._text_images_by_id[image.get_id()] = image
                     self._main_text_elements.append(image)
                 elif child.next.name == 'iframe':
                     video = self._process_iframe(child)
                     self._videos.append(video)
+                    self._videos_by_id[video.get_id()] = video
                     self._main_text_elements.append(video)
             else:
                 raise WrongFormatException(Strings.exception_html_syntax_error)
@@ -258,6 +288,20 @@ class WhitebearDocumentArticle(WhitebearDocument):
 
         return Video(title, width, height, src)
 
+    def _process_video_facade(self, div: Tag) -> Video:
+        """
+        Process a video saved as a poster image link.
+        :param div: The beautiful soup div element containing the poster image link.
+        :return: Video instance.
+        """
+        height = int(div.img['height'])
+        width = int(div.img['width'])
+        src = div.a['href']
+        title = div.a['title']
+        self._plain_text += '\n'
+
+        return Video(title, width, height, src)
+
     def _process_img(self, div: Tag):
         """
         Process an in text image.
@@ -270,12 +314,10 @@ class WhitebearDocumentArticle(WhitebearDocument):
         full_thumbnail_path = os.path.join(self._working_directory, div.img['src'])
         self._plain_text += '\n'
 
-        if not os.path.exists(full_original_image_path) or not os.access(full_original_image_path, os.R_OK) \
-                or not os.access(full_original_image_path, os.W_OK):
+        if not FileSnapshot.get_instance().is_accessible(full_original_image_path):
             full_original_image_path = None
 
-        if not os.path.exists(full_thumbnail_path) or not os.access(full_thumbnail_path, os.R_OK) \
-                or not os.access(full_thumbnail_path, os.W_OK):
+        if not FileSnapshot.get_instance().is_accessible(full_thumbnail_path):
             full_thumbnail_path = None
 
         return ImageInText(title, alt, full_original_image_path, full_thumbnail_path, div.a['href'], div.img['src'])
@@ -332,6 +374,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
                                 self._working_directory)
                     paragraph.add_element(link)
                     self._links.append(link)
+                    self._links_by_id[link.get_id()] = link
                 else:
                     raise WrongFormatException(Strings.exception_html_syntax_error)
         self._plain_text += '\n'
@@ -395,6 +438,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
             self._date = str(date)
         else:
             self._date = ''
+        self._computable_date = self._compute_date(self._date)
 
     def _parse_main_article_image(self) -> None:
         """
@@ -429,12 +473,10 @@ class WhitebearDocumentArticle(WhitebearDocument):
         string_content = figure.figcaption.strings
         figcaption = ''.join(string_content)
 
-        if not os.path.exists(full_original_image_path) or not os.access(full_original_image_path, os.R_OK) \
-                or not os.access(full_original_image_path, os.W_OK):
+        if not FileSnapshot.get_instance().is_accessible(full_original_image_path):
             full_original_image_path = None
 
-        if not os.path.exists(full_thumbnail_path) or not os.access(full_thumbnail_path, os.R_OK) \
-                or not os.access(full_thumbnail_path, os.W_OK):
+        if not FileSnapshot.get_instance().is_accessible(full_thumbnail_path):
             full_thumbnail_path = None
 
         return AsideImage(figcaption, title, alt, full_original_image_path, full_thumbnail_path, figure.a['href'],
@@ -451,6 +493,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         self._valid, errors = Tools.validate(html_string, 'schema_article.xsd')
         return self._valid, errors
 
+    @Instrumentation.timed()
     def convert_to_html(self) -> None:
         """
         Converts this document into a html white bear article page.
@@ -526,6 +569,8 @@ class WhitebearDocumentArticle(WhitebearDocument):
         main_image_figure.a['title'] = self.get_article_image().get_link_title()[0]
         main_image_figure.img['src'] = self.get_article_image().get_thumbnail_filename()
         main_image_figure.img['alt'] = self.get_article_image().get_image_alt()[0]
+        self._set_srcset(main_image_figure.img, self.get_article_image(), Numbers.main_image_width)
+        self._wrap_in_picture(main_image_figure.img, parsed_template)
         main_image_figure.figcaption.string = self.get_article_image().get_caption()[0]
 
         # Fill main text.
@@ -533,6 +578,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         if not self._enabled:
             # Save the disabled state into the html, once the article is enabled, this special class will be removed.
             text_section['class'] = 'mainText disabled'
+        uses_facade = False
         for element in self.get_main_text_elements():
             if isinstance(element, Heading):
                 size = 'h3' if element.get_size() == Heading.SIZE_H3 else 'h4'
@@ -554,8 +600,10 @@ class WhitebearDocumentArticle(WhitebearDocument):
                 height = element.get_thumbnail_size()[1]
                 new_a = parsed_template.new_tag('a', attrs={'href': href, 'target': Strings.blank, 'title': title})
                 new_img = parsed_template.new_tag('img', attrs={'src': src, 'alt': alt, 'width': width,
-                                                                'height': height})
+                                                                'height': height, 'loading': Strings.loading_lazy})
                 new_a.append(new_img)
+                self._set_srcset(new_img, element, width)
+                self._wrap_in_picture(new_img, parsed_template)
                 new_div.append(new_a)
                 text_section.append(new_div)
             elif isinstance(element, Video):
@@ -564,10 +612,26 @@ class WhitebearDocumentArticle(WhitebearDocument):
                 width = element.get_size()[0]
                 height = element.get_size()[1]
                 src = element.get_url()[0]
-                new_iframe = parsed_template.new_tag('iframe', attrs={'title': title, 'height': height,
-                                                                      'width': width, 'src': src,
-                                                                      'allowfullscreen': None})
-                new_div.append(new_iframe)
+                poster = None
+                if self._config_manager.get_video_facade():
+                    poster = Tools.create_video_poster(self._working_directory, src)
+                if poster:
+                    # A poster image link is much lighter than the player, the facade script loads the player on click.
+                    new_a = parsed_template.new_tag('a', attrs={'class': Strings.video_facade_class, 'href': src,
+                                                                'target': Strings.blank, 'title': title})
+                    new_img = parsed_template.new_tag('img', attrs={
+                        'src': f'{Strings.folder_images}/{Strings.folder_thumbnails}/{os.path.basename(poster)}',
+                        'alt': title, 'width': width, 'height': height, 'loading': Strings.loading_lazy})
+                    new_a.append(new_img)
+                    new_div.append(new_a)
+                    self._wrap_in_picture(new_img, parsed_template)
+                    uses_facade = True
+                else:
+                    new_iframe = parsed_template.new_tag('iframe', attrs={'title': title, 'height': height,
+                                                                          'width': width, 'src': src,
+                                                                          'loading': Strings.loading_lazy,
+                                                                          'allowfullscreen': None})
+                    new_div.append(new_iframe)
                 text_section.append(new_div)
             elif isinstance(element, Paragraph):
                 new_p = parsed_template.new_tag('p')
@@ -581,6 +645,10 @@ class WhitebearDocumentArticle(WhitebearDocument):
                     new_ul.append(new_li)
                 text_section.append(new_ul)
 
+        if uses_facade:
+            script.string = f'{script.string}\n{Strings.video_facade_script}' if script.string else \
+                Strings.video_facade_script
+
         # Fill aside images.
         aside = parsed_template.find(name='aside')
         for img in self._aside_images:
@@ -597,21 +665,21 @@ class WhitebearDocumentArticle(WhitebearDocument):
             new_img = parsed_template.new_tag('img', attrs={'src': src, 'alt': alt,
                                                             'width': Numbers.aside_thumbnail_width,
                                                             'height': Numbers.aside_thumbnail_height,
-                                                            'class': 'imgAside'})
+                                                            'class': 'imgAside', 'loading': Strings.loading_lazy})
             new_a.append(new_img)
+            self._set_srcset(new_img, img, Numbers.aside_thumbnail_width)
+            self._wrap_in_picture(new_img, parsed_template)
             new_figure.append(new_a)
             new_figure.append(new_figcaption)
             aside.append(new_figure)
 
+        self._link_minified_css(parsed_template)
         output = str(parsed_template)
         is_valid, errors = Tools.validate(output, 'schema_article.xsd')
         if not is_valid:
             raise UnrecognizedFileException(f'{Strings.exception_bug}\n{self.get_filename()} \n{errors}')
 
-        self._html = output
-        # Save the fact that this file is changed into the list of file that we need to upload. This survives editor
-        # exit and can be restored on start. This list is cleared when a file is uploaded.
-        self._config_manager.store_not_uploaded(self.get_filename())
+        self._html = self._minify(output)
 
     @staticmethod
     def _convert_text_contents(container: Tag, par: Paragraph, soup: BeautifulSoup) -> Tag:
@@ -685,19 +753,28 @@ class WhitebearDocumentArticle(WhitebearDocument):
         return self._date, self._date_error_message
 
     def get_computable_date(self) -> float:
+        """
+        Return the article date as a float timestamp.
+        :return: Date as float timestamp.
+        """
+        return self._computable_date
+
+    @staticmethod
+    def _compute_date(date: str) -> float:
         """
         Convert article date into a float timestamp.
+        :param date: The czech article date.
         :return: Date as float timestamp.
         """
-        month_dict = {k: v for k, v in zip(Strings.cz_months.split('|'), range(1, 13))}
-        day = self._date.split('.', 1)[0]
+        day = date.split('.', 1)[0]
         try:
-            month = f"{month_dict[self._date.split(' ', 2)[1]]:02}"
-        except KeyError as _:
+            month = f"{WhitebearDocumentArticle.month_numbers[date.split(' ', 2)[1]]:02}"
+            year = date.split(' ', 2)[2]
+            return pendulum.from_format(f'{year}-{month}-{day}', 'YYYY-MM-DD').float_timestamp
+        except (KeyError, IndexError, ValueError) as _:
             # Return a value in case the date is wrong, the user will have to correct it when uploading anyway.
+            # This is called on every change of the date while the user may still be typing it.
             return 1
-        year = self._date.split(' ', 2)[2]
-        return pendulum.from_format(f'{year}-{month}-{day}', 'YYYY-MM-DD').float_timestamp
 
     def get_article_image(self) -> AsideImage:
         """
@@ -713,12 +790,12 @@ class WhitebearDocumentArticle(WhitebearDocument):
         """
         return self._menu_item
 
-    def get_status_color(self) -> wx.Colour:
+    def get_status(self) -> Status:
         """
-        Return the status color of this document. White if ok, Red if SEO check failed, Blue if modified.
-        :return: Return the status color of this document. White if ok, Red if SEO check failed, Blue if modified.
+        Return the status of this document. OK if ok, ERROR if SEO check failed, CHANGED if modified.
+        :return: Return the status of this document. OK if ok, ERROR if SEO check failed, CHANGED if modified.
         """
-        return self._status_color
+        return self._status
 
     def is_enabled(self) -> bool:
         """
@@ -808,33 +885,25 @@ class WhitebearDocumentArticle(WhitebearDocument):
         """
         Find the link instance identified by the id.
         :param link_id: Unique identifier of a Link
-        :return: a Link instance
+        :return: a Link instance, None if not found.
         """
-        for link in self._links:
-            if link.get_id() == link_id:
-                return link
+        return self._links_by_id.get(link_id, None)
 
-    def find_in_text_image(self, image_id: int) -> ImageInText:
+    def find_in_text_image(self, image_id: str) -> ImageInText:
         """
-        Find and return an ImageInText instance based on the image's thumbnail disk path.
+        Find and return an ImageInText instance based on the image's id.
         :param image_id: ID of the image.
-        :return: A ImageInText instance.
+        :return: A ImageInText instance, None if not found.
         """
-        for img in self._text_images:
-            img: ImageInText
-            if img.get_id() == image_id:
-                return img
+        return self._text_images_by_id.get(image_id, None)
 
-    def find_video(self, video_id: int) -> Video:
+    def find_video(self, video_id: str) -> Video:
         """
-        Find and return a Video instance based on the url of the video.
+        Find and return a Video instance based on the id of the video.
         :param video_id: ID of the video.
-        :return: A Video instance.
+        :return: A Video instance, None if not found.
         """
-        for video in self._videos:
-            video: Video
-            if video.get_id() == video_id:
-                return video
+        return self._videos_by_id.get(video_id, None)
 
     def add_link(self, link: Link) -> None:
         """
@@ -843,6 +912,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         :return: None
         """
         self._links.append(link)
+        self._links_by_id[link.get_id()] = link
         self.set_modified(True)
 
     def remove_link(self, link_id: str) -> None:
@@ -851,9 +921,9 @@ class WhitebearDocumentArticle(WhitebearDocument):
         :param link_id: Unique identifier of a Link
         :return: None
         """
-        for link in self._links:
-            if link.get_id() == link_id:
-                self._links.remove(link)
+        link = self._links_by_id.pop(link_id, None)
+        if link:
+            self._links.remove(link)
         self.set_modified(True)
 
     def add_image(self, image: ImageInText) -> None:
@@ -863,6 +933,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         :return: None
         """
         self._text_images.append(image)
+        self._text_images_by_id[image.get_id()] = image
         self.set_modified(True)
 
     def add_video(self, video: Video) -> None:
@@ -872,6 +943,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         :return: None
         """
         self._videos.append(video)
+        self._videos_by_id[video.get_id()] = video
         self.set_modified(True)
 
     def add_aside_image(self, image: ImageInText) -> None:
@@ -908,6 +980,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         :return: None
         """
         self._index_document = index
+        self._index_document.update_article(self)
 
     def set_date(self, date: str) -> None:
         """
@@ -918,6 +991,7 @@ class WhitebearDocumentArticle(WhitebearDocument):
         """
         if date != self._date:
             self._date = date
+            self._computable_date = self._compute_date(date)
             self.set_modified(True)
 
     def set_article_image(self, img: AsideImage) -> None:
@@ -970,5 +1044,8 @@ class WhitebearDocumentArticle(WhitebearDocument):
                 elif isinstance(element, UnorderedList):
                     for paragraph in element.get_paragraphs():
                         self._links.extend(paragraph.get_links())
+            self._links_by_id = {link.get_id(): link for link in self._links}
+            self._text_images_by_id = {image.get_id(): image for image in self._text_images}
+            self._videos_by_id = {video.get_id(): video for video in self._videos}
             self._main_text_elements = elements
             self.set_modified(True)
@@ -1,10 +1,7 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 import tinycss
 import webcolors
-from wx import BLUE
-from wx import Colour
-from wx import NullColour
 
 from Constants.Constants import Strings
 from Exceptions.WrongFormatException import WrongFormatException
@@ -17,6 +14,9 @@ class WhitebearDocumentCSS:
     This is just a container for easy manipulation.
     """
 
+    # Blue is used by the text area for links and can not be used as a text color.
+    _reserved_blue = (0, 0, 255)
+
     def __init__(self, name: str, path: str):
         """
         Create a new WhitebearDocumentCSS object.
@@ -26,7 +26,7 @@ class WhitebearDocumentCSS:
         self._filename = name
         self._file_path = path
         # Prepare the color dictionary with a black color which is always the default text color.
-        self._str_to_color_dict = {Strings.color_black: Colour(0, 0, 0)}
+        self._str_to_color_dict: Dict[str, Tuple[int, int, int]] = {Strings.color_black: (0, 0, 0)}
         self._parse_self()
 
     def _parse_self(self) -> None:
@@ -48,15 +48,24 @@ class WhitebearDocumentCSS:
                             dec_color = webcolors.hex_to_rgb(declaration.value.as_css())
                     # This means we have a text color declaration
                     if dec_names == ['color', 'display']:
-                        color = Colour(dec_color.red, dec_color.green, dec_color.blue)
-                        if color == Colour(0, 0, 255, 255):
+                        color = (dec_color.red, dec_color.green, dec_color.blue)
+                        if color == self._reserved_blue:
                             raise WrongFormatException(f'{Strings.exception_reserved_blue}: {color}')
                         self._str_to_color_dict[rule.selector.as_css().lstrip('.')] = color
 
-    def get_colors(self) -> Dict[str, Colour]:
+    def reload(self) -> None:
+        """
+        Parse the css file again after it was changed on disk. The instance is shared by all articles, so it is
+        updated in place.
+        :return: None
+        """
+        self._str_to_color_dict = {Strings.color_black: (0, 0, 0)}
+        self._parse_self()
+
+    def get_colors(self) -> Dict[str, Tuple[int, int, int]]:
         """
         Return a dictionary of color defined in this css document.
-        :return: a dictionary of color defined in this css document.
+        :return: a dictionary of color defined in this css document and their (red, green, blue) values.
         """
         return self._str_to_color_dict
 
@@ -67,30 +76,29 @@ class WhitebearDocumentCSS:
         """
         return self._file_path
 
-    def translate_str_color(self, name: str) -> Colour:
+    def translate_str_color(self, name: str) -> Tuple[int, int, int]:
         """
-        Translate a CSS color name into a wx.Colour
+        Translate a CSS color name into its (red, green, blue) value.
         :param name: the name of the color.
-        :return: an instance of wx.Colour
+        :return: (red, green, blue) tuple.
         """
         try:
             return self._str_to_color_dict[name]
         except KeyError as _:
             raise WrongFormatException(f'{Strings.exception_unrecognized_color}: {name}')
 
-    def translate_color_str(self, color: Colour) -> str:
+    def translate_color_str(self, color: Tuple[int, int, int]) -> str:
         """
-        Decode wx.Colour into string of the loaded color from css.
-        :param color: the wx.Colour to translate.
+        Decode a (red, green, blue) value into string of the loaded color from css.
+        :param color: the (red, green, blue) tuple to translate, None if the text has no color.
         :return: The css name of the color.
         """
-        if color == NullColour:
+        if color is None:
             # Special case of empty paragraph which should by default be black.
             return Strings.color_black
-        if color == BLUE:
+        if color == self._reserved_blue:
             # Special case, deleted link color attribute remains blue for some reason.
             return Strings.color_black
-        # wx.Colour can not be used as a key, so we have to find it this way.
         for name, rgb in self._str_to_color_dict.items():
             if rgb == color:
                 return name
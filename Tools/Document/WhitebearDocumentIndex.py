@@ -1,15 +1,17 @@
+import bisect
 import os
-from typing import List, Dict
+import threading
+from typing import List, Dict, Tuple
 
-import wx
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
-from Constants.Constants import Strings, Numbers
+from Constants.Constants import Strings, Numbers, Status
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Resources.Fetch import Fetch
 from Tools.Document.WhitebearDocument import WhitebearDocument
 from Tools.Document.WhitebearDocumentMenu import WhitebearDocumentMenu
+from Tools.Instrumentation import Instrumentation
 from Tools.Tools import Tools
 
 
@@ -41,8 +43,33 @@ class WhitebearDocumentIndex(WhitebearDocument):
         self._script: str = ''
         self._number_of_news: int = 0
         self._url: str = ''
+        # Enabled articles ordered from the newest by (negative date, file name) keys. Articles that passed their last
+        # SEO test are also kept in a separate list for the news section. The lists are updated by the articles
+        # themselves after each of their tests, so building the index does not need to sort or test anything.
+        self._news_lock = threading.Lock()
+        self._enabled_articles: List[Tuple[float, str]] = []
+        self._passing_articles: List[Tuple[float, str]] = []
+        self._article_keys: Dict[str, Tuple[float, str]] = {}
         self.update_content()
 
+    def __getstate__(self) -> Dict:
+        """
+        Return the state of this index for pickling. Locks can not be pickled, the news lock is left out.
+        :return: The state of this index without the locks.
+        """
+        state = super().__getstate__()
+        del state['_news_lock']
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Restore the state of an unpickled index and create a new news lock for it.
+        :param state: The state of the index without the locks.
+        :return: None
+        """
+        super().__setstate__(state)
+        self._news_lock = threading.Lock()
+
     def update_content(self) -> None:
         """
         Updates the content of the page from config manager. This is used to initially fill the information and then
@@ -61,6 +88,7 @@ class WhitebearDocumentIndex(WhitebearDocument):
         self._number_of_news = self._config_manager.get_number_of_news()
         self._url = self._config_manager.get_url()
 
+    @Instrumentation.timed()
     def parse_self(self) -> None:
         """
         Parse this document and fill internal variables with content.
@@ -91,6 +119,7 @@ class WhitebearDocumentIndex(WhitebearDocument):
         self._valid, errors = Tools.validate(html_string, 'schema_index.xsd')
         return self._valid, errors
 
+    @Instrumentation.timed()
     def test_self(self) -> bool:
         """
         Perform a SEO test on this document.
@@ -103,23 +132,24 @@ class WhitebearDocumentIndex(WhitebearDocument):
             # Check not empty, otherwise these can be very long.
             if not text:
                 self._index_error_message = Strings.seo_error_index_empty
-                self.set_status_color(Numbers.RED_COLOR)
+                self.set_status(Status.ERROR)
 
         for text in (self._global_title, self._author, self._contact, self._url):
             # Check reasonable lengths.
             if len(text) > Numbers.default_max_length or len(text) < 1:
                 self._index_error_message = Strings.seo_error_index_length
-                self.set_status_color(Numbers.RED_COLOR)
+                self.set_status(Status.ERROR)
 
         for text in (self._global_title, self._author, self._red_text, self._black_text):
             if not self._spell_check(text):
                 self._index_error_message = Strings.spelling_error
-                self.set_status_color(Numbers.RED_COLOR)
+                self.set_status(Status.ERROR)
 
-        if self.get_status_color() == Numbers.RED_COLOR:
+        if self.get_status() == Status.ERROR:
             return False
         return True
 
+    @Instrumentation.timed()
     def convert_to_html(self) -> None:
         """
         Converts this document into a html white bear article page.
@@ -201,37 +231,27 @@ class WhitebearDocumentIndex(WhitebearDocument):
 
         # Fill news.
         news = parsed_template.find(name='h3', attrs={'id': 'news'})
-        # Sort all articles by date.
-        sorted_articles = sorted(self._articles.values(), key=lambda x: x.get_computable_date(), reverse=True)
         new_ul = parsed_template.new_tag('ul')
-        limit = self._number_of_news
-        for index, item in enumerate(sorted_articles):
-            if index >= limit:
-                break
-            if item.test_self(self._config_manager.get_online_test()):
-                new_li = parsed_template.new_tag('li')
-                href = item.get_filename()
-                title = item.get_page_name()[0]
-                date = item.get_date()[0] + ' '
-                new_a = parsed_template.new_tag('a', attrs={'href': href, 'title': title})
-                new_a.string = title
-
-                new_li.string = date
-                new_li.append(new_a)
-                new_ul.append(new_li)
-            else:
-                # Add the next article to news.
-                limit += 1
+        for item in self._get_newest_articles(self._passing_articles, self._number_of_news):
+            new_li = parsed_template.new_tag('li')
+            href = item.get_filename()
+            title = item.get_page_name()[0]
+            date = item.get_date()[0] + ' '
+            new_a = parsed_template.new_tag('a', attrs={'href': href, 'title': title})
+            new_a.string = title
+
+            new_li.string = date
+            new_li.append(new_a)
+            new_ul.append(new_li)
         news.insert_after(new_ul)
 
         # Fill contact.
         contact = parsed_template.find(name='h3', attrs={'id': 'contact'})
         # Insert the author's contact as an image.
-        image: wx.Bitmap = Tools.create_image(self._contact)
         image_path = os.path.join(self._working_directory, Strings.folder_images, Strings.contact_file)
-        image.SaveFile(image_path, wx.BITMAP_TYPE_PNG)
+        width, height = Tools.create_image(self._contact, image_path)
         src = os.path.join(Strings.folder_images, Strings.contact_file)
-        new_img = parsed_template.new_tag('img', attrs={'width': image.GetWidth(), 'height': image.GetHeight(),
+        new_img = parsed_template.new_tag('img', attrs={'width': width, 'height': height,
                                                         'src': src, 'alt': Strings.contact_default_alt})
         contact.insert_after(new_img)
 
@@ -242,13 +262,12 @@ class WhitebearDocumentIndex(WhitebearDocument):
 
         # Fill aside images from the newest articles.
         latest_images = []
-        for article in sorted_articles:
-            if article.is_enabled():
-                images = article.get_aside_images()
-                if images:
-                    latest_images.append(images[0])
-                if len(latest_images) >= Numbers.max_index_images:
-                    break
+        for article in self._get_newest_articles(self._enabled_articles):
+            images = article.get_aside_images()
+            if images:
+                latest_images.append(images[0])
+            if len(latest_images) >= Numbers.max_index_images:
+                break
 
         aside = parsed_template.find(name='aside')
         for img in latest_images:
@@ -267,16 +286,76 @@ class WhitebearDocumentIndex(WhitebearDocument):
                                                             'height': Numbers.aside_thumbnail_height,
                                                             'class': 'imgAside'})
             new_a.append(new_img)
+            self._set_srcset(new_img, img, Numbers.aside_thumbnail_width)
+            self._wrap_in_picture(new_img, parsed_template)
             new_figure.append(new_a)
             new_figure.append(new_figcaption)
             aside.append(new_figure)
 
+        self._link_minified_css(parsed_template)
         output = str(parsed_template)
         is_valid, errors = Tools.validate(output, 'schema_index.xsd')
         if not is_valid:
             raise UnrecognizedFileException(f'{Strings.exception_bug}\n{self.get_filename()}\n{errors}')
 
-        self._html = output
+        self._html = self._minify(output)
+
+    def update_article(self, article) -> None:
+        """
+        Move the article to the correct place in the date ordered news and latest images lists according to its
+        current date, publication state and the result of its last SEO test.
+        :param article: The article that was tested.
+        :return: None
+        """
+        with self._news_lock:
+            self._remove_key(article.get_filename())
+            if article.is_enabled():
+                key = (-article.get_computable_date(), article.get_filename())
+                self._article_keys[article.get_filename()] = key
+                bisect.insort(self._enabled_articles, key)
+                if article.is_seo_ok():
+                    bisect.insort(self._passing_articles, key)
+
+    def remove_article(self, file_name: str) -> None:
+        """
+        Remove a deleted article from the news and latest images lists.
+        :param file_name: The file name of the deleted article.
+        :return: None
+        """
+        with self._news_lock:
+            self._remove_key(file_name)
+
+    def _remove_key(self, file_name: str) -> None:
+        """
+        Remove the article's key from both date ordered lists. Must be called with the news lock held.
+        :param file_name: The file name of the article.
+        :return: None
+        """
+        key = self._article_keys.pop(file_name, None)
+        if not key:
+            return
+        for sorted_list in (self._enabled_articles, self._passing_articles):
+            position = bisect.bisect_left(sorted_list, key)
+            if position < len(sorted_list) and sorted_list[position] == key:
+                del sorted_list[position]
+
+    def _get_newest_articles(self, sorted_list: List[Tuple[float, str]], limit: int = None) -> List:
+        """
+        Return the newest loaded articles from one of the date ordered lists.
+        :param sorted_list: The list to take the articles from.
+        :param limit: Maximum number of articles to return, all if None.
+        :return: List of the newest articles.
+        """
+        result = []
+        with self._news_lock:
+            for _, file_name in sorted_list:
+                if limit is not None and len(result) >= limit:
+                    break
+                # Articles that were not saved into the article dictionary yet or were deleted are skipped.
+                article = self._articles.get(file_name)
+                if article:
+                    result.append(article)
+        return result
 
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_html_to_save(self) -> str:
@@ -1,14 +1,16 @@
 import os
-from typing import List
+from typing import Dict, List
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
-from Constants.Constants import Strings, Numbers
+from Constants.Constants import Strings, Status
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Resources.Fetch import Fetch
 from Tools.Document.MenuItem import MenuItem
 from Tools.Document.WhitebearDocument import WhitebearDocument
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
 from Tools.Tools import Tools
 
 
@@ -28,8 +30,11 @@ class WhitebearDocumentMenu(WhitebearDocument):
         # File properties are in base class
         super().__init__(path)
         self._menu_items = []
+        # The href of an item is the file name of its article and does not change, so items can be found by it.
+        self._items_by_href: Dict[str, MenuItem] = {}
         self._menus = menus
 
+    @Instrumentation.timed()
     def parse_self(self) -> None:
         """
         Parse this document and fill internal variables with content.
@@ -42,6 +47,7 @@ class WhitebearDocumentMenu(WhitebearDocument):
         self._parse_menu_items()
         self.test_self()
 
+    @Instrumentation.timed()
     def test_self(self) -> bool:
         """
         Perform a SEO test on this document.
@@ -52,13 +58,13 @@ class WhitebearDocumentMenu(WhitebearDocument):
         super(WhitebearDocumentMenu, self).test_self_basic()
 
         # Check page name length must be at least 3 and must not be default.
-        name_result, message, color = self.seo_test_name(self._page_name)
+        name_result, message, status = self.seo_test_name(self._page_name)
         # Message may contain OK if seo passed.
         self._page_name_error_message = message
         if not name_result:
-            self.set_status_color(color)
+            self.set_status(status)
 
-        if self.get_status_color() == Numbers.RED_COLOR:
+        if self.get_status() == Status.ERROR:
             return False
         return True
 
@@ -69,6 +75,7 @@ class WhitebearDocumentMenu(WhitebearDocument):
         :return: None
         """
         self._menu_items.clear()
+        self._items_by_href.clear()
         menu_container = self._parsed_html.find(name='nav', attrs={'class': 'sixItems'})
         divs = menu_container.find_all(name='div', attrs={'class': 'link'})
         for div in divs:
@@ -79,11 +86,12 @@ class WhitebearDocumentMenu(WhitebearDocument):
             string_content = div.p.strings
             name = ''.join(string_content)
 
-            if not os.path.exists(full_image_path) or not os.access(full_image_path, os.R_OK) or not os.access(
-                    full_image_path, os.W_OK):
+            if not FileSnapshot.get_instance().is_accessible(full_image_path):
                 full_image_path = None
 
-            self._menu_items.append(MenuItem(name, title, image_alt, href, full_image_path, div.img['src']))
+            item = MenuItem(name, title, image_alt, href, full_image_path, div.img['src'])
+            self._menu_items.append(item)
+            self._items_by_href[href] = item
 
     def _parse_page_name(self) -> None:
         """
@@ -108,6 +116,7 @@ class WhitebearDocumentMenu(WhitebearDocument):
         self._valid, errors = Tools.validate(html_string, 'schema_menu.xsd')
         return self._valid, errors
 
+    @Instrumentation.timed()
     def convert_to_html(self) -> None:
         """
         Converts this document into a html white bear menu page.
@@ -200,16 +209,18 @@ class WhitebearDocumentMenu(WhitebearDocument):
             new_p.string = text
 
             new_a.append(new_img)
+            self._wrap_in_picture(new_img, parsed_template)
             new_div.append(new_a)
             new_div.append(new_p)
             menu_container.append(new_div)
 
+        self._link_minified_css(parsed_template)
         output = str(parsed_template)
         is_valid, errors = Tools.validate(output, 'schema_menu.xsd')
         if not is_valid:
             raise UnrecognizedFileException(f'{Strings.exception_bug}\n{self.get_filename()}\n{errors}')
 
-        self._html = output
+        self._html = self._minify(output)
 
     # Getters ----------------------------------------------------------------------------------------------------------
     def get_html_to_save(self) -> str:
@@ -239,10 +250,7 @@ class WhitebearDocumentMenu(WhitebearDocument):
         :param file_name: Name of the website to find in this menu.
         :return: Return a MenuItem that contains a link to the file_name, only one must exist. None if not found.
         """
-        for item in self._menu_items:
-            if file_name == item.get_link_href():
-                return item
-        return None
+        return self._items_by_href.get(file_name, None)
 
     # Setters ----------------------------------------------------------------------------------------------------------
     def add_item(self, item: MenuItem) -> None:
@@ -252,4 +260,5 @@ class WhitebearDocumentMenu(WhitebearDocument):
         :return: None
         """
         self._menu_items.append(item)
+        self._items_by_href[item.get_link_href()] = item
         self.set_modified(True)
@@ -0,0 +1,251 @@
+import os
+import stat
+import threading
+from typing import Dict, Iterable, List
+
+from Constants.Constants import Strings
+
+
+class FileSnapshot:
+    """
+    Singleton class.
+    Remembers which files in the images and files folders of the working directory exist and can be read and written.
+    The folders are scanned once when the directory is loaded. The snapshot is the truth for everything inside the
+    scanned folders, a file that is not in it does not exist and the disk is not asked. It is kept up to date with the
+    files that the file watcher reports and the files the editor writes or deletes itself, refresh rescans the folders
+    whose modification time changed when no watcher runs. Files outside of the scanned folders are checked on disk.
+    """
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """
+        Static access method.
+        """
+        if FileSnapshot.__instance is None:
+            FileSnapshot()
+        return FileSnapshot.__instance
+
+    def __init__(self):
+        """
+        Constructor for the file snapshot.
+        """
+        if FileSnapshot.__instance is not None:
+            raise Exception('This class is a singleton!')
+        else:
+            FileSnapshot.__instance = self
+        self._lock = threading.Lock()
+        # Real full disk path: True if the file can be read and written.
+        self._files: Dict[str, bool] = {}
+        # Real full disk paths of the scanned folders and their subfolders: modification time of the folder.
+        self._folders: Dict[str, float] = {}
+        # Real full disk paths of the scanned images and files folders.
+        self._roots: List[str] = []
+        # Working directory path as it is used by the documents: the real path of the working directory.
+        self._aliases: Dict[str, str] = {}
+        # Incremented whenever files or pages may have changed, cached SEO test results older than this are retested.
+        self._version = 0
+
+    def scan(self, root: str) -> None:
+        """
+        Forget the previous snapshot and scan the images and files folders of a working directory.
+        :param root: Path to the whitebear web root directory.
+        :return: None
+        """
+        files: Dict[str, bool] = {}
+        folders: Dict[str, float] = {}
+        real_root = os.path.realpath(root)
+        roots = [os.path.join(real_root, folder) for folder in (Strings.folder_images, Strings.folder_files)]
+        for folder in roots:
+            self._scan_folder(folder, files, folders)
+        aliases = {}
+        if os.path.normpath(os.path.abspath(root)) != real_root:
+            aliases[os.path.normpath(os.path.abspath(root))] = real_root
+        with self._lock:
+            self._files = files
+            self._folders = folders
+            self._roots = roots
+            self._aliases = aliases
+            self._version += 1
+
+    def _scan_folder(self, path: str, files: Dict[str, bool], folders: Dict[str, float]) -> None:
+        """
+        Add all files in a folder and its subfolders into a snapshot.
+        :param path: Real full disk path to the folder.
+        :param files: The files of the snapshot to fill.
+        :param folders: The folders of the snapshot to fill.
+        :return: None
+        """
+        try:
+            folders[path] = os.stat(path).st_mtime
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._scan_folder(entry.path, files, folders)
+                    elif entry.is_file():
+                        files[entry.path] = self._is_read_writable(entry.stat())
+        except OSError as _:
+            # A missing or unreadable folder has no files.
+            pass
+
+    @staticmethod
+    def _is_read_writable(file_stat: os.stat_result) -> bool:
+        """
+        Find out from the permission bits whether the current user can read and write a file.
+        :param file_stat: Result of stat of the file.
+        :return: True if the file can be read and written.
+        """
+        if not hasattr(os, 'geteuid'):
+            return bool(file_stat.st_mode & stat.S_IWRITE)
+        if os.geteuid() == 0:
+            return True
+        if file_stat.st_uid == os.geteuid():
+            mask = stat.S_IRUSR | stat.S_IWUSR
+        elif file_stat.st_gid in os.getgroups():
+            mask = stat.S_IRGRP | stat.S_IWGRP
+        else:
+            mask = stat.S_IROTH | stat.S_IWOTH
+        return file_stat.st_mode & mask == mask
+
+    def _key(self, path: str) -> str:
+        """
+        Return the path under which a file is remembered. Paths inside the working directory are translated to its real
+        path without asking the disk, so a symlinked working directory is found too. Must be called with the lock held.
+        :param path: Full disk path to the file.
+        :return: The normalized real path if the file is in the working directory, the normalized path otherwise.
+        """
+        path = os.path.normpath(path)
+        for alias, real in self._aliases.items():
+            if path == alias or path.startswith(alias + os.sep):
+                return real + path[len(alias):]
+        return path
+
+    def _is_scanned(self, key: str) -> bool:
+        """
+        Return True if a path is inside one of the scanned folders. Must be called with the lock held.
+        :param key: The path under which a file is remembered.
+        :return: True if the snapshot knows whether the file exists.
+        """
+        return any(key.startswith(root + os.sep) for root in self._roots)
+
+    def update(self, paths: Iterable[str]) -> None:
+        """
+        Check files that changed on disk again. Cached SEO test results are outdated after this.
+        :param paths: Full disk paths of changed, created or deleted files or folders.
+        :return: None
+        """
+        with self._lock:
+            self._version += 1
+            keys = [self._key(path) for path in paths]
+        for key in keys:
+            try:
+                file_stat = os.stat(key)
+            except OSError as _:
+                self._forget(key)
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                with self._lock:
+                    # Files outside of the scanned folders are always checked on disk.
+                    if self._is_scanned(key):
+                        self._files[key] = self._is_read_writable(file_stat)
+            elif stat.S_ISDIR(file_stat.st_mode):
+                self._rescan(key)
+
+    def _forget(self, key: str) -> None:
+        """
+        Forget a deleted file or a deleted folder with everything in it.
+        :param key: The path under which the file or folder is remembered.
+        :return: None
+        """
+        prefix = key + os.sep
+        with self._lock:
+            self._files.pop(key, None)
+            self._folders.pop(key, None)
+            for path in [path for path in self._files if path.startswith(prefix)]:
+                del self._files[path]
+            for path in [path for path in self._folders if path.startswith(prefix)]:
+                del self._folders[path]
+
+    def _rescan(self, key: str) -> None:
+        """
+        Scan a folder that changed again with all its subfolders.
+        :param key: The path under which the folder is remembered.
+        :return: None
+        """
+        files: Dict[str, bool] = {}
+        folders: Dict[str, float] = {}
+        self._scan_folder(key, files, folders)
+        self._forget(key)
+        with self._lock:
+            if self._is_scanned(key) or key in self._roots:
+                self._files.update(files)
+                self._folders.update(folders)
+
+    def refresh(self) -> None:
+        """
+        Rescan the folders whose modification time changed since they were scanned. Folders change their modification
+        time when a file is created, deleted or renamed in them. This keeps the snapshot up to date when no file watcher
+        runs, for example in the command line tool.
+        :return: None
+        """
+        with self._lock:
+            folders = dict(self._folders)
+            roots = list(self._roots)
+        changed = []
+        for folder in set(folders) | set(roots):
+            try:
+                mtime = os.stat(folder).st_mtime
+            except OSError as _:
+                mtime = None
+            if mtime != folders.get(folder):
+                changed.append(folder)
+        # Rescan from the top, a rescanned folder includes its subfolders.
+        for folder in sorted(changed, key=len):
+            if not any(folder.startswith(other + os.sep) for other in changed):
+                self._rescan(folder)
+        if changed:
+            with self._lock:
+                self._version += 1
+
+    def exists(self, path: str) -> bool:
+        """
+        Return True if a file exists.
+        :param path: Full disk path to the file.
+        :return: True if the file exists.
+        """
+        with self._lock:
+            key = self._key(path)
+            if key in self._files:
+                return True
+            if self._is_scanned(key):
+                return False
+        return os.path.exists(path)
+
+    def is_accessible(self, path: str) -> bool:
+        """
+        Return True if a file exists and can be read and written.
+        :param path: Full disk path to the file.
+        :return: True if the file can be read and written.
+        """
+        with self._lock:
+            key = self._key(path)
+            if key in self._files or self._is_scanned(key):
+                return self._files.get(key, False)
+        return os.path.exists(path) and os.access(path, os.R_OK) and os.access(path, os.W_OK)
+
+    def get_version(self) -> int:
+        """
+        Return a number that changes whenever files or pages of the working directory were scanned or changed.
+        :return: The version of the snapshot.
+        """
+        return self._version
+
+    def get_files(self, folder: str) -> List[str]:
+        """
+        Return all remembered files in a folder and its subfolders.
+        :param folder: Full disk path to the folder.
+        :return: List of full disk paths of the files.
+        """
+        with self._lock:
+            prefix = os.path.join(self._key(folder), '')
+            return [path for path in self._files if path.startswith(prefix)]
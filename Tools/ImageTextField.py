@@ -1,9 +1,9 @@
 import wx
 from wx.richtext import RichTextField, RichTextCtrl, RichTextBuffer, RichTextFieldTypeStandard
 
-from Constants.Constants import Strings, Events
-from Gui.Dialogs.EditTextImageDialog import EditTextImageDialog
-from Gui.Dialogs.EditVideoDialog import EditVideoDialog
+from Constants.Constants import Strings
+from Constants.GuiConstants import Events
+from Gui.WxAdapter import WxAdapter
 from Tools.Document.ArticleElements.ImageInText import ImageInText
 
 
@@ -20,9 +20,18 @@ class ImageTextField(RichTextFieldTypeStandard):
         """
         self._work_dir = working_dir
         self._element = element
-        super().__init__(element.get_id(), bitmap=wx.Bitmap(element.get_image()),
+        super().__init__(element.get_id(), bitmap=self._get_bitmap(element),
                          displayStyle=RichTextFieldTypeStandard.RICHTEXT_FIELD_STYLE_RECTANGLE)
-        self.SetBorderColour(self._element.get_status_color())
+        self.SetBorderColour(WxAdapter.element_color(self._element.get_status()))
+
+    @staticmethod
+    def _get_bitmap(element) -> wx.Bitmap:
+        """
+        Return the bitmap of the element. Video placeholders have their own error image and are never tinted red.
+        :param element: The Video or ImageInText instance to display.
+        :return: The bitmap of the element.
+        """
+        return wx.Bitmap(WxAdapter.get_image(element, normal=not isinstance(element, ImageInText)))
 
     def CanEditProperties(self, obj: RichTextField) -> bool:
         """
@@ -51,8 +60,10 @@ class ImageTextField(RichTextFieldTypeStandard):
         :return: The result of the GUI dialog.
         """
         if isinstance(self._element, ImageInText):
+            from Gui.Dialogs.EditTextImageDialog import EditTextImageDialog
             edit_dialog = EditTextImageDialog(parent, self._element, self._work_dir)
         else:
+            from Gui.Dialogs.EditVideoDialog import EditVideoDialog
             edit_dialog = EditVideoDialog(parent, self._element)
 
         result = edit_dialog.ShowModal()
@@ -75,5 +86,5 @@ class ImageTextField(RichTextFieldTypeStandard):
         Redraw the image according to the seo status. After this call Invalidate and Refresh on the richtextctrl.
         :return: None
         """
-        self.SetBorderColour(self._element.get_status_color())
-        self.SetBitmap(wx.Bitmap(self._element.get_image()))
+        self.SetBorderColour(WxAdapter.element_color(self._element.get_status()))
+        self.SetBitmap(self._get_bitmap(self._element))
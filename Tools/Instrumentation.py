@@ -0,0 +1,166 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+
+from Constants.Constants import Strings
+
+
+class Instrumentation:
+    """
+    Singleton class.
+    Collects timers and counters of the slow parts of the editor like loading, SEO tests, conversion, spellcheck and
+    upload. Collection is turned on in the configuration. When it is off the timed functions only check one class
+    attribute, so the decorators can stay in the code.
+    """
+    __instance = None
+    # Checked on every call of a timed function, kept on the class so that the check is as cheap as possible.
+    _active: bool = False
+
+    @staticmethod
+    def get_instance():
+        """
+        Static access method.
+        """
+        if Instrumentation.__instance is None:
+            Instrumentation()
+        return Instrumentation.__instance
+
+    def __init__(self):
+        """
+        Constructor for the instrumentation.
+        """
+        if Instrumentation.__instance is not None:
+            raise Exception('This class is a singleton!')
+        else:
+            Instrumentation.__instance = self
+        self._lock = threading.Lock()
+        self._timings: Dict[str, List[float]] = {}
+        self._counters: Dict[str, int] = {}
+
+    @staticmethod
+    def timed(name: str = None) -> Callable:
+        """
+        Decorator which measures every call of a function while the instrumentation is enabled.
+        :param name: Name of the timer, the qualified name of the function if not set.
+        :return: The decorator.
+        """
+        def decorator(function: Callable) -> Callable:
+            timer_name = name if name else function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not Instrumentation._active:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    Instrumentation.get_instance().record(timer_name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    @contextmanager
+    def measure(name: str):
+        """
+        Context manager which measures a block of code while the instrumentation is enabled.
+        :param name: Name of the timer.
+        :return: None
+        """
+        if not Instrumentation._active:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Instrumentation.get_instance().record(name, time.perf_counter() - start)
+
+    @staticmethod
+    def count(name: str, amount: int = 1) -> None:
+        """
+        Increase a counter while the instrumentation is enabled.
+        :param name: Name of the counter.
+        :param amount: How much to add.
+        :return: None
+        """
+        if Instrumentation._active:
+            instance = Instrumentation.get_instance()
+            with instance._lock:
+                instance._counters[name] = instance._counters.get(name, 0) + amount
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Return True if the instrumentation is collecting data.
+        :return: True if the instrumentation is collecting data.
+        """
+        return Instrumentation._active
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Turn the collection on or off. Already collected data is kept.
+        :param enabled: True to collect data.
+        :return: None
+        """
+        Instrumentation._active = enabled
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Store one measured time.
+        :param name: Name of the timer.
+        :param seconds: The measured time.
+        :return: None
+        """
+        with self._lock:
+            self._timings.setdefault(name, []).append(seconds)
+
+    def clear(self) -> None:
+        """
+        Throw away all collected data.
+        :return: None
+        """
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+    @staticmethod
+    def _percentile(samples: List[float], percent: int) -> float:
+        """
+        Return the nearest rank percentile of sorted samples.
+        :param samples: Sorted measured times.
+        :param percent: The percentile, 50 is the median.
+        :return: The percentile.
+        """
+        rank = max(0, -(-len(samples) * percent // 100) - 1)
+        return samples[rank]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Return the aggregated statistics of all timers and the counters. Times are in milliseconds.
+        :return: Dictionary with timers and counters.
+        """
+        with self._lock:
+            timings = {name: sorted(samples) for name, samples in self._timings.items()}
+            counters = dict(self._counters)
+        timers = {}
+        for name, samples in sorted(timings.items()):
+            timers[name] = {'count': len(samples),
+                            'total_ms': sum(samples) * 1000,
+                            'p50_ms': self._percentile(samples, 50) * 1000,
+                            'p95_ms': self._percentile(samples, 95) * 1000,
+                            'max_ms': samples[-1] * 1000}
+        return {'timers': timers, 'counters': counters}
+
+    def dump(self, path: str = Strings.instrumentation_file) -> None:
+        """
+        Write the aggregated statistics into a json file.
+        :param path: Path of the output file.
+        :return: None
+        :raises OSError: if the file can not be written.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.get_stats(), file, indent=2)
@@ -1,50 +1,138 @@
-import pendulum
-from typing import List
+import os
+from typing import Dict, List, Tuple
 
-from bs4 import BeautifulSoup
+import pendulum
+from lxml import etree
 
-from Constants.Constants import Strings
+from Constants.Constants import Strings, Numbers
 from Tools.ConfigManager import ConfigManager
 
 
 class SitemapGenerator:
     """
-    Generates a sitemap.xml file based on page dictionaries
+    Generates a sitemap.xml file based on page dictionaries. The xml is streamed directly into the file. Sites with
+    more pages than a single sitemap may contain get a sitemap index pointing to numbered sitemap shards.
     """
 
-    def __init__(self, pages: List[str]):
+    def __init__(self, pages: Dict[str, float], work_dir: str):
         """
         Constructor for the sitemap generator.
-        :param pages: List of html page filenames.
+        :param pages: Dictionary of html page filenames to the last known modification timestamp of the page or 0.
+        :param work_dir: Working directory of the editor, the sitemap is written there.
         """
         self._pages = pages
-        self._soup = BeautifulSoup(features='xml')
+        self._work_dir = work_dir
         self._config_manager: ConfigManager = ConfigManager.get_instance()
+        self._page_url = self._config_manager.get_url()
+
+    def create_sitemap(self) -> List[str]:
+        """
+        Write the sitemap xml into the working directory. Uses a sitemap index and shards if there are too many pages.
+        :return: List of file names that were written.
+        :raise OSError: if a file can not be written.
+        """
+        entries = [(page, self._get_lastmod(page, timestamp)) for page, timestamp in self._pages.items()]
+        if len(entries) <= Numbers.sitemap_max_urls:
+            self._write_urlset(os.path.join(self._work_dir, Strings.sitemap_file), entries)
+            self._remove_old_shards(0)
+            return [Strings.sitemap_file]
+
+        shards: List[Tuple[str, float]] = []
+        for start in range(0, len(entries), Numbers.sitemap_max_urls):
+            chunk = entries[start:start + Numbers.sitemap_max_urls]
+            shard_file = Strings.sitemap_shard_file.format(len(shards) + 1)
+            self._write_urlset(os.path.join(self._work_dir, shard_file), chunk)
+            shards.append((shard_file, max(lastmod for _, lastmod in chunk)))
+        self._write_index(os.path.join(self._work_dir, Strings.sitemap_file), shards)
+        self._remove_old_shards(len(shards))
+        return [Strings.sitemap_file] + [shard for shard, _ in shards]
+
+    def _get_lastmod(self, page: str, timestamp: float) -> float:
+        """
+        Return the real last modification time of a page. This is the newer of the known timestamp and the
+        modification time of the file on disk. If neither is known, the current time is used.
+        :param page: The page file name relative to the working directory.
+        :param timestamp: The last known modification timestamp or 0.
+        :return: Float timestamp of the last modification.
+        """
+        try:
+            timestamp = max(timestamp, os.path.getmtime(os.path.join(self._work_dir, page)))
+        except OSError as _:
+            # The file may not have been written yet.
+            pass
+        if not timestamp:
+            timestamp = pendulum.now().float_timestamp
+        return timestamp
+
+    @staticmethod
+    def _format_date(timestamp: float) -> str:
+        """
+        Format a timestamp as a W3C date used in sitemaps.
+        :param timestamp: The float timestamp.
+        :return: Date string YYYY-MM-DD.
+        """
+        return pendulum.from_timestamp(timestamp, tz='local').strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _tag(name: str) -> str:
+        """
+        Return the qualified tag name of an element in the sitemap namespace.
+        :param name: Local name of the element.
+        :return: Tag name in lxml {namespace}name notation.
+        """
+        return f'{{{Strings.sitemap_xmlns}}}{name}'
 
-    def create_sitemap(self) -> str:
-        """
-        Creates a string xml code of the sitemap.
-        :return: xml of the sitemap as a string.
-        """
-        urlset_tag = self._soup.new_tag('urlset', attrs={'xmlns': Strings.sitemap_xmlns})
-        self._soup.append(urlset_tag)
-        page_url = self._config_manager.get_url()
-        for page in self._pages:
-            url_tag = self._soup.new_tag('url')
-            # Location
-            loc_tag = self._soup.new_tag('loc')
-            loc_tag.string = f'{page_url}/{page}'
-            url_tag.append(loc_tag)
-            # Last modification
-            lastmod_tag = self._soup.new_tag('lastmod')
-            # Just use today for all.
-            lastmod_tag.string = pendulum.now().strftime("%Y-%m-%d")
-            url_tag.append(lastmod_tag)
-            # Change frequency
-            changefreq_tag = self._soup.new_tag('changefreq')
-            changefreq_tag.string = Strings.change_frequency
-            url_tag.append(changefreq_tag)
-            urlset_tag.append(url_tag)
-
-        self._soup.append(urlset_tag)
-        return str(self._soup.prettify())
+    def _write_text_element(self, xf, name: str, text: str) -> None:
+        """
+        Write a simple element with text content into the xml stream.
+        :param xf: The open lxml xmlfile.
+        :param name: Local name of the element in the sitemap namespace.
+        :param text: Text content of the element.
+        :return: None
+        """
+        with xf.element(self._tag(name)):
+            xf.write(text)
+
+    def _write_urlset(self, path: str, entries: List[Tuple[str, float]]) -> None:
+        """
+        Stream a sitemap urlset into a file.
+        :param path: Disk path of the output file.
+        :param entries: List of page file names and their last modification timestamps.
+        :return: None
+        """
+        with etree.xmlfile(path, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(self._tag('urlset'), nsmap={None: Strings.sitemap_xmlns}):
+                for page, lastmod in entries:
+                    with xf.element(self._tag('url')):
+                        self._write_text_element(xf, 'loc', f'{self._page_url}/{page}')
+                        self._write_text_element(xf, 'lastmod', self._format_date(lastmod))
+                        self._write_text_element(xf, 'changefreq', Strings.change_frequency)
+
+    def _write_index(self, path: str, shards: List[Tuple[str, float]]) -> None:
+        """
+        Stream a sitemap index pointing to sitemap shards into a file.
+        :param path: Disk path of the output file.
+        :param shards: List of shard file names and the newest last modification timestamp in each shard.
+        :return: None
+        """
+        with etree.xmlfile(path, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(self._tag('sitemapindex'), nsmap={None: Strings.sitemap_xmlns}):
+                for shard, lastmod in shards:
+                    with xf.element(self._tag('sitemap')):
+                        self._write_text_element(xf, 'loc', f'{self._page_url}/{shard}')
+                        self._write_text_element(xf, 'lastmod', self._format_date(lastmod))
+
+    def _remove_old_shards(self, count: int) -> None:
+        """
+        Remove shards left over from a previous larger sitemap.
+        :param count: Number of shards that are currently in use.
+        :return: None
+        """
+        number = count + 1
+        shard_path = os.path.join(self._work_dir, Strings.sitemap_shard_file.format(number))
+        while os.path.exists(shard_path):
+            os.remove(shard_path)
+            number += 1
+            shard_path = os.path.join(self._work_dir, Strings.sitemap_shard_file.format(number))
@@ -1,29 +1,47 @@
+import threading
+
 from Tools.ConfigManager import ConfigManager
 
+from Tools.Instrumentation import Instrumentation
 from Tools.SpellCheckerWithIgnoredList import SpellCheckerWithIgnoreList
 
 
 class SpellCheckedObject:
+    # All spell checked objects share one spellchecker per thread instead of carrying their own. The checker keeps the
+    # text it is checking, so it can not be shared between threads.
+    _thread_local = threading.local()
 
     def __init__(self):
         """
         Constructor for a spell checked element base class.
-        Sets up spellchecker.
         """
         self._config_manager: ConfigManager = ConfigManager.get_instance()
-        self._checker = SpellCheckerWithIgnoreList(self._config_manager.get_spelling_lang())
 
+    @staticmethod
+    def _get_checker() -> SpellCheckerWithIgnoreList:
+        """
+        Return the spellchecker shared by all spell checked objects in the current thread, create it if needed.
+        :return: The shared spellchecker.
+        """
+        checker = getattr(SpellCheckedObject._thread_local, 'checker', None)
+        if checker is None:
+            checker = SpellCheckerWithIgnoreList(ConfigManager.get_instance().get_spelling_lang())
+            SpellCheckedObject._thread_local.checker = checker
+        return checker
+
+    @Instrumentation.timed()
     def _spell_check(self, text: str) -> bool:
         """
         Do a spellcheck on the text.
         :param text: Text to check.
         :return: Return False if incorrect.
         """
+        checker = self._get_checker()
         # Reload ignored words, these internal instances would not otherwise know about new words added to the list.
-        self._checker.reload_language()
-        self._checker.set_text(text)
+        checker.reload_language()
+        checker.set_text(text)
         try:
-            self._checker.next()
+            checker.next()
             return False
         except StopIteration:
             # Next raises exception if no mistake is found.
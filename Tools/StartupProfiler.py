@@ -0,0 +1,124 @@
+import builtins
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from Constants.Constants import Numbers
+from Constants.Constants import Strings
+
+
+class StartupProfiler:
+    """
+    Singleton class.
+    Measures how long the editor takes to start. When started, it times the first import of every module done in the
+    main thread and records named phases of the startup. All methods do nothing unless the profiler was started, so
+    the marks can stay in the code. Run the editor as: python3 WhitebearEditor.py --profile-startup
+    """
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """
+        Static access method.
+        """
+        if StartupProfiler.__instance is None:
+            StartupProfiler()
+        return StartupProfiler.__instance
+
+    def __init__(self):
+        """
+        Constructor for the startup profiler.
+        """
+        if StartupProfiler.__instance is not None:
+            raise Exception('This class is a singleton!')
+        else:
+            StartupProfiler.__instance = self
+        self._running = False
+        self._start = 0.0
+        self._original_import = None
+        # Module name: (cumulative time, self time), the self time excludes the modules imported by the module.
+        self._imports: Dict[str, Tuple[float, float]] = {}
+        # Time spent in nested imports of the imports that are currently in progress.
+        self._stack: List[float] = []
+        self._phases: List[Tuple[str, float]] = []
+
+    @staticmethod
+    def requested(argv: List[str]) -> bool:
+        """
+        Return True if the editor was started with the startup profile argument.
+        :param argv: The command line arguments.
+        :return: True if the startup should be profiled.
+        """
+        return Strings.profile_startup_argument in argv
+
+    def is_running(self) -> bool:
+        """
+        Return True if the profiler is measuring.
+        :return: True if the profiler is measuring.
+        """
+        return self._running
+
+    def start(self) -> None:
+        """
+        Start measuring time and replace the builtin import with a timed import.
+        :return: None
+        """
+        if self._running:
+            return
+        self._running = True
+        self._start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self) -> None:
+        """
+        Stop measuring and restore the builtin import.
+        :return: None
+        """
+        if not self._running:
+            return
+        builtins.__import__ = self._original_import
+        self._running = False
+
+    def mark(self, phase: str) -> None:
+        """
+        Record the time since the start of the profiler at the end of a startup phase.
+        :param phase: Name of the phase that just finished.
+        :return: None
+        """
+        if self._running:
+            self._phases.append((phase, time.perf_counter() - self._start))
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        Replacement of the builtin import which measures the first import of a module in the main thread.
+        Parameters are the same as for builtins.__import__.
+        :return: The imported module.
+        """
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self._imports.setdefault(name, (elapsed, elapsed - nested))
+
+    def get_report(self) -> str:
+        """
+        Return a text report of the startup phases and the slowest imports.
+        :return: The report.
+        """
+        lines = [Strings.label_profile_phases]
+        for phase, timestamp in self._phases:
+            lines.append(f'{timestamp * 1000:10.1f} ms  {phase}')
+        lines.append(Strings.label_profile_imports)
+        slowest = sorted(self._imports.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (cumulative, own) in slowest[:Numbers.profile_report_imports]:
+            lines.append(f'{cumulative * 1000:10.1f} ms {own * 1000:10.1f} ms  {name}')
+        return '\n'.join(lines)
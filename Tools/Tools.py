@@ -1,38 +1,76 @@
-from typing import List
+import gzip
+import hashlib
+import io
+import os
+import re
+import threading
+from typing import Dict, List, Set, Tuple
 
-import wx
-from PIL import Image
 from lxml import etree
 from lxml import html
 from lxml.etree import XMLSyntaxError, XMLSchemaParseError, ParserError
-from wx.lib.agw.supertooltip import SuperToolTip
 
 from Constants.Constants import Numbers
 from Constants.Constants import Strings
 from Exceptions.UnrecognizedFileException import UnrecognizedFileException
 from Resources.Fetch import Fetch
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
+
+# Pillow and httplib2 are imported by the methods that use them, the editor imports this module at startup.
+
+try:
+    import brotli
+except ImportError:
+    # Brotli is optional, only gzip copies are created without it.
+    brotli = None
 
 
 class Tools:
+    # Xml schemas are compiled on first use and shared. Validation stores its errors in the schema instance, so only
+    # one thread may validate at a time.
+    _schemas: Dict[str, etree.XMLSchema] = {}
+    _schema_lock = threading.Lock()
+    # Image variant formats the installed Pillow can write, found out on first use.
+    _variant_formats: List[Tuple[str, str, str]] = None
+    # Ids of videos whose poster could not be downloaded in this session. Saving does not wait for them again, the
+    # pages fall back to the iframe.
+    _failed_posters: Set[str] = set()
+    _poster_lock = threading.Lock()
 
     @staticmethod
-    def get_warning_tip(field, title: str) -> SuperToolTip:
+    def _get_schema(schema: str) -> etree.XMLSchema:
         """
-        Create and return an instance of SuperToolTip targeted for a specific TextCtrl and set up to show SEO warnings.
-        :param field: The text field for the new tip.
-        :param title: The header text of the tip.
-        :return: Set up SuperToolTip
+        Return the compiled xml schema, compile it if it is used for the first time. Must be called with the schema
+        lock held.
+        :param schema: The name of the schema to use.
+        :return: The compiled xml schema.
+        :raises UnrecognizedFileException if xml schema is incorrect.
         """
-        tip = SuperToolTip(None, footer='   ')
-        tip.SetHeader(title)
-        tip.SetTarget(field)
-        tip.SetTopGradientColor(Numbers.YELLOW_COLOR)
-        tip.SetMiddleGradientColor(Numbers.YELLOW_COLOR)
-        tip.SetBottomGradientColor(Numbers.YELLOW_COLOR)
-        tip.SetTextColor(wx.BLACK)
-        return tip
+        if schema not in Tools._schemas:
+            try:
+                Tools._schemas[schema] = etree.XMLSchema(etree.parse(Fetch.get_resource_path(schema)))
+            except XMLSchemaParseError as e:
+                raise UnrecognizedFileException(f'{Strings.exception_schema_syntax_error}:\n{e}')
+        return Tools._schemas[schema]
 
     @staticmethod
+    def validate_tree(xml_doc, schema: str) -> (bool, List[str]):
+        """
+        Validate an already parsed document against a xml schema.
+        :param xml_doc: The parsed lxml document.
+        :param schema: The name of the schema to use.
+        :return: Tuple of boolean validation result and optional list of error messages.
+        :raises UnrecognizedFileException if xml schema is incorrect.
+        """
+        with Tools._schema_lock:
+            xmlschema = Tools._get_schema(schema)
+            is_valid = xmlschema.validate(xml_doc)
+            errors = [error.message for error in xmlschema.error_log]
+        return is_valid, errors
+
+    @staticmethod
+    @Instrumentation.timed()
     def validate(html_string: str, schema: str) -> (bool, List[str]):
         """
         Validate a document against a xml schema.
@@ -42,83 +80,390 @@ class Tools:
         :raises UnrecognizedFileException if html parse fails.
         :raises UnrecognizedFileException if xml schema is incorrect.
         """
-        errors = []
         try:
-            xmlschema = etree.XMLSchema(etree.parse(Fetch.get_resource_path(schema)))
             xml_doc = html.fromstring(html_string)
-            is_valid = xmlschema.validate(xml_doc)
-        except XMLSchemaParseError as e:
-            raise UnrecognizedFileException(f'{Strings.exception_schema_syntax_error}:\n{e}')
         except XMLSyntaxError as e:
             raise UnrecognizedFileException(f'{Strings.exception_html_syntax_error}:\n{e}')
         except ParserError as e:
             raise UnrecognizedFileException(f'{Strings.exception_html_syntax_error}:\n{e}')
-        for error in xmlschema.error_log:
-            errors.append(error.message)
-        return is_valid, errors
+        return Tools.validate_tree(xml_doc, schema)
 
     @staticmethod
-    def create_image(text: str) -> wx.Bitmap:
+    def create_image(text: str, path: str) -> (int, int):
         """
-        Create an image containing the text.
+        Create a png image containing the text. Uses PIL so that no wx.App is needed.
         :param text: The text to put into the image.
-        :return: The image with the text.
+        :param path: Full disk path where the png image is saved.
+        :return: The size of the image (width, height).
+        :raise OSError if the image can not be saved.
         """
-        dc = wx.MemoryDC()
-        font: wx.Font = dc.GetFont()
-        font.SetPointSize(Numbers.heading_3_size)
-        dc.SetFont(font)
-        size = dc.GetTextExtent(text)
+        from PIL import Image, ImageDraw, ImageFont
+        try:
+            font = ImageFont.truetype(Strings.contact_font, Numbers.contact_font_size)
+        except OSError as _:
+            font = ImageFont.load_default()
+        left, top, right, bottom = ImageDraw.Draw(Image.new('RGB', (1, 1))).textbbox((0, 0), text, font=font)
+        image = Image.new('RGB', (right - left + 10, bottom - top + 10), 'white')
+        ImageDraw.Draw(image).text((5 - left, 5 - top), text, fill='black', font=font)
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG')
+        # Keep the old file when the image is the same so that it is not uploaded again.
+        if not Tools.is_same_content(path, buffer.getvalue()):
+            with open(path, 'wb') as file:
+                file.write(buffer.getvalue())
+        return image.size
 
-        bitmap = wx.Bitmap(width=size[0] + 10, height=size[1] + 10)
-        dc.SelectObject(bitmap)
-        dc.Clear()
-        dc.SetTextForeground(wx.BLACK)
+    @staticmethod
+    def is_same_content(path: str, data: bytes) -> bool:
+        """
+        Compare the sha256 hash of a file on disk with the hash of new content for the file.
+        :param path: Full disk path to the file.
+        :param data: The new content.
+        :return: True if the file exists and contains exactly the new content.
+        """
+        try:
+            if os.path.getsize(path) != len(data):
+                return False
+            digest = hashlib.sha256()
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(Numbers.hash_chunk_size), b''):
+                    digest.update(chunk)
+        except OSError as _:
+            return False
+        return digest.digest() == hashlib.sha256(data).digest()
 
-        dc.DrawText(text, 5, 5)
+    @staticmethod
+    @Instrumentation.timed()
+    def precompress(path: str) -> List[str]:
+        """
+        Create gzip and if brotli is installed also brotli compressed copies of a text file next to it, so the web
+        server can send them without compressing the file on every request. A copy that is newer than the file is
+        reused.
+        :param path: Full disk path to the file.
+        :return: List of full disk paths of the compressed copies.
+        :raise OSError if the file can not be read or a copy can not be written.
+        """
+        compressors = [(Strings.extension_gzip, lambda content: gzip.compress(content, Numbers.gzip_level, mtime=0))]
+        if brotli:
+            compressors.append((Strings.extension_brotli,
+                                lambda content: brotli.compress(content, quality=Numbers.brotli_quality)))
+        source_mtime = os.path.getmtime(path)
+        data = None
+        sidecars = []
+        for extension, compress in compressors:
+            sidecar = path + extension
+            sidecars.append(sidecar)
+            try:
+                if os.path.getmtime(sidecar) >= source_mtime:
+                    continue
+            except OSError as _:
+                # The copy does not exist yet.
+                pass
+            if data is None:
+                with open(path, 'rb') as file:
+                    data = file.read()
+            compressed = compress(data)
+            if not Tools.is_same_content(sidecar, compressed):
+                with open(sidecar, 'wb') as file:
+                    file.write(compressed)
+            else:
+                # Mark the copy as up to date so it is not compressed again next time.
+                os.utime(sidecar)
+        return sidecars
 
-        return bitmap
+    @staticmethod
+    def minify_css(css: str) -> str:
+        """
+        Remove comments and all whitespace that is not needed from a stylesheet. Quoted strings are kept as they are.
+        :param css: The stylesheet.
+        :return: The minified stylesheet.
+        """
+        parts = []
+        # Odd parts are quoted strings, even parts are the code around them.
+        for number, part in enumerate(re.split(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')', css)):
+            if number % 2:
+                parts.append(part)
+                continue
+            part = re.sub(r'/\*.*?\*/', ' ', part, flags=re.DOTALL)
+            part = re.sub(r'\s+', ' ', part)
+            part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+            part = re.sub(r':\s', ':', part)
+            parts.append(part.replace(';}', '}'))
+        return ''.join(parts).strip()
 
     @staticmethod
-    def set_field_background(field: wx.TextCtrl, color: wx.Colour) -> None:
+    def create_minified_css(working_directory: str) -> str:
         """
-        Set background color for a field.
-        :param field: wx.TextCtrl.
-        :param color: The wx.Color to set.
-        :return: None
+        Create a minified copy of the stylesheet of a whitebear web next to it. Minified pages link to the copy, the
+        stylesheet itself stays readable for editing. A copy that is newer than the stylesheet is reused.
+        :param working_directory: The whitebear working directory.
+        :return: Full disk path of the minified copy.
+        :raise OSError if the stylesheet can not be read or the copy can not be written.
+        """
+        path = os.path.join(working_directory, Strings.css_file)
+        minified_path = os.path.join(working_directory, Strings.css_minified_file)
+        try:
+            if os.path.getmtime(minified_path) >= os.path.getmtime(path):
+                return minified_path
+        except OSError as _:
+            # The copy does not exist yet.
+            pass
+        with open(path, 'r', encoding='utf-8') as file:
+            minified = Tools.minify_css(file.read())
+        # Pages may be converted in several threads at once, replace the copy in one step.
+        temporary_path = f'{minified_path}.{threading.get_ident()}'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write(minified)
+        os.replace(temporary_path, minified_path)
+        return minified_path
+
+    @staticmethod
+    def _get_variant_formats() -> List[Tuple[str, str, str]]:
+        """
+        Return the image variant formats that the installed Pillow can write. Avif needs a newer Pillow or a plugin.
+        :return: List of tuples (Pillow format, file extension, mime type).
+        """
+        from PIL import Image
+        if Tools._variant_formats is None:
+            formats = []
+            for variant in Strings.image_variants:
+                try:
+                    Image.new('RGB', (1, 1)).save(io.BytesIO(), variant[0])
+                    formats.append(variant)
+                except (KeyError, OSError, ValueError) as _:
+                    # KeyError is raised for unknown formats, OSError when the encoder is missing.
+                    pass
+            Tools._variant_formats = formats
+        return Tools._variant_formats
+
+    @staticmethod
+    def get_srcset_widths(thumbnail_width: int) -> List[int]:
+        """
+        Return the extra widths of a thumbnail that are offered to browsers in the srcset attribute.
+        :param thumbnail_width: Width of the thumbnail in pixels.
+        :return: List of widths in pixels.
+        """
+        return [round(thumbnail_width * scale) for scale in Numbers.srcset_scales]
+
+    @staticmethod
+    def get_width_image_path(thumbnail_path: str, width: int) -> str:
+        """
+        Return the path of a thumbnail resized to another width, for example thumbnails/bear-600w.jpg.
+        :param thumbnail_path: Full disk path or relative file name of the thumbnail.
+        :param width: The width in pixels.
+        :return: The path in the same form as the thumbnail path.
+        """
+        stem, extension = os.path.splitext(thumbnail_path)
+        return f'{stem}-{width}w{extension}'
+
+    @staticmethod
+    def get_width_images(thumbnail_path: str) -> List[str]:
+        """
+        Return the thumbnails resized to other widths that exist on disk.
+        :param thumbnail_path: Full disk path to the thumbnail.
+        :return: List of full disk paths.
         """
-        field.SetBackgroundColour(color)
-        style_carrier = wx.TextAttr()
-        # Set color for the current text separately, it does not work with just background color
-        field.GetStyle(0, style_carrier)
-        style_carrier.SetBackgroundColour(color)
-        field.SetStyle(0, len(field.GetValue()), style_carrier)
+        try:
+            width = Tools.get_image_size(thumbnail_path)[0]
+        except OSError as _:
+            return []
+        paths = [Tools.get_width_image_path(thumbnail_path, w) for w in Tools.get_srcset_widths(width)]
+        return [path for path in paths if os.path.exists(path)]
 
     @staticmethod
+    def create_image_widths(thumbnail_path: str) -> List[str]:
+        """
+        Resize the original of a thumbnail to the other widths offered in the srcset attribute. The original has the
+        same name in the originals folder. Widths larger than the original are skipped, a resized image that is newer
+        than both the thumbnail and the original is reused. This runs in worker processes, it must not use any shared
+        state.
+        :param thumbnail_path: Full disk path to the thumbnail.
+        :return: List of full disk paths of the resized images that were written.
+        :raise OSError if an image can not be read or a resized image can not be written.
+        """
+        from PIL import Image
+        original_path = os.path.join(os.path.dirname(os.path.dirname(thumbnail_path)), Strings.folder_originals,
+                                     os.path.basename(thumbnail_path))
+        if not os.path.exists(original_path):
+            return []
+        newest_source = max(os.path.getmtime(original_path), os.path.getmtime(thumbnail_path))
+        thumbnail_width, thumbnail_height = Tools.get_image_size(thumbnail_path)
+        paths = []
+        original_width = None
+        original = None
+        try:
+            for width in Tools.get_srcset_widths(thumbnail_width):
+                path = Tools.get_width_image_path(thumbnail_path, width)
+                try:
+                    if os.path.getmtime(path) >= newest_source:
+                        continue
+                except OSError as _:
+                    # The resized image does not exist yet.
+                    pass
+                if original_width is None:
+                    # Only the header is read, the original is decoded only when a width is really written.
+                    original_width, _ = Tools.get_image_size(original_path)
+                if width > original_width:
+                    continue
+                if original is None:
+                    original = Image.open(original_path)
+                    original.load()
+                height = round(thumbnail_height * width / thumbnail_width)
+                buffer = io.BytesIO()
+                original.resize((width, height), Image.LANCZOS).save(buffer, original.format,
+                                                                      quality=Numbers.image_quality)
+                with open(path, 'wb') as file:
+                    file.write(buffer.getvalue())
+                paths.append(path)
+        finally:
+            if original:
+                original.close()
+        return paths
+
+    @staticmethod
+    def create_image_variants(path: str) -> List[str]:
+        """
+        Create webp and if Pillow supports it also avif variants of a jpg or png image next to it. Browsers that
+        support the format download the smaller variant instead of the image. A variant that is newer than the image is
+        reused. This runs in worker processes, it must not use any shared state.
+        :param path: Full disk path to the image.
+        :return: List of full disk paths of the variants that were written.
+        :raise OSError if the image can not be read or a variant can not be written.
+        """
+        from PIL import Image
+        source_mtime = os.path.getmtime(path)
+        written = []
+        image = None
+        try:
+            for image_format, extension, _ in Tools._get_variant_formats():
+                variant = path + extension
+                try:
+                    if os.path.getmtime(variant) >= source_mtime:
+                        continue
+                except OSError as _:
+                    # The variant does not exist yet.
+                    pass
+                if image is None:
+                    image = Image.open(path)
+                    image.load()
+                # Encode into memory first so a failed conversion does not leave a broken variant behind.
+                buffer = io.BytesIO()
+                image.save(buffer, image_format, quality=Numbers.variant_image_quality)
+                with open(variant, 'wb') as file:
+                    file.write(buffer.getvalue())
+                written.append(variant)
+        finally:
+            if image:
+                image.close()
+        return written
+
+    @staticmethod
+    def create_image_set(image: str) -> Tuple[List[str], str]:
+        """
+        Create the other widths of a thumbnail and the webp and avif variants of all of them. This is the worker
+        function of the image variant process pool, the workers unpickle it from this module which does not import wx.
+        Errors are returned instead of raised so one broken image does not stop the others.
+        :param image: Full disk path to the image.
+        :return: Tuple of the list of written files and an error message or None.
+        """
+        from PIL import Image
+        try:
+            widths = Tools.create_image_widths(image)
+            written = list(widths)
+            for path in [image] + widths:
+                written.extend(Tools.create_image_variants(path))
+            return written, None
+        except (OSError, ValueError, SyntaxError, EOFError, Image.DecompressionBombError) as e:
+            # Pillow reports broken or too large images with other exceptions than OSError.
+            return [], f'{image} {e}'
+
+    @staticmethod
+    def _get_video_id(url: str) -> str:
+        """
+        Return the id of a YouTube video from its embed url.
+        :param url: The embed url of the video.
+        :return: The id of the video, None if the url is not an embed url.
+        """
+        match = re.search(r'/embed/([\w-]+)', url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def get_video_poster_path(working_directory: str, url: str) -> str:
+        """
+        Return the disk path of the cached poster image of an embedded YouTube video.
+        :param working_directory: The whitebear working directory.
+        :param url: The embed url of the video.
+        :return: Full disk path of the poster image, None if the url is not a YouTube embed url.
+        """
+        video_id = Tools._get_video_id(url)
+        if not video_id:
+            return None
+        return os.path.join(working_directory, Strings.folder_images, Strings.folder_thumbnails,
+                            Strings.video_poster_file.format(video_id))
+
+    @staticmethod
+    @Instrumentation.timed()
+    def create_video_poster(working_directory: str, url: str) -> str:
+        """
+        Download the thumbnail of an embedded YouTube video and save it resized to the video size as its poster image.
+        A poster that already exists is reused, the download only happens once per video. A failed download is not
+        tried again until the editor is started again.
+        :param working_directory: The whitebear working directory.
+        :param url: The embed url of the video.
+        :return: Full disk path of the poster image, None if it could not be created.
+        """
+        import httplib2
+        from PIL import Image
+        path = Tools.get_video_poster_path(working_directory, url)
+        if not path or FileSnapshot.get_instance().exists(path):
+            return path
+        video_id = Tools._get_video_id(url)
+        with Tools._poster_lock:
+            if video_id in Tools._failed_posters:
+                return None
+        h = httplib2.Http(timeout=Numbers.online_test_timeout)
+        try:
+            response, content = h.request(Strings.video_poster_url.format(video_id), 'GET')
+            if int(response['status']) != 200:
+                with Tools._poster_lock:
+                    Tools._failed_posters.add(video_id)
+                return None
+            with Image.open(io.BytesIO(content)) as image:
+                poster = image.convert('RGB').resize((Numbers.video_width, Numbers.video_height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            poster.save(buffer, 'JPEG', optimize=True, quality=Numbers.image_quality)
+            with open(path, 'wb') as file:
+                file.write(buffer.getvalue())
+            FileSnapshot.get_instance().update([path])
+            return path
+        except (httplib2.HttpLib2Error, OSError, ValueError) as _:
+            # Without connectivity or for a missing video the page falls back to the iframe.
+            with Tools._poster_lock:
+                Tools._failed_posters.add(video_id)
+            return None
+        finally:
+            h.close()
+
+    @staticmethod
+    def get_image_size(path: str) -> (int, int):
+        """
+        Return the size of an image on disk. Only the image header is read.
+        :param path: Full disk path to the image.
+        :return: The size of the image (width, height).
+        :raise OSError if the file is missing or is not an image.
+        """
+        from PIL import Image
+        with Image.open(path) as image:
+            return image.size
+
+    @staticmethod
+    @Instrumentation.timed()
     def optimize_image(img_path: str) -> None:
         """
         Optimize and overwrite jpg and png images.
         :param img_path: Full path to the image on disk.
         :return: None
         """
+        from PIL import Image
         img = Image.open(img_path)
         img.save(img_path, optimize=True, quality=Numbers.image_quality)
-
-    @staticmethod
-    def inplace_rescale(image: wx.Image, target_width: int, target_height: int, border: int) -> None:
-        """
-        Rescale image in place to fit into a defined size. The image will retain original aspect ratio.
-        :param image: Image to rescale
-        :param target_width: Width of the new image.
-        :param target_height: Height of the new image.
-        :param border: Leave space for a border.
-        :return: None
-        """
-        width_scale = target_width / image.GetWidth()
-        height_scale = target_height / image.GetHeight()
-        bounded_scale = min(width_scale, height_scale)
-        width = int(image.GetWidth() * bounded_scale) - border
-        height = int(image.GetHeight() * bounded_scale) - border
-        width = width if width > 0 else 1
-        height = height if height > 0 else 1
-        image.Rescale(width, height, quality=wx.IMAGE_QUALITY_HIGH)
\ No newline at end of file
@@ -6,6 +6,7 @@ import wx
 from Constants.Constants import Strings, Numbers
 from Exceptions.AccessException import AccessException
 from Exceptions.TransferException import TransferException
+from Tools.Instrumentation import Instrumentation
 
 
 class Uploader:
@@ -82,6 +83,7 @@ class Uploader:
         # collected and the connection from being closed.
         self._sftp_connection.sshclient = self._ssh_connection
 
+    @Instrumentation.timed()
     def upload_file(self, paths: (str, str)) -> str:
         """
         Upload one file to the SFTP server to the same location it is in inside the whitebear web working directory.
@@ -0,0 +1,229 @@
+#!/usr/bin/python3
+
+"""
+Command line entry point for the whitebear editor. Loads a whitebear web directory, runs the SEO test of all documents,
+converts and saves all pages and regenerates the sitemap without starting the GUI. wx is not imported.
+The directory must have been set up in the editor before, the page setup is taken from the editor configuration.
+Usage: python3 WhitebearCli.py /path/to/web/root --report report.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pendulum
+
+from Constants.Constants import Status
+from Constants.Constants import Strings
+from Exceptions.AccessException import AccessException
+from Exceptions.IndexException import IndexException
+from Exceptions.UnrecognizedFileException import UnrecognizedFileException
+from Exceptions.WrongFormatException import WrongFormatException
+from Tools.ConfigManager import ConfigManager
+from Tools.DirectoryLoader import DirectoryLoader
+from Tools.Document.WhitebearDocument import WhitebearDocument
+from Tools.Document.WhitebearDocumentArticle import WhitebearDocumentArticle
+from Tools.FileSnapshot import FileSnapshot
+from Tools.Instrumentation import Instrumentation
+from Tools.SitemapGenerator import SitemapGenerator
+from Tools.Tools import Tools
+
+
+class WhitebearCli:
+    """
+    Headless counterpart of the MainFrame save and self test actions.
+    """
+
+    def __init__(self, directory: str, jobs: int, online: bool):
+        """
+        Constructor for the command line interface.
+        :param directory: Path to the whitebear web root directory.
+        :param jobs: Number of threads used for the SEO test.
+        :param online: Run the online test of links and videos.
+        """
+        self._directory = os.path.abspath(directory)
+        self._jobs = max(jobs, 1)
+        self._online = online
+        self._config_manager: ConfigManager = ConfigManager.get_instance()
+        self._loader = DirectoryLoader()
+        self._report: Dict[str, object] = {'directory': self._directory, 'documents': {}, 'saved': [],
+                                           'unchanged': [], 'failed': {}, 'sitemap': []}
+
+    def load(self) -> None:
+        """
+        Activate the configuration of the directory and load all documents.
+        :return: None
+        :raises AccessException, IndexException, UnrecognizedFileException, WrongFormatException, FileNotFoundError:
+        if the directory can not be loaded.
+        """
+        if not self._config_manager.set_active_dir(self._directory):
+            raise AccessException(f'{Strings.exception_directory_not_configured}: {self._directory}')
+        if not self._config_manager.check_set_config_values():
+            raise AccessException(f'{Strings.exception_default_value_not_set}: {self._directory}')
+        self._loader.load_directory(self._directory)
+
+    def _documents(self) -> List[WhitebearDocument]:
+        """
+        Return all loaded documents, articles first because menus and index are built from them.
+        :return: List of all loaded documents.
+        """
+        return list(self._loader.get_articles().values()) + list(self._loader.get_menus().values()) + \
+            [self._loader.get_index_page()]
+
+    def _test_article(self, article: WhitebearDocumentArticle) -> bool:
+        """
+        Run the SEO test of one article.
+        :param article: The article to test.
+        :return: True if the test passed.
+        """
+        return article.test_self(self._online)
+
+    def test(self) -> bool:
+        """
+        Run the SEO test of all documents. Articles are tested in parallel, every thread has its own spellchecker.
+        :return: True if all documents passed.
+        """
+        # No file watcher runs here, files changed by other programs since the load are found by their folders.
+        FileSnapshot.get_instance().refresh()
+        articles = list(self._loader.get_articles().values())
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            results = list(executor.map(self._test_article, articles))
+        for article, result in zip(articles, results):
+            self._report['documents'][article.get_filename()] = {'type': Strings.article, 'passed': result,
+                                                                 'errors': self._article_errors(article)}
+        for menu in self._loader.get_menus().values():
+            self._report['documents'][menu.get_filename()] = {'type': Strings.menu, 'passed': menu.test_self(),
+                                                              'errors': []}
+        index = self._loader.get_index_page()
+        self._report['documents'][index.get_filename()] = {'type': Strings.index, 'passed': index.test_self(),
+                                                           'errors': []}
+        return all(document['passed'] for document in self._report['documents'].values())
+
+    @staticmethod
+    def _article_errors(article: WhitebearDocumentArticle) -> List[str]:
+        """
+        Collect the SEO error messages of an already tested article.
+        :param article: The tested article.
+        :return: List of error messages.
+        """
+        errors = []
+        for result, message, _ in (article.seo_test_name(article.get_page_name()[0]),
+                                   article.seo_test_date(article.get_date()[0]),
+                                   article.seo_test_keywords(article.get_keywords_string()[0]),
+                                   article.seo_test_description(article.get_description()[0])):
+            if not result:
+                errors.append(message)
+        images = [article.get_article_image()] + article.get_aside_images() + article.get_text_images()
+        for image in images:
+            if image.get_status() == Status.ERROR:
+                errors.append(f'{Strings.article} image: {image.get_full_filename()}')
+        if article.get_menu_item().get_status() == Status.ERROR:
+            errors.append(f'{Strings.menu} item: {article.get_menu_item().get_filename()}')
+        for link in article.get_links():
+            if link.get_status() == Status.ERROR:
+                errors.append(f'link: {link.get_url()[0]} {link.get_url()[1]}')
+        for video in article.get_videos():
+            if video.get_status() == Status.ERROR:
+                errors.append(f'video: {video.get_url()[0]} {video.get_url()[1]}')
+        return errors
+
+    def save(self) -> bool:
+        """
+        Convert all documents into html and write them to disk.
+        :return: True if all documents were saved.
+        """
+        FileSnapshot.get_instance().refresh()
+        for doc in self._documents():
+            doc.set_uploaded(False)
+            try:
+                doc.convert_to_html()
+                doc.set_saved(True)
+                if Tools.is_same_content(doc.get_path(), doc.get_html_to_save().encode('utf-8')):
+                    # Unchanged files keep their modification time and are not uploaded again.
+                    self._report['unchanged'].append(doc.get_filename())
+                    continue
+                with open(doc.get_path(), 'w', encoding='utf-8') as file:
+                    file.write(doc.get_html_to_save())
+                if isinstance(doc, WhitebearDocumentArticle):
+                    self._config_manager.store_not_uploaded(doc.get_filename())
+                self._report['saved'].append(doc.get_filename())
+            except (UnrecognizedFileException, OSError) as e:
+                self._report['failed'][doc.get_filename()] = str(e)
+        return not self._report['failed']
+
+    def save_sitemap(self) -> bool:
+        """
+        Regenerate the sitemap and create robots.txt if it is not present.
+        :return: True if the sitemap was saved.
+        """
+        pages = {Strings.index + Strings.extension_html: 0, Strings.birds + Strings.extension_html: 0}
+        for name, article in self._loader.get_articles().items():
+            pages[name] = article.get_computable_date()
+        for name in self._loader.get_menus():
+            pages[name] = 0
+        now = pendulum.now().float_timestamp
+        for name in self._report['saved']:
+            pages[name] = now
+        robots_txt = os.path.join(self._directory, Strings.robots_file)
+        try:
+            self._report['sitemap'] = SitemapGenerator(pages, self._directory).create_sitemap()
+            if not os.path.exists(robots_txt):
+                with open(robots_txt, 'w', encoding='utf-8') as file:
+                    file.write(f'{Strings.sitemap_keyword} {self._config_manager.get_url()}/{Strings.sitemap_file}')
+        except OSError as e:
+            self._report['failed'][Strings.sitemap_file] = str(e)
+            return False
+        return True
+
+    def get_report(self) -> Dict[str, object]:
+        """
+        Return the report of the last run. Performance statistics are included when they are being collected.
+        :return: Dictionary with test results, saved files and failures.
+        """
+        if Instrumentation.is_enabled():
+            self._report['statistics'] = Instrumentation.get_instance().get_stats()
+        return self._report
+
+
+def main() -> int:
+    """
+    Parse arguments and run the command line interface.
+    :return: Exit code, 0 if everything passed, 1 if a test or save failed, 2 if the directory could not be loaded.
+    """
+    parser = argparse.ArgumentParser(description='Test, convert and save a whitebear website without the GUI.')
+    parser.add_argument('directory', help='whitebear web root directory')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='number of SEO test threads')
+    parser.add_argument('--online', action='store_true', help='test links and videos online')
+    parser.add_argument('--test-only', action='store_true', help='only run the SEO test, do not save anything')
+    parser.add_argument('--report', help='json report file, the report is printed if not set')
+    parser.add_argument('--statistics', action='store_true', help='add performance statistics to the report')
+    args = parser.parse_args()
+    Instrumentation.get_instance().set_enabled(args.statistics)
+
+    cli = WhitebearCli(args.directory, args.jobs, args.online)
+    try:
+        cli.load()
+    except (AccessException, IndexException, UnrecognizedFileException, WrongFormatException,
+            FileNotFoundError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    result = cli.test()
+    if not args.test_only:
+        result = cli.save() and result
+        result = cli.save_sitemap() and result
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as report:
+            json.dump(cli.get_report(), report, indent=2, ensure_ascii=False)
+    else:
+        json.dump(cli.get_report(), sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 0 if result else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,11 +12,18 @@ OnInit must be overridden here.
 # TODO look at cookies from whitebear using requests headers, beware of redirect, set cookie warning if we use them?
 """
 
-import wx
-import wx.adv
+import sys
 
-from Constants.Constants import Strings
-from Gui.Frames.MainFrame import MainFrame
+from Tools.StartupProfiler import StartupProfiler
+
+if __name__ == "__main__" and StartupProfiler.requested(sys.argv):
+    # Start before wx is imported, it is the largest import of the editor.
+    StartupProfiler.get_instance().start()
+
+import wx  # noqa: E402
+import wx.adv  # noqa: E402
+
+from Constants.Constants import Strings  # noqa: E402
 
 
 class WhitebearEditor(wx.App):
@@ -25,17 +32,34 @@ class WhitebearEditor(wx.App):
     """
 
     def __init__(self, redirect, filename):
-        wx.App.__init__(self, redirect, filename)
         self._frame = None
+        self._profiler: StartupProfiler = StartupProfiler.get_instance()
+        wx.App.__init__(self, redirect, filename)
 
     def OnInit(self):
+        # Imported here so that the startup profiler also measures the gui modules.
+        from Gui.Frames.MainFrame import MainFrame
+        self._profiler.mark('gui modules imported')
         # Frame with None parent is a top level frame. This frame must be created after the App object is created.
         self._frame = MainFrame()
+        self._profiler.mark('main frame created')
         # Optional set the frame as the main one, the main window is the default parent for dialogs without parent set.
         self.SetTopWindow(self._frame)
         self._frame.Show()
+        self._profiler.mark('main frame shown')
+        if self._profiler.is_running():
+            wx.CallAfter(self._print_startup_profile)
         return True
 
+    def _print_startup_profile(self) -> None:
+        """
+        Print the startup profile once the main loop processes its first events.
+        :return: None
+        """
+        self._profiler.mark('first main loop iteration')
+        self._profiler.stop()
+        print(self._profiler.get_report())
+
     def OnExit(self):
         print('_Done_')
         return True